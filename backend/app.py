@@ -1,28 +1,46 @@
 from flask import Flask
-from flask_cors import CORS
 from config.config import Config
-from models import db
-from routes.task_routes import task_bp
-from utils.error_handlers import register_error_handlers
 import logging
 from logging.handlers import RotatingFileHandler
 import os
 
 def create_app(config_class=Config):
+    """Build the app without touching the database.
+    
+    Schema creation and sample data are `flask init-db [--seed]`; set
+    DB_CREATE_ON_STARTUP / SEED_SAMPLE_DATA to do them here instead
+    (development only: every worker would repeat them on boot). Imports
+    live here so importing this module (gunicorn master, CLI) stays cheap.
+    """
+    from flask_cors import CORS
+    from models import db
+    from routes.task_routes import task_bp
+    from utils.error_handlers import register_error_handlers
+    from utils.commands import register_commands
+    from utils.cache import init_task_list_cache
+    from utils.change_feed import init_change_feed
+    from utils.profiling import init_profiling
+    from utils.metrics import configure_pool, init_metrics
+    from utils.replicas import STICKY_HEADER, configure_replica_binds, init_read_replicas
+    
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    configure_pool(app)
+    replica_keys = configure_replica_binds(app)
     db.init_app(app)
+    init_read_replicas(app, replica_keys)
+    init_task_list_cache(app)
+    init_change_feed(app)
     
-    CORS(app, origins=[
-        "http://localhost:5173",
-        "http://localhost:3000",
-        "https://finstack-assignment-pi.vercel.app"
-    ])
+    CORS(app, origins=app.config['CORS_ORIGINS'], expose_headers=[STICKY_HEADER])
     
     app.register_blueprint(task_bp, url_prefix='/api')
     
     register_error_handlers(app)
+    register_commands(app)
+    init_profiling(app)
+    init_metrics(app)
     if not app.debug and not app.testing:
         if not os.path.exists('logs'):
             os.mkdir('logs')
@@ -35,13 +53,10 @@ def create_app(config_class=Config):
         app.logger.setLevel(logging.INFO)
         app.logger.info('Task Management API startup')
     
-    with app.app_context():
-        db.create_all()
-        
-        from models.task import Task
-        if Task.query.count() == 0:
-            from utils.sample_data import create_sample_data
-            create_sample_data()
+    if app.config['DB_CREATE_ON_STARTUP'] or app.config['SEED_SAMPLE_DATA']:
+        from utils.database import init_database
+        with app.app_context():
+            init_database(seed=app.config['SEED_SAMPLE_DATA'])
     
     return app
 
@@ -0,0 +1,319 @@
+"""ASGI entry point: async read routes in front of the Flask app.
+
+GET /api/tasks (offset pagination), GET /api/tasks/<id> and GET /api/tasks/stats
+run as coroutines on an async SQLAlchemy engine (aiomysql, or aiosqlite for
+SQLite), so a worker is not blocked while MySQL answers. Every other request,
+and listing features the async path does not implement (cursor pagination,
+include_archived, cached/estimated counts), is passed to the WSGI Flask app.
+
+The async routes share the Flask app's CORS origins, metrics, Server-Timing
+and replica routing (including the read-your-writes window). When one of
+them fails, the request is retried by its Flask route, whose error handling
+then decides the response.
+
+Run with:
+    uvicorn --factory asgi:create_asgi_app --workers 4
+"""
+import logging
+import re
+from datetime import date
+
+from config.config import Config
+from sqlalchemy import func, select
+from utils.metrics import record_rows, request_finished, request_handed_off, request_started
+from utils.profiling import async_request_profile, finish_profile, new_profile
+from utils.replicas import STICKY_HEADER, reads_from_primary, watch_replica
+
+try:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.middleware.wsgi import WSGIMiddleware
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse, Response
+except ImportError:  # pragma: no cover - the ASGI stack is optional
+    create_async_engine = None
+
+logger = logging.getLogger(__name__)
+
+# Sync driver -> async driver for the same database
+ASYNC_DRIVERS = {
+    'mysql+pymysql': 'mysql+aiomysql',
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+TASK_PATH = re.compile(r'^/api/tasks/(\d+)$')
+
+# Flask URL rule (metrics label) and endpoint (logs) of each async route
+LIST_ROUTE = ('/api/tasks', 'tasks.get_tasks')
+TASK_ROUTE = ('/api/tasks/<int:task_id>', 'tasks.get_task')
+STATS_ROUTE = ('/api/tasks/stats', 'tasks.get_task_stats')
+
+def async_database_uri(uri):
+    """Async driver URI for a sync SQLAlchemy URI"""
+    scheme, separator, rest = uri.partition('://')
+    return ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+def int_arg(args, name, default):
+    """Integer query argument, falling back to default like request.args.get(type=int)"""
+    try:
+        return int(args[name])
+    except (KeyError, ValueError):
+        return default
+
+def async_engine_options(config):
+    """Pool options for the async engine (the sync connect_args are PyMySQL specific)"""
+    options = {key: value for key, value in config['SQLALCHEMY_ENGINE_OPTIONS'].items()
+               if key in ('pool_recycle', 'pool_pre_ping', 'pool_timeout')}
+    if not config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        # One event loop serves many concurrent requests, so it needs more connections than a thread
+        options.update(pool_size=config['ASYNC_POOL_SIZE'], max_overflow=config['ASYNC_MAX_OVERFLOW'])
+    return options
+
+class AsyncTaskReads:
+    """ASGI app serving the hot read routes asynchronously and delegating the rest to Flask"""
+
+    def __init__(self, flask_app):
+        from routes import task_routes
+        from utils.serializers import get_dumps
+
+        self.flask_app = flask_app
+        self.wsgi = WSGIMiddleware(flask_app)
+        self.routes = task_routes
+        self.dumps = get_dumps(flask_app.config['JSON_SERIALIZER'])
+        config = flask_app.config
+        options = async_engine_options(config)
+        uri = config.get('ASYNC_DATABASE_URI') or async_database_uri(config['SQLALCHEMY_DATABASE_URI'])
+        self.engine = create_async_engine(uri, **options)
+        self.sessions = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        # Async engines for the replicas the Flask app routes to, sharing its router
+        self.router = flask_app.extensions.get('replica_router')
+        self.replica_sessions = {}
+        for key in self.router.keys if self.router is not None else ():
+            engine = create_async_engine(async_database_uri(config['SQLALCHEMY_BINDS'][key]), **options)
+            watch_replica(engine.sync_engine, self.router, key)
+            self.replica_sessions[key] = async_sessionmaker(engine, expire_on_commit=False)
+
+    def match(self, scope):
+        """(route, handler, arguments) for a request the async path serves, else None"""
+        if scope['type'] != 'http' or scope['method'] != 'GET':
+            return None
+        path = scope['path']
+        if path == '/api/tasks':
+            request = Request(scope)
+            return (LIST_ROUTE, self.list_tasks, (request,)) if self.async_listing(request.query_params) else None
+        if path == '/api/tasks/stats':
+            return STATS_ROUTE, self.task_stats, (Request(scope),)
+        task_path = TASK_PATH.match(path)
+        if task_path:
+            return TASK_ROUTE, self.get_task, (Request(scope), int(task_path.group(1)))
+        return None
+
+    async def lifespan(self, receive, send):
+        """Answer the server's startup and shutdown events; WSGIMiddleware only speaks HTTP"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                for sessions in self.replica_sessions.values():
+                    await sessions.kw['bind'].dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        matched = self.match(scope)
+        if matched is None:
+            await self.wsgi(scope, receive, send)
+            return
+        (rule, endpoint), handler, args = matched
+        config = self.flask_app.config
+
+        started = request_started() if config['METRICS_ENABLED'] else None
+        profile = new_profile(endpoint, 'GET', scope['path'], config['SLOW_QUERY_MS']) \
+            if config['PROFILING_ENABLED'] else None
+        try:
+            with async_request_profile(profile):
+                response = await handler(*args)
+        except Exception as e:
+            logger.error(f"Error in async read {scope['path']}, serving it from Flask: {str(e)}")
+            response = None
+
+        if response is None:
+            # Flask counts and profiles the request itself
+            if started is not None:
+                request_handed_off()
+            await self.wsgi(scope, receive, send)
+            return
+        if profile is not None:
+            for value in finish_profile(profile, response.status_code):
+                response.headers.append('Server-Timing', value)
+        await response(scope, receive, send)
+        if started is not None:
+            request_finished(started, rule, 'GET', response.status_code)
+
+    def session_for(self, request):
+        """Async counterpart of @read_only: a replica session unless the client wrote recently"""
+        if self.router is not None and \
+                not reads_from_primary(request.headers, self.flask_app.config['REPLICA_STICKY_SECONDS']):
+            key = self.router.choose()
+            if key is not None:
+                return self.replica_sessions[key]()
+        return self.sessions()
+
+    def json(self, payload, status=200, headers=None):
+        return Response(self.dumps(payload), status_code=status, headers=headers, media_type='application/json')
+
+    async def conditions(self, session, request, *parts):
+        """Async counterpart of check_task_conditions: (304 response or None, headers)"""
+        from models.task_counter import VERSION_QUERY, task_version
+        from utils.conditional import conditions_match, task_etag, validator_headers
+        from werkzeug.http import parse_date, parse_etags
+
+        version, last_modified = task_version((await session.execute(VERSION_QUERY)).all())
+        etag = task_etag(version, parts)
+        headers = validator_headers(etag, last_modified)
+        if_none_match = parse_etags(request.headers.get('if-none-match'))
+        if_modified_since = parse_date(request.headers.get('if-modified-since'))
+        if conditions_match(if_none_match, if_modified_since, etag, last_modified):
+            return Response(status_code=304, headers=headers), headers
+        return None, headers
+
+    def async_listing(self, args):
+        """Whether the async path implements the listing these arguments ask for"""
+        return not (args.get('cursor') or args.get('pagination') == 'cursor' or
+                    args.get('include_archived', 'false').lower() == 'true' or
+                    args.get('count', self.flask_app.config['TASK_COUNT_STRATEGY']) not in ('exact', 'none'))
+
+    async def list_tasks(self, request):
+        from models.task import Task
+        from utils.pagination import offset_pagination
+
+        args = request.query_params
+        routes = self.routes
+
+        with self.flask_app.app_context():
+            # Validation and statement building mirror get_tasks
+            page = max(int_arg(args, 'page', 1), 1)
+            per_page = max(min(int_arg(args, 'per_page', 20), 100), 1)
+            count = args.get('count', self.flask_app.config['TASK_COUNT_STRATEGY'])
+            include_total = args.get('include_total', 'false').lower() == 'true'
+
+            filters, filter_error = routes.parse_task_filters(args)
+            if filter_error:
+                return JSONResponse({'error': filter_error}, status_code=400)
+            sort_by = args.get('sort_by', 'relevance' if filters.get('q') else 'date')
+            sort_order = args.get('sort_order', 'desc').lower()
+            if sort_by == 'relevance' and not filters.get('q'):
+                return JSONResponse({'error': 'Sorting by relevance requires a search query (q)'}, status_code=400)
+            if sort_by not in routes.VALID_SORT_FIELDS and sort_by != 'relevance':
+                return JSONResponse({'error': f'Invalid sort field. Valid fields: {routes.VALID_SORT_FIELDS}'},
+                                    status_code=400)
+            if sort_order not in routes.VALID_SORT_ORDERS:
+                return JSONResponse({'error': f'Invalid sort order. Valid orders: {routes.VALID_SORT_ORDERS}'},
+                                    status_code=400)
+            columns, fields, fields_error = routes.parse_task_fields(args, sort_by)
+            if fields_error:
+                return JSONResponse({'error': fields_error}, status_code=400)
+
+            stmt = Task.apply_sort(Task.apply_filters(select(*columns), filters), sort_by, sort_order, filters)
+            offset = (page - 1) * per_page
+            page_stmt = stmt.limit(per_page + 1).offset(offset)
+            count_stmt = Task.apply_filters(select(func.count(Task.id)), filters)
+            list_cache = self.flask_app.extensions['task_list_cache']
+
+        async with self.session_for(request) as session:
+            # Same ETag parts as get_tasks, so validators and cache entries are shared
+            not_modified, validators = await self.conditions(
+                session, request, 'tasks', sorted(filters.items()), sort_by, sort_order, page, per_page,
+                fields, None, False, include_total, False, count
+            )
+            if not_modified is not None:
+                return not_modified
+            body = list_cache.get(validators['ETag'])
+            if body is not None:
+                return Response(body, headers=validators, media_type='application/json')
+
+            rows = (await session.execute(page_stmt)).all()
+            has_next = len(rows) > per_page
+            items = rows[:per_page]
+            if not has_next and (items or page == 1):
+                total = offset + len(items)
+            elif count == 'exact':
+                total = (await session.execute(count_stmt)).scalar()
+            else:
+                total = None
+
+        pagination_data = offset_pagination(page, per_page, total, has_next)
+        pagination_data['count'] = count
+        body = self.dumps({
+            'tasks': [dict(zip(fields, row)) for row in items],
+            'pagination': pagination_data,
+            'filters_applied': filters,
+            'sort': {
+                'sort_by': sort_by,
+                'sort_order': sort_order
+            }
+        })
+        list_cache.set(validators['ETag'], body, self.flask_app.config['TASK_LIST_CACHE_TTL'])
+        record_rows(len(items), LIST_ROUTE[0])
+        return Response(body, headers=validators, media_type='application/json')
+
+    async def get_task(self, request, task_id):
+        from models.task import Task
+
+        with self.flask_app.app_context():
+            columns, fields, fields_error = self.routes.parse_task_fields(request.query_params)
+        if fields_error:
+            return JSONResponse({'error': fields_error}, status_code=400)
+
+        async with self.session_for(request) as session:
+            not_modified, validators = await self.conditions(session, request, 'task', task_id, fields)
+            if not_modified is not None:
+                return not_modified
+            row = (await session.execute(
+                select(*columns).where(Task.id == task_id)
+            )).first()
+        if row is None:
+            return JSONResponse({'error': 'Task not found'}, status_code=404)
+        record_rows(1, TASK_ROUTE[0])
+        return self.json(dict(zip(fields, row)), headers=validators)
+
+    async def task_stats(self, request):
+        from models.task_counter import COUNTER_STATS_QUERY, counter_stats_payload
+        from utils.cache import stats_cache
+
+        today = date.today()
+        async with self.session_for(request) as session:
+            not_modified, validators = await self.conditions(session, request, 'stats', today)
+            if not_modified is not None:
+                return not_modified
+            stats = stats_cache.get(validators['ETag'])
+            if stats is None:
+                counters = (await session.execute(COUNTER_STATS_QUERY)).all()
+                if not counters:
+                    # Empty counters may need the one-off rebuild, which the sync route handles
+                    return None
+                stats = counter_stats_payload(counters, today)
+                stats_cache.set(validators['ETag'], stats, self.flask_app.config['STATS_CACHE_TTL'])
+        return self.json(stats, headers=validators)
+
+def create_asgi_app(config_class=Config):
+    """Create the Flask app and wrap it with the async read routes"""
+    if create_async_engine is None:
+        raise RuntimeError('ASGI mode needs starlette and an async driver (aiomysql or aiosqlite)')
+    from app import create_app
+    flask_app = create_app(config_class)
+    # Same policy as flask_cors in create_app; it also answers preflights for the Flask routes
+    return CORSMiddleware(
+        AsyncTaskReads(flask_app),
+        allow_origins=flask_app.config['CORS_ORIGINS'],
+        allow_methods=['*'],
+        allow_headers=['*'],
+        expose_headers=[STICKY_HEADER]
+    )
\ No newline at end of file
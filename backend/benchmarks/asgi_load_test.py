@@ -0,0 +1,130 @@
+"""Compare req/s and latency of the sync (gunicorn gthread) and async (uvicorn) servers.
+
+Both servers run against the benchmark database with the task list cache
+disabled, and are hit by ``--clients`` concurrent HTTP clients issuing listing,
+single-task and stats requests. Needs gunicorn, uvicorn, starlette, httpx and
+an async driver (aiosqlite or aiomysql).
+
+Usage (from backend/):
+    python benchmarks/asgi_load_test.py --clients 500 --requests 20
+    BENCHMARK_DATABASE_URI=mysql+pymysql://... python benchmarks/asgi_load_test.py
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from common import BACKEND_DIR, BenchmarkConfig, create_benchmark_app, populate_tasks
+
+BENCHMARK_DIR = os.path.join(BACKEND_DIR, 'benchmarks')
+
+class LoadTestConfig(BenchmarkConfig):
+    # main() created the schema; server workers boot lazily
+    DB_CREATE_ON_STARTUP = False
+    TASK_LIST_CACHE_BACKEND = 'none'
+    STATS_CACHE_TTL = 0
+
+def create_sync_app():
+    """gunicorn entry point"""
+    from app import create_app
+    return create_app(LoadTestConfig)
+
+def create_async_app():
+    """uvicorn --factory entry point"""
+    from asgi import create_asgi_app
+    return create_asgi_app(LoadTestConfig)
+
+def server_command(mode, port, workers, threads):
+    if mode == 'sync':
+        return [sys.executable, '-m', 'gunicorn', '--chdir', BENCHMARK_DIR, '-w', str(workers),
+                '--worker-class', 'gthread', '--threads', str(threads), '-b', f'127.0.0.1:{port}',
+                'asgi_load_test:create_sync_app()']
+    return [sys.executable, '-m', 'uvicorn', '--factory', '--app-dir', BENCHMARK_DIR, '--workers', str(workers),
+            '--port', str(port), '--log-level', 'warning', 'asgi_load_test:create_async_app']
+
+async def wait_until_ready(client, base_url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get(f'{base_url}/api/tasks/stats')).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise RuntimeError(f'Server at {base_url} did not start')
+
+async def run_clients(base_url, clients, requests_per_client, max_id):
+    import httpx
+
+    latencies, failures = [], 0
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        await wait_until_ready(client, base_url)
+
+        async def one_client(seed):
+            nonlocal failures
+            rng = random.Random(seed)
+            for _ in range(requests_per_client):
+                roll = rng.random()
+                if roll < 0.7:
+                    path = f"/api/tasks?page={rng.randrange(1, 20)}&status={rng.choice(('Open', 'Closed'))}"
+                elif roll < 0.9:
+                    path = f'/api/tasks/{rng.randrange(1, max_id + 1)}'
+                else:
+                    path = '/api/tasks/stats'
+                started = time.perf_counter()
+                try:
+                    response = await client.get(base_url + path)
+                    if response.status_code not in (200, 404):
+                        failures += 1
+                except httpx.HTTPError:
+                    failures += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_client(seed) for seed in range(clients)))
+        elapsed = time.perf_counter() - started
+    return latencies, failures, elapsed
+
+def report(mode, latencies, failures, elapsed):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))]
+    print(f'{mode:>5}: {len(ordered) / elapsed:8.0f} req/s  median {statistics.median(ordered):8.2f} ms  '
+          f'p99 {p99:8.2f} ms  failures {failures}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=20, help='Requests per client')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8, help='gthread threads per sync worker')
+    parser.add_argument('--rows', type=int, default=20000, help='Tasks to seed when the table is empty')
+    parser.add_argument('--mode', choices=('both', 'sync', 'async'), default='both')
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    with app.app_context():
+        from models import db
+        from models.task import Task
+        if db.session.query(Task.id).first() is None:
+            populate_tasks(args.rows)
+        max_id = db.session.query(db.func.max(Task.id)).scalar()
+
+    modes = ('sync', 'async') if args.mode == 'both' else (args.mode,)
+    for port, mode in enumerate(modes, start=8101):
+        server = subprocess.Popen(server_command(mode, port, args.workers, args.threads), cwd=BACKEND_DIR)
+        try:
+            latencies, failures, elapsed = asyncio.run(
+                run_clients(f'http://127.0.0.1:{port}', args.clients, args.requests, max_id)
+            )
+            report(mode, latencies, failures, elapsed)
+        finally:
+            server.terminate()
+            server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against ``BENCHMARK_DATABASE_URI`` (defaults to a local SQLite
+file) so they never touch the configured application database.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from config.config import Config
+
+DEFAULT_DATABASE_URI = 'sqlite:///' + os.path.join(BACKEND_DIR, 'benchmarks', 'benchmark.db')
+
+class BenchmarkConfig(Config):
+    TESTING = True
+    # Benchmarks create their own database; they seed it with populate_tasks
+    DB_CREATE_ON_STARTUP = True
+    SQLALCHEMY_DATABASE_URI = os.environ.get('BENCHMARK_DATABASE_URI') or DEFAULT_DATABASE_URI
+    SQLALCHEMY_ENGINE_OPTIONS = (
+        Config.SQLALCHEMY_ENGINE_OPTIONS
+        if SQLALCHEMY_DATABASE_URI.startswith('mysql') else {}
+    )
+
+def create_benchmark_app():
+    """Create the app bound to the benchmark database"""
+    from app import create_app
+    return create_app(BenchmarkConfig)
+
+ENTITY_NAMES = [f'{prefix} {suffix}' for prefix in ('ABC', 'DEF', 'GHI', 'JKL', 'PQR', 'STU', 'XYZ', 'Acme', 'Globex', 'Initech')
+                for suffix in ('Private Limited', 'Holdings', 'Industries', 'Partners', 'Ventures')]
+CONTACTS = [f'{first} {last}' for first in ('Sanna', 'Frodo', 'Sarah', 'Bilbo', 'Ned', 'Jon', 'Arya', 'Peregrin')
+            for last in ('Stark', 'Baggins', 'Connor', 'Took', 'Snow', 'Lannister')]
+NOTES = ['Quarterly review meeting', 'Send project proposal and timeline', 'Follow-up on invoice',
+         'Discuss renewal terms', 'Lorem ipsum dolor sit amet, consectetur adipisc...', None]
+
+def populate_tasks(rows, batch_size=10000, seed=42):
+    """Insert ``rows`` random tasks via executemany batches"""
+    from models import db
+    from models.task import Task
+
+    rng = random.Random(seed)
+    start = date(2019, 1, 1)
+    now = datetime.utcnow()
+    table = Task.__table__
+    inserted = 0
+    while inserted < rows:
+        count = min(batch_size, rows - inserted)
+        batch = []
+        for _ in range(count):
+            task_date = start + timedelta(days=rng.randrange(2000))
+            batch.append({
+                'date': task_date,
+                'entity_name': rng.choice(ENTITY_NAMES),
+                'task_type': rng.choice(('Meeting', 'Call', 'Video Call', 'Email', 'Follow-up')),
+                'time': f'{rng.randrange(24):02d}:{rng.choice((0, 15, 30, 45)):02d}',
+                'contact_person': rng.choice(CONTACTS),
+                'note': rng.choice(NOTES),
+                'status': rng.choice(('Open', 'Closed', 'In Progress', 'Cancelled')),
+                'priority': rng.choice(('Low', 'Medium', 'High', 'Urgent')),
+                'created_at': now,
+                'updated_at': now,
+                'due_date': task_date + timedelta(days=rng.randrange(30)),
+            })
+        db.session.execute(table.insert(), batch)
+        db.session.commit()
+        inserted += count
+    return inserted
+
+def measure(fn, repeat=5):
+    """Run ``fn`` ``repeat`` times and return the timings in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def summarize(timings):
+    """Format median / p95 / max for a list of millisecond timings"""
+    ordered = sorted(timings)
+    return f'median {statistics.median(ordered):8.2f} ms  p95 {percentile(ordered, 0.95):8.2f} ms  max {ordered[-1]:8.2f} ms'
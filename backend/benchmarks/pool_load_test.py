@@ -0,0 +1,102 @@
+"""Concurrent listing load against pool settings derived from the deployment layout.
+
+Simulates one gunicorn worker with ``--threads`` request threads, sized as if
+``--workers`` such processes shared ``--max-connections``. The task list cache
+is disabled so every request checks out a connection. Exits non-zero if any
+request failed or a checkout timed out.
+
+Usage (from backend/):
+    python benchmarks/pool_load_test.py --threads 16 --workers 4 --max-connections 40
+    python benchmarks/pool_load_test.py --threads 16 --pool-mode null
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from common import BenchmarkConfig, percentile, populate_tasks
+from config.config import pool_engine_options
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16, help='Concurrent request threads (gunicorn --threads)')
+    parser.add_argument('--workers', type=int, default=4, help='Declared worker processes sharing the budget')
+    parser.add_argument('--max-connections', type=int, default=40)
+    parser.add_argument('--reserved', type=int, default=2)
+    parser.add_argument('--pool-mode', choices=('queue', 'null'), default='queue')
+    parser.add_argument('--pool-timeout', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=100, help='Requests per thread')
+    parser.add_argument('--rows', type=int, default=5000, help='Tasks to seed when the table is empty')
+    args = parser.parse_args()
+
+    class LoadTestConfig(BenchmarkConfig):
+        TASK_LIST_CACHE_BACKEND = 'none'
+        GUNICORN_THREADS = args.threads
+        SQLALCHEMY_ENGINE_OPTIONS = pool_engine_options(
+            BenchmarkConfig.SQLALCHEMY_ENGINE_OPTIONS,
+            mode=args.pool_mode,
+            workers=args.workers,
+            threads=args.threads,
+            max_connections=args.max_connections,
+            reserved=args.reserved,
+            timeout=args.pool_timeout
+        )
+
+    from app import create_app
+    from utils.metrics import metrics
+    app = create_app(LoadTestConfig)
+    with app.app_context():
+        from models import db
+        from models.task import Task
+        if db.session.query(Task.id).first() is None:
+            populate_tasks(args.rows)
+        pool_options = {key: value for key, value in app.config['SQLALCHEMY_ENGINE_OPTIONS'].items()
+                        if key in ('pool_size', 'max_overflow', 'pool_timeout', 'poolclass')}
+
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(args.threads)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = app.test_client()
+        local_latencies, local_failures = [], []
+        barrier.wait()
+        for _ in range(args.requests):
+            query = f"page={rng.randrange(1, 20)}&per_page=20&status={rng.choice(('Open', 'Closed'))}"
+            started = time.perf_counter()
+            response = client.get(f'/api/tasks?{query}')
+            local_latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                local_failures.append(response.status_code)
+        with lock:
+            latencies.extend(local_latencies)
+            failures.extend(local_failures)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    counters, histograms = metrics.collect()
+    wait_counts, wait_sum = histograms.get(('db_pool_wait_seconds', ()), ([0], 0.0))
+    timeouts = counters.get(('db_pool_timeouts_total', ()), 0)
+    ordered = sorted(latencies)
+
+    print(f'Pool: {pool_options}')
+    print(f'{len(latencies)} requests from {args.threads} threads in {elapsed:.2f}s '
+          f'({len(latencies) / elapsed:.0f} req/s)')
+    print(f'  latency median {statistics.median(ordered):.2f} ms  p95 {percentile(ordered, 0.95):.2f} ms  '
+          f'p99 {percentile(ordered, 0.99):.2f} ms  max {ordered[-1]:.2f} ms')
+    if sum(wait_counts):
+        print(f'  pool wait mean {wait_sum / sum(wait_counts) * 1000:.2f} ms over {sum(wait_counts)} checkouts')
+    print(f'  failures {len(failures)}  pool timeouts {timeouts}')
+    raise SystemExit(1 if failures or timeouts else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Compare substring scans with the search index.
+
+Usage (from backend/):
+    python benchmarks/search_benchmark.py --rows 1000000
+
+Set BENCHMARK_DATABASE_URI to a MySQL URL to measure the FULLTEXT index.
+Other databases have no search index, so both timings there are scans.
+"""
+import argparse
+
+from common import create_benchmark_app, measure, populate_tasks, summarize
+
+QUERIES = ['stark', 'arya snow', 'globex ventures', 'renewal']
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--reuse', action='store_true', help='Reuse rows already in the benchmark database')
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    with app.app_context():
+        from models import db
+        from models.task import Task
+        from models.search import rebuild_search_index, search_clause
+
+        if not args.reuse:
+            populate_tasks(args.rows)
+        rebuild_search_index()
+        print(f'{db.engine.dialect.name}: {Task.query.count()} tasks')
+
+        for text in QUERIES:
+            pattern = f'%{text}%'
+            scan = Task.query.filter(db.or_(Task.entity_name.ilike(pattern),
+                                            Task.contact_person.ilike(pattern),
+                                            Task.note.ilike(pattern)))
+            condition, _ = search_clause(text)
+            indexed = Task.apply_sort(Task.query.filter(condition), 'relevance', 'desc', {'q': text})
+
+            # Time what GET /api/tasks pays for a page: the total count plus the first page
+            print(f'q={text!r}')
+            print(f'  scan  {summarize(measure(lambda: (scan.count(), scan.limit(20).all()), args.repeat))}')
+            print(f'  index {summarize(measure(lambda: (indexed.count(), indexed.limit(20).all()), args.repeat))}')
+
+if __name__ == '__main__':
+    main()
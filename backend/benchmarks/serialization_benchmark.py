@@ -0,0 +1,40 @@
+"""Microbenchmark: ORM objects + to_dict + jsonify vs Core rows + serializer.
+
+Usage (from backend/):
+    python benchmarks/serialization_benchmark.py --per-page 100
+"""
+import argparse
+
+from common import create_benchmark_app, measure, populate_tasks, summarize
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    with app.test_request_context():
+        from flask import jsonify
+        from models.task import Task
+        from routes.task_routes import TASK_COLUMNS, TASK_FIELDS
+        from utils.serializers import SERIALIZERS, rows_to_dicts
+
+        if Task.query.count() < args.per_page:
+            populate_tasks(args.per_page)
+
+        objects = Task.query.order_by(Task.id).limit(args.per_page).all()
+        rows = Task.get_filtered_tasks(per_page=args.per_page, sort_by='id', columns=TASK_COLUMNS).items
+
+        print(f'{args.per_page}-row page, encode only')
+        print(f'  to_dict + jsonify     {summarize(measure(lambda: jsonify([task.to_dict() for task in objects]).get_data(), args.repeat))}')
+        for name, dumps in SERIALIZERS.items():
+            print(f'  rows + {name:<15}{summarize(measure(lambda: dumps(rows_to_dicts(rows, TASK_FIELDS)), args.repeat))}')
+
+        print(f'{args.per_page}-row page, query + encode')
+        print(f'  ORM + to_dict + jsonify {summarize(measure(lambda: jsonify([t.to_dict() for t in Task.get_filtered_tasks(per_page=args.per_page, sort_by="id").items]).get_data(), args.repeat // 4))}')
+        dumps = SERIALIZERS.get('orjson', SERIALIZERS['stdlib'])
+        print(f'  Core rows + serializer  {summarize(measure(lambda: dumps(rows_to_dicts(Task.get_filtered_tasks(per_page=args.per_page, sort_by="id", columns=TASK_COLUMNS).items, TASK_FIELDS)), args.repeat // 4))}')
+
+if __name__ == '__main__':
+    main()
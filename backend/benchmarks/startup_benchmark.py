@@ -0,0 +1,90 @@
+"""Worker time-to-first-request: the legacy boot sequence vs lazy startup.
+
+Each run starts a fresh interpreter (as a gunicorn worker would), imports
+the app, calls ``create_app`` and serves one listing request. ``legacy``
+replays what every worker used to do on boot, ``db.create_all()`` plus a
+full-table ``COUNT``; ``lazy`` is the current startup, which leaves the
+schema to ``flask init-db``. Seed more rows to see the COUNT grow.
+
+Usage (from backend/):
+    python benchmarks/startup_benchmark.py --runs 10 --rows 200000
+    BENCHMARK_DATABASE_URI=mysql+pymysql://... python benchmarks/startup_benchmark.py
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Taken before any application import so the child can report its import time
+STARTED = time.perf_counter()
+
+from common import BACKEND_DIR, create_benchmark_app, populate_tasks
+
+def child(mode):
+    """Boot one worker and print its phase timings as JSON"""
+    from app import create_app
+    from common import BenchmarkConfig
+    imported = time.perf_counter()
+
+    class StartupConfig(BenchmarkConfig):
+        DB_CREATE_ON_STARTUP = False
+
+    app = create_app(StartupConfig)
+    if mode == 'legacy':
+        from models import db
+        from models.task import Task
+        with app.app_context():
+            db.create_all(bind_key=None)
+            Task.query.count()
+    created = time.perf_counter()
+
+    response = app.test_client().get('/api/tasks?per_page=20')
+    served = time.perf_counter()
+    if response.status_code != 200:
+        raise SystemExit(f'First request failed with {response.status_code}')
+    print(json.dumps({
+        'import_ms': (imported - STARTED) * 1000,
+        'create_app_ms': (created - imported) * 1000,
+        'first_request_ms': (served - created) * 1000,
+    }))
+
+def run(mode):
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, __file__, '--child', mode], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    # Includes interpreter start-up, which the in-process phases cannot see
+    timings['total_ms'] = (time.perf_counter() - started) * 1000
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Worker boots per mode')
+    parser.add_argument('--rows', type=int, default=100000, help='Tasks to seed when the table is empty')
+    parser.add_argument('--child', choices=('legacy', 'lazy'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    app = create_benchmark_app()
+    with app.app_context():
+        from models import db
+        from models.task import Task
+        if db.session.query(Task.id).first() is None:
+            populate_tasks(args.rows)
+        rows = db.session.query(Task.id).count()
+
+    print(f'{rows} tasks, {args.runs} worker boots per mode (median ms)')
+    print(f"{'mode':>7} {'import':>9} {'create_app':>11} {'1st request':>12} {'total':>9}")
+    for mode in ('legacy', 'lazy'):
+        results = [run(mode) for _ in range(args.runs)]
+        medians = {key: statistics.median(result[key] for result in results) for key in results[0]}
+        print(f"{mode:>7} {medians['import_ms']:9.1f} {medians['create_app_ms']:11.1f} "
+              f"{medians['first_request_ms']:12.1f} {medians['total_ms']:9.1f}")
+
+if __name__ == '__main__':
+    main()
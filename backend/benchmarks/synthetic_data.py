@@ -0,0 +1,248 @@
+"""Vectorised synthetic task generator for measuring the API at production scale.
+
+Tasks are generated in NumPy chunks with realistic skew: entity names and
+contacts follow a Zipf-like popularity curve, dates lean towards the recent
+past, old tasks are mostly closed while recent ones are mostly open, and
+times cluster around business hours. Dates are relative to today; otherwise
+the same seed always produces the same rows. Chunks are bulk-loaded with
+LOAD DATA LOCAL INFILE on MySQL (the server needs ``local_infile=ON``) and
+executemany elsewhere. Task counters are rebuilt afterwards since the load
+bypasses the ORM.
+
+Usage (from backend/):
+    python benchmarks/synthetic_data.py --rows 10000000 --reset
+    BENCHMARK_DATABASE_URI=mysql+pymysql://... python benchmarks/synthetic_data.py --rows 10000000 --reset
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from common import BenchmarkConfig
+from config.config import Config
+
+try:
+    import numpy as np
+except ImportError:  # only needed to generate data, not to benchmark it
+    np = None
+
+ENTITY_PREFIXES = ['ABC', 'DEF', 'GHI', 'JKL', 'PQR', 'STU', 'XYZ', 'Acme', 'Globex', 'Initech', 'Umbrella',
+                   'Stark', 'Wayne', 'Wonka', 'Hooli', 'Vandelay', 'Soylent', 'Cyberdyne', 'Tyrell', 'Aperture',
+                   'Oscorp', 'Gringotts', 'Dunder', 'Sterling', 'Prestige', 'Massive', 'Vehement', 'Monarch',
+                   'Nakatomi', 'Zorg', 'Duff', 'Krusty', 'Pied', 'Bluth', 'Virtucon', 'Ollivander', 'Gekko',
+                   'Rekall', 'Weyland', 'Tessier']
+ENTITY_CORES = ['Private', 'Global', 'United', 'National', 'Digital', 'Atlantic', 'Pacific', 'Northern',
+                'Southern', 'Eastern', 'Western', 'Central', 'Metro', 'Capital', 'Coastal', 'Summit', 'Pioneer',
+                'Frontier', 'Heritage', 'Liberty', 'Apex', 'Vertex', 'Quantum', 'Fusion', 'Nova']
+ENTITY_SUFFIXES = ['Limited', 'Holdings', 'Industries', 'Partners', 'Ventures', 'Group', 'Systems', 'Labs',
+                   'Solutions', 'Logistics', 'Foods', 'Energy', 'Media', 'Capital', 'Traders', 'Works', 'Networks',
+                   'Pharma', 'Motors', 'Retail']
+FIRST_NAMES = ['Sanna', 'Frodo', 'Sarah', 'Bilbo', 'Ned', 'Jon', 'Arya', 'Peregrin', 'Sansa', 'Samwise',
+               'Catelyn', 'Robb', 'Bran', 'Meriadoc', 'Tyrion', 'Jaime', 'Cersei', 'Brienne', 'Davos', 'Gandalf',
+               'Aragorn', 'Legolas', 'Gimli', 'Boromir', 'Faramir', 'Eowyn', 'Theoden', 'Galadriel', 'Elrond',
+               'Arwen', 'Ellen', 'John', 'Kyle', 'Miles', 'Dana', 'Fox', 'Walter', 'Jesse', 'Skyler', 'Hank',
+               'Marie', 'Saul', 'Kim', 'Mike', 'Gus', 'Leslie', 'Ron', 'April', 'Andy', 'Ann']
+LAST_NAMES = ['Stark', 'Baggins', 'Connor', 'Took', 'Snow', 'Lannister', 'Gamgee', 'Tully', 'Brandybuck',
+              'Tarth', 'Seaworth', 'Grey', 'Greenleaf', 'Ripley', 'Reese', 'Dyson', 'Scully', 'Mulder', 'White',
+              'Pinkman', 'Schrader', 'Goodman', 'Wexler', 'Ehrmantraut', 'Fring', 'Knope', 'Swanson', 'Ludgate',
+              'Dwyer', 'Perkins', 'Baker', 'Carter', 'Nguyen', 'Patel', 'Garcia', 'Kowalski', 'Okafor', 'Tanaka',
+              'Silva', 'Novak']
+NOTES = ['Quarterly review meeting', 'Send project proposal and timeline', 'Follow-up on invoice',
+         'Discuss renewal terms', 'Lorem ipsum dolor sit amet, consectetur adipisc...',
+         'Intro call with new stakeholder', 'Share pricing sheet', 'Demo of the reporting module',
+         'Collect signed contract', 'Escalation from support', None]
+
+TASK_TYPES = ['Meeting', 'Call', 'Video Call', 'Email', 'Follow-up']
+TASK_TYPE_WEIGHTS = [0.25, 0.3, 0.15, 0.2, 0.1]
+STATUSES = ['Open', 'In Progress', 'Closed', 'Cancelled']
+RECENT_STATUS_WEIGHTS = [0.5, 0.25, 0.2, 0.05]
+OLD_STATUS_WEIGHTS = [0.06, 0.04, 0.8, 0.1]
+PRIORITIES = ['Low', 'Medium', 'High', 'Urgent']
+PRIORITY_WEIGHTS = [0.3, 0.4, 0.2, 0.1]
+
+# Tasks dated within this many days of today are mostly still open
+RECENT_DAYS = 30
+# Share of tasks without a due date
+NO_DUE_DATE = 0.2
+
+COLUMNS = ['date', 'entity_name', 'task_type', 'time', 'contact_person', 'note', 'status', 'priority',
+           'created_at', 'updated_at', 'due_date', 'completed_at']
+
+def require_numpy():
+    if np is None:
+        raise SystemExit('The synthetic data generator needs numpy: pip install numpy')
+
+def zipf_weights(count, exponent):
+    """Popularity weights for ranks 1..count, falling off like 1 / rank ** exponent"""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+class TaskGenerator:
+    """Reproducible chunks of synthetic task columns"""
+
+    def __init__(self, seed=42, days=1825, entity_skew=1.1, contact_skew=0.9, today=None):
+        require_numpy()
+        self.rng = np.random.default_rng(seed)
+        self.days = days
+        self.today = np.datetime64(today or datetime.utcnow().date(), 'D')
+
+        # Popularity is assigned to a shuffled vocabulary so "ABC ..." is not always the top entity
+        entities = np.array([f'{prefix} {core} {suffix}' for prefix in ENTITY_PREFIXES
+                             for core in ENTITY_CORES for suffix in ENTITY_SUFFIXES], dtype=object)
+        contacts = np.array([f'{first} {last}' for first in FIRST_NAMES for last in LAST_NAMES], dtype=object)
+        self.entities = self.rng.permutation(entities)
+        self.contacts = self.rng.permutation(contacts)
+        self.entity_weights = zipf_weights(len(entities), entity_skew)
+        self.contact_weights = zipf_weights(len(contacts), contact_skew)
+        self.notes = np.array(NOTES, dtype=object)
+        self.times = np.array([f'{hour:02d}:{minute:02d}' for hour in range(24) for minute in (0, 15, 30, 45)],
+                              dtype=object)
+
+    def choice(self, values, weights, size):
+        return np.asarray(values, dtype=object)[self.rng.choice(len(values), size=size, p=weights)]
+
+    def chunk(self, size):
+        """Column arrays for ``size`` tasks (dates as datetime64, missing values as NaT/None)"""
+        rng = self.rng
+        # Recent dates are more common: exponential age, capped at the date range
+        age = np.minimum(rng.exponential(self.days / 4, size), self.days - 1).astype('int64')
+        task_date = self.today - age.astype('timedelta64[D]')
+        recent = age < RECENT_DAYS
+
+        status = np.where(recent, self.choice(STATUSES, RECENT_STATUS_WEIGHTS, size),
+                          self.choice(STATUSES, OLD_STATUS_WEIGHTS, size))
+
+        # Business hours, centred on early afternoon
+        hour = np.clip(np.rint(rng.normal(13, 2.5, size)), 7, 19).astype('int64')
+        slot = hour * 4 + rng.integers(0, 4, size)
+
+        # Created up to two weeks before the task date, then edited a few days later
+        created_at = (task_date.astype('datetime64[s]')
+                      - rng.integers(0, 14 * 86400, size).astype('timedelta64[s]'))
+        edited = rng.exponential(2 * 86400, size).astype('int64').astype('timedelta64[s]')
+        now = np.datetime64(datetime.utcnow().replace(microsecond=0), 's')
+        updated_at = np.minimum(created_at + edited, now)
+        completed_at = np.where(status == 'Closed', updated_at, np.datetime64('NaT', 's'))
+
+        due_date = task_date + rng.integers(1, 30, size).astype('timedelta64[D]')
+        due_date[rng.random(size) < NO_DUE_DATE] = np.datetime64('NaT', 'D')
+
+        return {
+            'date': task_date,
+            'entity_name': self.entities[rng.choice(len(self.entities), size=size, p=self.entity_weights)],
+            'task_type': self.choice(TASK_TYPES, TASK_TYPE_WEIGHTS, size),
+            'time': self.times[slot],
+            'contact_person': self.contacts[rng.choice(len(self.contacts), size=size, p=self.contact_weights)],
+            'note': self.notes[rng.integers(0, len(self.notes), size)],
+            'status': status,
+            'priority': self.choice(PRIORITIES, PRIORITY_WEIGHTS, size),
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'due_date': due_date,
+            'completed_at': completed_at,
+        }
+
+def as_text(values):
+    """Column values as strings in the format SQLAlchemy stores them, with None for NULL"""
+    if np.issubdtype(values.dtype, np.datetime64):
+        text = np.datetime_as_string(values)
+        if values.dtype == np.dtype('datetime64[s]'):
+            # SQLAlchemy's SQLite DATETIME format; MySQL accepts it as well
+            text = np.char.add(np.char.replace(text, 'T', ' '), '.000000')
+        text = text.astype(object)
+        text[np.isnat(values)] = None
+        return text
+    return values
+
+def chunk_rows(chunk):
+    """Row tuples for one chunk, in COLUMNS order"""
+    return list(zip(*(as_text(chunk[name]).tolist() for name in COLUMNS)))
+
+def load_executemany(connection, rows):
+    placeholder = {'qmark': '?', 'format': '%s', 'pyformat': '%s'}[connection.dialect.paramstyle]
+    connection.exec_driver_sql(
+        f"INSERT INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join([placeholder] * len(COLUMNS))})", rows
+    )
+
+def load_data_infile(connection, rows):
+    """LOAD DATA LOCAL INFILE from a temporary tab-separated file"""
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, encoding='utf-8') as handle:
+        handle.write('\n'.join('\t'.join(r'\N' if value is None else value for value in row) for row in rows))
+        path = handle.name
+    try:
+        connection.exec_driver_sql(
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE tasks CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(COLUMNS)})"
+        )
+    finally:
+        os.remove(path)
+
+def populate_synthetic(rows, seed=42, chunk_size=100000, days=1825, method='auto'):
+    """Generate and bulk-load ``rows`` tasks into the app's database, then rebuild derived tables.
+
+    Call inside an app context. Returns the number of rows loaded.
+    """
+    from models import db
+    from models.task_counter import rebuild_task_counters
+
+    generator = TaskGenerator(seed=seed, days=days)
+    dialect = db.engine.dialect.name
+    if method == 'auto':
+        method = 'load-data' if dialect == 'mysql' else 'executemany'
+    load = load_data_infile if method == 'load-data' else load_executemany
+
+    if dialect == 'sqlite':
+        # Loader only: skip fsync per commit
+        db.session.execute(db.text('PRAGMA synchronous = OFF'))
+    loaded = 0
+    started = time.perf_counter()
+    while loaded < rows:
+        size = min(chunk_size, rows - loaded)
+        load(db.session.connection(), chunk_rows(generator.chunk(size)))
+        db.session.commit()
+        loaded += size
+        elapsed = time.perf_counter() - started
+        print(f'  {loaded:>12,} rows  {loaded / elapsed:>10,.0f} rows/s', flush=True)
+
+    rebuild_task_counters()
+    return loaded
+
+def loader_engine_options(uri):
+    """Engine options for ``uri``; MySQL connections are allowed to send LOAD DATA LOCAL files"""
+    if not uri.startswith('mysql'):
+        return {}
+    return {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'connect_args': {**Config.SQLALCHEMY_ENGINE_OPTIONS.get('connect_args', {}), 'local_infile': True},
+    }
+
+class SyntheticConfig(BenchmarkConfig):
+    SQLALCHEMY_ENGINE_OPTIONS = loader_engine_options(BenchmarkConfig.SQLALCHEMY_DATABASE_URI)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=100000)
+    parser.add_argument('--days', type=int, default=1825, help='Spread of task dates back from today')
+    parser.add_argument('--method', choices=('auto', 'load-data', 'executemany'), default='auto')
+    parser.add_argument('--reset', action='store_true', help='Drop and recreate the tables first')
+    args = parser.parse_args()
+    require_numpy()
+
+    from app import create_app
+    app = create_app(SyntheticConfig)
+    with app.app_context():
+        from models import db
+        if args.reset:
+            db.drop_all(bind_key=None)
+            db.create_all(bind_key=None)
+        print(f'Loading {args.rows:,} synthetic tasks into {db.engine.url.render_as_string(hide_password=True)}')
+        started = time.perf_counter()
+        populate_synthetic(args.rows, seed=args.seed, chunk_size=args.chunk_size, days=args.days,
+                           method=args.method)
+        print(f'Done in {time.perf_counter() - started:.1f}s')
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,36 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import NullPool
 
 load_dotenv()
 
+# Options only QueuePool understands; dropped in NullPool mode
+QUEUE_POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout')
+
+def pool_engine_options(base, mode='queue', workers=1, threads=1, max_connections=20, reserved=2, timeout=10):
+    """Engine options with pool limits derived from the deployment's concurrency.
+    
+    Each worker process gets an equal share of ``max_connections`` minus the
+    ``reserved`` connections kept for cron jobs and admin sessions. A worker
+    never needs more connections than it has threads, so the pool holds one
+    per thread and any spare share becomes overflow for streamed exports.
+    ``mode='null'`` opens a short-lived connection per checkout, for use
+    behind an external pooler (ProxySQL, RDS Proxy).
+    """
+    if mode == 'null':
+        options = {key: value for key, value in base.items() if key not in QUEUE_POOL_OPTIONS}
+        options['poolclass'] = NullPool
+        return options
+    
+    budget = max(1, (max_connections - reserved) // max(1, workers))
+    pool_size = min(threads, budget)
+    return {
+        **base,
+        'pool_size': pool_size,
+        'max_overflow': min(budget - pool_size, max(1, threads // 4)),
+        'pool_timeout': timeout,
+    }
+
 class Config:
     # Database configuration
     MYSQL_HOST = os.environ.get('MYSQL_HOST') or 'localhost'
@@ -34,17 +62,97 @@ class Config:
         }
     }
     
+    # Read replicas - comma-separated URIs; read-only routes round-robin across them
+    REPLICA_DATABASE_URIS = os.environ.get('REPLICA_DATABASE_URIS', '')
+    # Seconds a client reads from the primary after its own write (read-your-own-writes)
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+    # Seconds a failed replica stays out of rotation
+    REPLICA_RETRY_SECONDS = int(os.environ.get('REPLICA_RETRY_SECONDS', 10))
+    
+    # ASGI mode (asgi.py) - async engine for the read routes; the URI defaults to the
+    # async driver for SQLALCHEMY_DATABASE_URI (aiomysql / aiosqlite)
+    ASYNC_DATABASE_URI = os.environ.get('ASYNC_DATABASE_URI')
+    ASYNC_POOL_SIZE = int(os.environ.get('ASYNC_POOL_SIZE', 10))
+    ASYNC_MAX_OVERFLOW = int(os.environ.get('ASYNC_MAX_OVERFLOW', 10))
+    
+    # Startup - `flask init-db [--seed]` manages the schema; these repeat it on every
+    # worker boot and are meant for local development only
+    DB_CREATE_ON_STARTUP = os.environ.get('DB_CREATE_ON_STARTUP', 'false').lower() == 'true'
+    SEED_SAMPLE_DATA = os.environ.get('SEED_SAMPLE_DATA', 'false').lower() == 'true'
+    
     # Security
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     
-    # CORS
-    CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+    # CORS - origins allowed to call the API (Flask and the ASGI read routes)
+    CORS_ORIGINS = os.environ.get(
+        'CORS_ORIGINS',
+        'http://localhost:5173,http://localhost:3000,https://finstack-assignment-pi.vercel.app'
+    ).split(',')
     
     # Pagination
     TASKS_PER_PAGE = int(os.environ.get('TASKS_PER_PAGE', 20))
+    # Listing totals: exact, cached (per filter, for TASK_COUNT_CACHE_TTL seconds),
+    # estimated (MySQL optimizer statistics) or none
+    TASK_COUNT_STRATEGY = os.environ.get('TASK_COUNT_STRATEGY', 'exact')
+    TASK_COUNT_CACHE_TTL = int(os.environ.get('TASK_COUNT_CACHE_TTL', 60))
+    
+    # JSON encoding for task payloads: auto (orjson when installed), orjson or stdlib
+    JSON_SERIALIZER = os.environ.get('JSON_SERIALIZER', 'auto')
+    
+    # Caching - seconds /tasks/stats results are reused (0 disables)
+    STATS_CACHE_TTL = int(os.environ.get('STATS_CACHE_TTL', 30))
+    # Task list results: memory (per-process LRU), redis (shared) or none
+    TASK_LIST_CACHE_BACKEND = os.environ.get('TASK_LIST_CACHE_BACKEND', 'memory')
+    TASK_LIST_CACHE_TTL = int(os.environ.get('TASK_LIST_CACHE_TTL', 60))
+    TASK_LIST_CACHE_MAX_ENTRIES = int(os.environ.get('TASK_LIST_CACHE_MAX_ENTRIES', 1024))
+    REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+    
+    # Export - rows fetched per server-side cursor batch
+    EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 1000))
+    
+    # Bulk writes - rows per INSERT/UPDATE/DELETE statement
+    BULK_INSERT_CHUNK_SIZE = int(os.environ.get('BULK_INSERT_CHUNK_SIZE', 1000))
+    BULK_UPDATE_CHUNK_SIZE = int(os.environ.get('BULK_UPDATE_CHUNK_SIZE', 1000))
+    # Smaller default for deletes so InnoDB row locks are released quickly
+    BULK_DELETE_CHUNK_SIZE = int(os.environ.get('BULK_DELETE_CHUNK_SIZE', 500))
+    
+    # Archival - closed/cancelled tasks older than this move to tasks_archive
+    ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', 90))
+    
+    # Index advisor - tally listing filter/sort shapes for /api/tasks/index-advice
+    INDEX_ADVISOR_RECORD_SHAPES = os.environ.get('INDEX_ADVISOR_RECORD_SHAPES', 'true').lower() == 'true'
     
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+    
+    # Profiling - per-request SQL/serialization timings (Server-Timing header and logs)
+    PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'true').lower() == 'true'
+    # Queries slower than this (milliseconds) go to the slow-query log
+    SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS', 200))
+    SLOW_QUERY_LOG = os.environ.get('SLOW_QUERY_LOG', 'logs/slow_queries.log')
+    
+    # Metrics - Prometheus text format at /metrics (per worker process)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    
+    # Change feed (/api/tasks/changes) - one poller per worker reads task_changes for all
+    # clients; each open stream holds a request thread, so a worker serves at most half of
+    # its GUNICORN_THREADS as streams (CHANGE_FEED_MAX_SUBSCRIBERS can only lower that)
+    CHANGE_FEED_POLL_SECONDS = float(os.environ.get('CHANGE_FEED_POLL_SECONDS', 1))
+    # Seconds an id gap (uncommitted or rolled back write) holds back later changes,
+    # in the change feed and in delta sync
+    CHANGE_FEED_GAP_SECONDS = float(os.environ.get('CHANGE_FEED_GAP_SECONDS', 2))
+    CHANGE_FEED_HEARTBEAT_SECONDS = int(os.environ.get('CHANGE_FEED_HEARTBEAT_SECONDS', 15))
+    CHANGE_FEED_MAX_SUBSCRIBERS = int(os.environ.get('CHANGE_FEED_MAX_SUBSCRIBERS', 100))
+    # Undelivered batches per client before its stream is closed
+    CHANGE_FEED_MAX_PENDING = int(os.environ.get('CHANGE_FEED_MAX_PENDING', 100))
+    # Resuming clients further behind than this are told to refetch
+    CHANGE_FEED_REPLAY_LIMIT = int(os.environ.get('CHANGE_FEED_REPLAY_LIMIT', 1000))
+    # Days of change log kept by `flask prune-task-changes`; sync tokens older than this
+    # have lost their tombstones and must restart with a full sync
+    CHANGE_LOG_RETENTION_DAYS = int(os.environ.get('CHANGE_LOG_RETENTION_DAYS', 7))
+    
+    # Delta sync (/api/tasks/sync) - rows per batch
+    TASK_SYNC_BATCH_SIZE = int(os.environ.get('TASK_SYNC_BATCH_SIZE', 500))
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -62,13 +170,23 @@ class ProductionConfig(Config):
     DEBUG = False
     SQLALCHEMY_ECHO = False
     
-    # Production optimized settings
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        **Config.SQLALCHEMY_ENGINE_OPTIONS,
-        'pool_size': 3,           
-        'max_overflow': 2,        
-        'pool_recycle': 3600,     
-    }
+    # Pool sizing - declare the gunicorn layout and the database's connection budget
+    DB_POOL_MODE = os.environ.get('DB_POOL_MODE', 'queue')  # queue or null (external pooler)
+    WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', 2))
+    GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 4))
+    DB_MAX_CONNECTIONS = int(os.environ.get('DB_MAX_CONNECTIONS', 20))
+    DB_RESERVED_CONNECTIONS = int(os.environ.get('DB_RESERVED_CONNECTIONS', 2))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+    
+    SQLALCHEMY_ENGINE_OPTIONS = pool_engine_options(
+        {**Config.SQLALCHEMY_ENGINE_OPTIONS, 'pool_recycle': 3600},
+        mode=DB_POOL_MODE,
+        workers=WEB_CONCURRENCY,
+        threads=GUNICORN_THREADS,
+        max_connections=DB_MAX_CONNECTIONS,
+        reserved=DB_RESERVED_CONNECTIONS,
+        timeout=DB_POOL_TIMEOUT
+    )
 
 class TestingConfig(Config):
     TESTING = True
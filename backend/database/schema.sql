@@ -27,5 +27,54 @@ CREATE TABLE IF NOT EXISTS tasks (
     INDEX idx_due_date (due_date),
     INDEX idx_task_date_status (date, status),
     INDEX idx_task_entity_type (entity_name, task_type),
-    INDEX idx_task_contact_status (contact_person, status)
-);
\ No newline at end of file
+    INDEX idx_task_contact_status (contact_person, status),
+    FULLTEXT INDEX ft_task_search (entity_name, contact_person, note)
+);
+
+-- Running task counts per category, maintained by the application on every write
+-- (rebuild with `flask rebuild-task-counters`)
+CREATE TABLE IF NOT EXISTS task_counters (
+    dimension VARCHAR(20) NOT NULL,
+    value VARCHAR(20) NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value)
+);
+
+-- Tasks moved out of the hot table by bulk deletes with archive=true, keeping their ids
+CREATE TABLE IF NOT EXISTS tasks_archive (
+    id INT PRIMARY KEY,
+    date DATE NOT NULL,
+    entity_name VARCHAR(100) NOT NULL,
+    task_type ENUM('Meeting', 'Call', 'Video Call', 'Email', 'Follow-up') NOT NULL,
+    time VARCHAR(10) NOT NULL,
+    contact_person VARCHAR(100) NOT NULL,
+    note TEXT NULL,
+    status ENUM('Open', 'Closed', 'In Progress', 'Cancelled') NOT NULL,
+    priority ENUM('Low', 'Medium', 'High', 'Urgent') NOT NULL,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    due_date DATE NULL,
+    completed_at DATETIME NULL,
+    archived_at DATETIME NOT NULL,
+    
+    INDEX idx_archive_date (date),
+    INDEX idx_archive_status (status),
+    INDEX idx_archive_completed_at (completed_at)
+);
+
+-- Append-only log of task writes, written in the same transaction as each write;
+-- the id is the resume token of /api/tasks/changes (prune with `flask prune-task-changes`)
+CREATE TABLE IF NOT EXISTS task_changes (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    task_id INT NOT NULL,
+    op ENUM('insert', 'update', 'delete') NOT NULL,
+    data TEXT NULL,
+    changed_at DATETIME NOT NULL,
+    
+    INDEX idx_changed_at (changed_at)
+);
+
+-- Existing databases: add the search index with
+-- ALTER TABLE tasks ADD FULLTEXT INDEX ft_task_search (entity_name, contact_person, note);
+-- and widen the counters (the last-modified epoch time outgrows INT in 2038) with
+-- ALTER TABLE task_counters MODIFY count BIGINT NOT NULL DEFAULT 0;
\ No newline at end of file
@@ -1,8 +1,13 @@
 from flask_sqlalchemy import SQLAlchemy
+from .routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 # Import all models to ensure they are registered
 from .task import Task
+from . import search  # FULLTEXT index DDL for MySQL
+from .task_counter import TaskCounter
+from .task_archive import TaskArchive
+from .task_change import TaskChange
 
-__all__ = ['db', 'Task']
\ No newline at end of file
+__all__ = ['db', 'Task', 'TaskCounter', 'TaskArchive', 'TaskChange']
\ No newline at end of file
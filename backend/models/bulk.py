@@ -0,0 +1,191 @@
+from models import db
+from models.task import Task
+from models.task_counter import add_counter_delta, counter_keys, record_task_change
+from models.task_archive import TaskArchive, archive_select
+from models.task_change import change_row, log_task_changes
+from datetime import datetime, timedelta
+
+# Fields that feed task_counters, in counter_keys argument order
+COUNTER_FIELDS = ('status', 'task_type', 'priority', 'due_date')
+
+def chunked(items, size):
+    """Split a list into consecutive chunks of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def bulk_insert_tasks(rows, chunk_size=1000):
+    """Insert task rows with set-based statements and return their ids in order.
+
+    Rows are plain column dicts (see ``build_task_values``) and never become
+    ORM objects. Each chunk is one statement: an executemany with RETURNING
+    where the backend supports it, otherwise a multi-row INSERT whose ids are
+    the consecutive range starting at ``lastrowid`` (InnoDB reserves the ids
+    of a multi-row insert with a known row count up front). Task counters
+    and the change log are updated in the same transaction. The caller
+    commits.
+    """
+    connection = db.session.connection()
+    table = Task.__table__
+    ids = []
+    # Timestamps are set here rather than by column defaults so the change log carries them
+    now = datetime.utcnow()
+    rows = [dict({'created_at': now, 'updated_at': now, 'completed_at': None}, **row) for row in rows]
+
+    for chunk in chunked(rows, chunk_size):
+        if connection.dialect.insert_executemany_returning:
+            result = connection.execute(
+                table.insert().returning(table.c.id, sort_by_parameter_order=True), chunk
+            )
+            ids.extend(result.scalars().all())
+        else:
+            result = connection.execute(table.insert().values(chunk))
+            first_id = result.lastrowid
+            ids.extend(range(first_id, first_id + len(chunk)))
+
+    deltas = {}
+    for row in rows:
+        add_counter_delta(deltas, counter_keys(row['status'], row['task_type'],
+                                               row['priority'], row['due_date']), 1)
+    record_task_change(connection, deltas)
+    log_task_changes(connection, [
+        change_row('insert', task_id, dict(row, id=task_id), now)
+        for task_id, row in zip(ids, rows)
+    ])
+
+    return ids
+
+def fetch_task_dicts(ids, chunk_size=1000):
+    """Load tasks by id as column dicts, in the order of ids"""
+    columns = Task.__table__.c
+    by_id = {}
+    for chunk in chunked(list(ids), chunk_size):
+        for row in db.session.execute(db.select(Task.__table__).where(columns.id.in_(chunk))).mappings():
+            by_id[row['id']] = dict(row)
+    return [by_id[task_id] for task_id in ids if task_id in by_id]
+
+def selection_clause(ids=None, filters=None):
+    """WHERE clause for a bulk operation: an explicit id list or listing filters"""
+    if ids is not None:
+        return Task.id.in_(ids)
+    return Task.apply_filters(db.select(Task.id), filters).whereclause
+
+def bulk_update_tasks(values, ids=None, filters=None, chunk_size=1000):
+    """Apply column updates to every selected task, ``chunk_size`` ids per UPDATE.
+
+    A ``status`` change follows ``Task.update_status``: ``completed_at`` is
+    set when closing and cleared otherwise. Counter deltas come from a
+    grouped (locking) read of the selection taken before the update; the
+    ids locked for the change log then pin the UPDATEs to the same rows.
+    An explicit id list is read in chunks too, so no statement carries more
+    than ``chunk_size`` ids. All chunks share one transaction. Returns the
+    number of rows updated; the caller commits.
+    """
+    connection = db.session.connection()
+    table = Task.__table__
+    if ids is not None:
+        wheres = [selection_clause(ids=chunk) for chunk in chunked(list(ids), chunk_size)]
+    else:
+        wheres = [selection_clause(filters=filters)]
+
+    now = datetime.utcnow()
+    values = dict(values, updated_at=now)
+    if 'status' in values:
+        values['completed_at'] = now if values['status'] == 'Closed' else None
+
+    deltas = {}
+    updated_ids = []
+    for where in wheres:
+        if any(field in values for field in COUNTER_FIELDS):
+            groups = connection.execute(
+                db.select(*[getattr(Task, field) for field in COUNTER_FIELDS], db.func.count(Task.id))
+                .where(where)
+                .group_by(*[getattr(Task, field) for field in COUNTER_FIELDS])
+                .with_for_update()
+            ).all()
+            for *previous, count in groups:
+                updated = [values.get(field, value) for field, value in zip(COUNTER_FIELDS, previous)]
+                add_counter_delta(deltas, counter_keys(*previous), -count)
+                add_counter_delta(deltas, counter_keys(*updated), count)
+
+        # The change log needs the affected ids
+        updated_ids.extend(connection.execute(db.select(Task.id).where(where).with_for_update()).scalars().all())
+    if not updated_ids:
+        return 0
+
+    updated_count = 0
+    for chunk in chunked(updated_ids, chunk_size):
+        result = connection.execute(table.update().where(Task.id.in_(chunk)).values(**values))
+        updated_count += result.rowcount
+    record_task_change(connection, deltas)
+    log_task_changes(connection, [change_row('update', task_id, values, now) for task_id in updated_ids])
+
+    return updated_count
+
+def bulk_delete_tasks(ids=None, filters=None, chunk_size=1000, archive=False, where=None):
+    """Delete the selected tasks in bounded chunks, optionally archiving them.
+    
+    Tasks are selected by ``ids``, listing ``filters`` or a prebuilt
+    ``where`` clause.
+    Each chunk is its own transaction: lock up to ``chunk_size`` matching
+    rows, copy them into ``tasks_archive`` with INSERT ... SELECT when
+    archiving, delete them and adjust the counters, then commit. Row locks
+    are therefore held for one chunk at a time. Returns the number of tasks
+    removed.
+    """
+    table = Task.__table__
+    id_chunks = chunked(list(ids), chunk_size) if ids is not None else None
+    if ids is None and where is None:
+        where = selection_clause(filters=filters)
+    removed = 0
+    
+    while True:
+        if id_chunks is not None:
+            chunk_ids = next(id_chunks, None)
+            if chunk_ids is None:
+                break
+            chunk_where = Task.id.in_(chunk_ids)
+        else:
+            chunk_where = where
+        
+        connection = db.session.connection()
+        rows = connection.execute(
+            db.select(Task.id, *[getattr(Task, field) for field in COUNTER_FIELDS])
+            .where(chunk_where)
+            .order_by(Task.id)
+            .limit(chunk_size)
+            .with_for_update()
+        ).all()
+        if not rows:
+            if id_chunks is not None:
+                continue
+            break
+        
+        locked_ids = [row[0] for row in rows]
+        if archive:
+            columns, source = archive_select(Task.id.in_(locked_ids), datetime.utcnow())
+            connection.execute(TaskArchive.__table__.insert().from_select(columns, source))
+        connection.execute(table.delete().where(Task.id.in_(locked_ids)))
+        
+        deltas = {}
+        for row in rows:
+            add_counter_delta(deltas, counter_keys(*row[1:]), -1)
+        record_task_change(connection, deltas)
+        log_task_changes(connection, [change_row('delete', task_id) for task_id in locked_ids])
+        
+        db.session.commit()
+        removed += len(locked_ids)
+    
+    return removed
+
+def archive_closed_tasks(older_than_days, chunk_size=1000):
+    """Move tasks finished more than ``older_than_days`` ago into tasks_archive.
+    
+    Closed tasks age from ``completed_at``; cancelled tasks never get a
+    completion time, so they age from ``updated_at``.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    where = db.or_(
+        db.and_(Task.status == 'Closed', Task.completed_at < cutoff),
+        db.and_(Task.status == 'Cancelled', Task.updated_at < cutoff)
+    )
+    return bulk_delete_tasks(where=where, chunk_size=chunk_size, archive=True)
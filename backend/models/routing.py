@@ -0,0 +1,21 @@
+from flask import current_app, g, has_request_context
+from flask_sqlalchemy.session import Session
+
+class RoutingSession(Session):
+    """Session that sends read-only requests to a replica engine.
+    
+    Routes marked ``read_only`` set ``g.db_read_only``; the first statement
+    of such a request picks a replica from the router and the rest of the
+    request stays on it so all reads see one snapshot. Flushes and any
+    request not marked read-only use the primary.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_request_context() and g.get('db_read_only'):
+            replica_key = g.get('db_replica')
+            if replica_key is None:
+                router = current_app.extensions.get('replica_router')
+                replica_key = g.db_replica = router.choose() if router is not None else False
+            if replica_key:
+                return self._db.engines[replica_key]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
\ No newline at end of file
@@ -0,0 +1,49 @@
+from models import db
+from models.task import Task
+from sqlalchemy import DDL, and_, event, or_
+from sqlalchemy.dialects.mysql import match
+from utils.search import SEARCH_FIELDS, MIN_FULLTEXT_QUERY_LENGTH, boolean_mode_query, normalize_search_text
+
+# MySQL maintains its own FULLTEXT index, so only the DDL is needed there
+event.listen(
+    Task.__table__,
+    'after_create',
+    DDL('ALTER TABLE %(table)s ADD FULLTEXT INDEX ft_task_search '
+        '(entity_name, contact_person, note)').execute_if(dialect='mysql')
+)
+
+def words_clause(query, model=Task):
+    """Every word of the query as a substring of one of the model's searchable fields"""
+    return and_(*[or_(*[getattr(model, field).ilike(f'%{word}%') for field in SEARCH_FIELDS])
+                  for word in normalize_search_text(query).split(' ')])
+
+def search_clause(query):
+    """Return (condition, relevance score) expressions for a search query.
+
+    MySQL uses the ft_task_search FULLTEXT index. Other databases (SQLite in
+    development and tests) scan for every word instead; a trigram table was
+    tried there and ranking its matches cost more than the scan for common words.
+    The score is None when the FULLTEXT index is not used.
+    """
+    if db.engine.dialect.name == 'mysql' and len(query.strip()) >= MIN_FULLTEXT_QUERY_LENGTH:
+        relevance = match(Task.entity_name, Task.contact_person, Task.note,
+                          against=boolean_mode_query(query)).in_boolean_mode()
+        return relevance, relevance
+
+    # Too short for the index, or no index; fall back to a substring scan
+    return words_clause(query), None
+
+def rebuild_search_index():
+    """Add the FULLTEXT index to a MySQL tasks table created without it; True if it was added"""
+    connection = db.session.connection()
+    if connection.dialect.name != 'mysql':
+        return False
+
+    existing = connection.exec_driver_sql(
+        "SHOW INDEX FROM tasks WHERE Key_name = 'ft_task_search'").fetchall()
+    if not existing:
+        connection.exec_driver_sql(
+            'ALTER TABLE tasks ADD FULLTEXT INDEX ft_task_search '
+            '(entity_name, contact_person, note)')
+    db.session.commit()
+    return not existing
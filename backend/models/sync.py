@@ -0,0 +1,91 @@
+from models import db
+from models.task import Task
+from models.task_change import TaskChange, latest_change_id
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+# Position of a sync client: the last task id of the initial full scan (None once the
+# scan is done), and the last change log id (with its time) the client received
+SyncCursor = namedtuple('SyncCursor', ['scan_id', 'change_id', 'change_time'])
+SyncBatch = namedtuple('SyncBatch', ['tasks', 'deleted', 'cursor', 'has_more'])
+
+def start_sync_cursor():
+    """Cursor for a full sync: every task, then the change log from now on"""
+    return SyncCursor(0, latest_change_id(), datetime.utcnow())
+
+def committed_changes(rows, change_id, gap_seconds):
+    """Leading change rows that can be passed without skipping an uncommitted id.
+
+    Log ids are taken at insert but only become visible at commit, so a
+    missing id is a transaction still in flight (or rolled back). Rows
+    after a gap are held back until the first of them is ``gap_seconds``
+    old; a gap that long is treated as a rollback, like the change feed does.
+    """
+    oldest_allowed = datetime.utcnow() - timedelta(seconds=gap_seconds)
+    ready = []
+    expected = change_id + 1
+    for row in rows:
+        if row.id != expected and row.changed_at > oldest_allowed:
+            break
+        ready.append(row)
+        expected = row.id + 1
+    return ready
+
+def get_sync_batch(cursor, limit=500, gap_seconds=2):
+    """Tasks written and deleted after a sync cursor, at most limit of them.
+
+    A full sync first pages through the tasks table by id. The change log
+    position is taken before the scan starts, so writes made during the scan
+    are sent again from the log afterwards. After that, batches follow the
+    change log in id order: a task changed many times is sent once, in its
+    current state, and delete rows (single, bulk and archiving) are the
+    tombstones.
+    """
+    scan_id, change_id, change_time = cursor
+
+    if scan_id is not None:
+        rows = db.session.execute(
+            db.select(Task.__table__).where(Task.id > scan_id).order_by(Task.id).limit(limit + 1)
+        ).mappings().all()
+        tasks = [dict(row) for row in rows[:limit]]
+        if len(rows) > limit:
+            return SyncBatch(tasks, [], SyncCursor(tasks[-1]['id'], change_id, change_time), True)
+        # Scan finished; the next batch reads the log from where the scan started
+        return SyncBatch(tasks, [], SyncCursor(None, change_id, change_time), True)
+
+    rows = db.session.execute(
+        db.select(TaskChange.id, TaskChange.task_id, TaskChange.op, TaskChange.changed_at)
+        .where(TaskChange.id > change_id)
+        .order_by(TaskChange.id)
+        .limit(limit + 1)
+    ).all()
+    changes = committed_changes(rows[:limit], change_id, gap_seconds)
+
+    # Last operation per task, in log order
+    last_ops = {}
+    for change in changes:
+        last_ops.pop(change.task_id, None)
+        last_ops[change.task_id] = change
+    written = [task_id for task_id, change in last_ops.items() if change.op != 'delete']
+    deleted = [{'id': task_id, 'deleted_at': change.changed_at}
+               for task_id, change in last_ops.items() if change.op == 'delete']
+
+    tasks = []
+    if written:
+        # Tasks deleted after their last change here get a tombstone in a later batch
+        tasks = [dict(row) for row in db.session.execute(
+            db.select(Task.__table__).where(Task.id.in_(written)).order_by(Task.id)
+        ).mappings().all()]
+
+    if changes:
+        change_id, change_time = changes[-1].id, changes[-1].changed_at
+    if len(changes) == len(rows):
+        # Caught up: nothing committed is left behind this position
+        change_time = datetime.utcnow()
+
+    return SyncBatch(
+        tasks,
+        deleted,
+        SyncCursor(None, change_id, change_time),
+        len(rows) > limit and len(changes) == limit
+    )
\ No newline at end of file
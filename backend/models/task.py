@@ -1,8 +1,37 @@
 from models import db
 from datetime import datetime, date
-from sqlalchemy import Index
+from sqlalchemy import Index, and_, or_, select, text, tuple_
+from utils.pagination import CursorPage, OffsetPage, encode_cursor, decode_cursor, enum_sort_order
 
-class Task(db.Model):
+# How get_filtered_tasks computes the listing total
+COUNT_STRATEGIES = ('exact', 'cached', 'estimated', 'none')
+
+class TaskFilterMixin:
+    """Listing filters shared by the live and archived task tables"""
+    
+    @classmethod
+    def apply_filters(cls, query, filters=None):
+        """Apply the listing filters to a query"""
+        if filters:
+            if filters.get('q'):
+                query = query.filter(cls.search_condition(filters['q']))
+            if filters.get('entity_name'):
+                query = query.filter(cls.entity_name.ilike(f"%{filters['entity_name']}%"))
+            if filters.get('task_type'):
+                query = query.filter(cls.task_type == filters['task_type'])
+            if filters.get('status'):
+                query = query.filter(cls.status == filters['status'])
+            if filters.get('contact_person'):
+                query = query.filter(cls.contact_person.ilike(f"%{filters['contact_person']}%"))
+            if filters.get('date'):
+                query = query.filter(cls.date == filters['date'])
+            if filters.get('priority'):
+                query = query.filter(cls.priority == filters['priority'])
+            if filters.get('due_date'):
+                query = query.filter(cls.due_date == filters['due_date'])
+        return query
+
+class Task(TaskFilterMixin, db.Model):
     __tablename__ = 'tasks'
     
     id = db.Column(db.Integer, primary_key=True)
@@ -50,38 +79,184 @@ class Task(db.Model):
         }
     
     @classmethod
-    def get_filtered_tasks(cls, filters=None, sort_by='date', sort_order='desc', page=1, per_page=20):
-        """Get filtered and sorted tasks with pagination"""
-        query = cls.query
-        
-        if filters:
-            if filters.get('entity_name'):
-                query = query.filter(cls.entity_name.ilike(f"%{filters['entity_name']}%"))
-            if filters.get('task_type'):
-                query = query.filter(cls.task_type == filters['task_type'])
-            if filters.get('status'):
-                query = query.filter(cls.status == filters['status'])
-            if filters.get('contact_person'):
-                query = query.filter(cls.contact_person.ilike(f"%{filters['contact_person']}%"))
-            if filters.get('date'):
-                query = query.filter(cls.date == filters['date'])
-            if filters.get('priority'):
-                query = query.filter(cls.priority == filters['priority'])
-            if filters.get('due_date'):
-                query = query.filter(cls.due_date == filters['due_date'])
-        
-        # Apply sorting
-        if hasattr(cls, sort_by):
+    def search_condition(cls, query_text):
+        """Condition matching tasks for a search query, using the search index"""
+        from models.search import search_clause
+        condition, _ = search_clause(query_text)
+        return condition
+    
+    @classmethod
+    def apply_sort(cls, query, sort_by='date', sort_order='desc', filters=None):
+        """Apply the listing sort order to a query"""
+        if sort_by == 'relevance' and filters and filters.get('q'):
+            from models.search import search_clause
+            _, relevance = search_clause(filters['q'])
+            # Without a search index there is no score; newest tasks come first
+            query = query.order_by(relevance.desc(), cls.id.desc()) if relevance is not None \
+                else query.order_by(cls.id.desc())
+        elif hasattr(cls, sort_by):
             if sort_order.lower() == 'desc':
                 query = query.order_by(getattr(cls, sort_by).desc())
             else:
                 query = query.order_by(getattr(cls, sort_by).asc())
+        return query
+    
+    @classmethod
+    def iter_rows(cls, columns, filters=None, sort_by='id', sort_order='asc', batch_size=1000):
+        """Yield batches of Core rows for the filtered tasks.
+        
+        Rows are streamed with a server-side cursor and never become ORM
+        objects, so memory stays bounded by ``batch_size`` however many rows
+        match.
+        """
+        stmt = cls.apply_filters(select(*columns), filters)
+        stmt = cls.apply_sort(stmt, sort_by, sort_order, filters)
+        if sort_by not in ('id', 'relevance'):
+            stmt = stmt.order_by(cls.id.desc() if sort_order.lower() == 'desc' else cls.id.asc())
         
-        return query.paginate(
-            page=page, 
-            per_page=per_page, 
-            error_out=False
+        result = db.session.execute(
+            stmt, execution_options={'stream_results': True, 'yield_per': batch_size}
         )
+        try:
+            for partition in result.partitions():
+                yield partition
+        finally:
+            result.close()
+    
+    @classmethod
+    def get_filtered_tasks(cls, filters=None, sort_by='date', sort_order='desc', page=1, per_page=20,
+                           columns=None, count='exact'):
+        """Get filtered and sorted tasks with offset pagination.
+        
+        ``has_next`` comes from fetching one extra row, so the total is only
+        needed for display; ``count`` picks how it is obtained (see
+        ``count_filtered``). Items are Task objects, or Core rows when
+        ``columns`` is given.
+        """
+        query = db.session.query(*columns) if columns is not None else cls.query
+        query = cls.apply_filters(query, filters)
+        query = cls.apply_sort(query, sort_by, sort_order, filters)
+        
+        offset = (page - 1) * per_page
+        rows = query.limit(per_page + 1).offset(offset).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        
+        if not has_next and (items or page == 1):
+            # The last page was reached, so the exact total is known for free
+            total = offset + len(items)
+        else:
+            total = cls.count_filtered(filters, count)
+        
+        return OffsetPage(items=items, page=page, per_page=per_page, has_next=has_next, total=total)
+    
+    @classmethod
+    def count_filtered(cls, filters=None, strategy='exact'):
+        """Count the tasks matching the filters using a count strategy.
+        
+        ``exact`` runs COUNT(*); ``cached`` reuses an exact count per filter
+        set for TASK_COUNT_CACHE_TTL seconds; ``estimated`` reads the MySQL
+        optimizer's row estimate (exact elsewhere); ``none`` skips counting
+        and returns None.
+        """
+        if strategy == 'none':
+            return None
+        if strategy == 'estimated' and db.engine.dialect.name == 'mysql':
+            return cls._estimate_count(filters)
+        if strategy == 'cached':
+            from flask import current_app
+            from utils.cache import count_cache
+            key = repr(sorted((filters or {}).items()))
+            total = count_cache.get(key)
+            if total is None:
+                total = cls.count_filtered(filters)
+                count_cache.set(key, total, current_app.config['TASK_COUNT_CACHE_TTL'])
+            return total
+        return db.session.execute(cls.apply_filters(select(db.func.count(cls.id)), filters)).scalar()
+    
+    @classmethod
+    def _estimate_count(cls, filters=None):
+        """Approximate row count from InnoDB statistics or the EXPLAIN row estimate"""
+        connection = db.session.connection()
+        if not filters:
+            return connection.execute(text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ), {'table': cls.__tablename__}).scalar() or 0
+        
+        compiled = cls.apply_filters(select(cls.id), filters).compile(dialect=connection.dialect)
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        plan = connection.exec_driver_sql(f'EXPLAIN {compiled}', params).mappings().first()
+        if plan is None or plan['rows'] is None:
+            return 0
+        return int(plan['rows'] * float(plan['filtered'] or 100) / 100)
+    
+    @classmethod
+    def get_tasks_after_cursor(cls, filters=None, sort_by='date', sort_order='desc', cursor=None,
+                               per_page=20, include_total=False, columns=None):
+        """Get filtered and sorted tasks using keyset (cursor) pagination.
+        
+        Rows are ordered by the sort column with ``id`` as a tie-breaker and the
+        next page is located with a seek predicate instead of OFFSET, so every
+        page costs the same regardless of depth. The total is only counted when
+        ``include_total`` is set. Items are Task objects, or Core rows when
+        ``columns`` is given.
+        """
+        column = getattr(cls, sort_by)
+        descending = sort_order.lower() == 'desc'
+        query = db.session.query(*columns) if columns is not None else cls.query
+        query = cls.apply_filters(query, filters)
+        total = query.order_by(None).count() if include_total else None
+        
+        if cursor is not None:
+            last_value, last_id = decode_cursor(cursor, sort_by, sort_order, column)
+            query = query.filter(cls._seek_predicate(column, last_value, last_id, descending))
+        
+        if descending:
+            query = query.order_by(column.desc(), cls.id.desc())
+        else:
+            query = query.order_by(column.asc(), cls.id.asc())
+        
+        # Fetch one extra row to learn whether another page exists
+        rows = query.limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        
+        next_cursor = None
+        if has_next:
+            last = items[-1]
+            next_cursor = encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
+        
+        return CursorPage(items=items, per_page=per_page, has_next=has_next,
+                          next_cursor=next_cursor, total=total)
+    
+    @classmethod
+    def _seek_predicate(cls, column, last_value, last_id, descending):
+        """Build the WHERE clause selecting rows after (last_value, last_id)"""
+        if isinstance(column.type, db.Enum):
+            # Enum ordering differs per backend (declaration order on MySQL,
+            # lexical elsewhere), so compare against the set of later values.
+            order = enum_sort_order(column.type, db.engine.dialect.name)
+            position = order.index(last_value)
+            later = order[:position] if descending else order[position + 1:]
+            tie = and_(column == last_value, cls.id < last_id if descending else cls.id > last_id)
+            return or_(column.in_(later), tie) if later else tie
+        
+        if last_value is None:
+            # NULLs sort first ascending and last descending on MySQL and SQLite
+            tie = and_(column.is_(None), cls.id < last_id if descending else cls.id > last_id)
+            return tie if descending else or_(tie, column.isnot(None))
+        
+        if descending:
+            seek = tuple_(column, cls.id) < tuple_(last_value, last_id)
+            return or_(seek, column.is_(None)) if column.nullable else seek
+        return tuple_(column, cls.id) > tuple_(last_value, last_id)
+    
+    @classmethod
+    def get_stats(cls, today=None):
+        """Get dashboard statistics from the maintained task counters"""
+        from models.task_counter import get_counter_stats
+        return get_counter_stats(today or date.today())
     
     def update_status(self, new_status):
         """Update task status and set completion time if closed"""
@@ -0,0 +1,84 @@
+from models import db
+from models.task import Task, TaskFilterMixin
+from datetime import datetime
+from sqlalchemy import literal, union_all
+
+class TaskArchive(TaskFilterMixin, db.Model):
+    """Tasks moved out of the hot ``tasks`` table, keeping their original ids"""
+    __tablename__ = 'tasks_archive'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    date = db.Column(db.Date, nullable=False, index=True)
+    entity_name = db.Column(db.String(100), nullable=False)
+    task_type = db.Column(db.Enum('Meeting', 'Call', 'Video Call', 'Email', 'Follow-up', name='task_types'), 
+                         nullable=False)
+    time = db.Column(db.String(10), nullable=False)
+    contact_person = db.Column(db.String(100), nullable=False)
+    note = db.Column(db.Text, nullable=True)
+    status = db.Column(db.Enum('Open', 'Closed', 'In Progress', 'Cancelled', name='task_status'), 
+                      nullable=False, index=True)
+    priority = db.Column(db.Enum('Low', 'Medium', 'High', 'Urgent', name='task_priority'), 
+                        nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+    due_date = db.Column(db.Date, nullable=True)
+    completed_at = db.Column(db.DateTime, nullable=True, index=True)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<TaskArchive {self.id}: {self.entity_name} - {self.task_type}>'
+    
+    @classmethod
+    def search_condition(cls, query_text):
+        """Archived rows are not in the search index, so searches scan them word by word"""
+        from models.search import words_clause
+        return words_clause(query_text, cls)
+
+def archive_select(where, archived_at):
+    """SELECT feeding INSERT INTO tasks_archive for the tasks matching where"""
+    task_columns = [column.name for column in Task.__table__.columns]
+    source = Task.__table__
+    return (
+        task_columns + ['archived_at'],
+        db.select(*[source.c[name] for name in task_columns], db.literal(archived_at, db.DateTime))
+        .where(where)
+    )
+
+def get_tasks_including_archived(filters=None, sort_by='date', sort_order='desc', page=1, per_page=20,
+                                 fields=None):
+    """Get filtered, sorted and paginated tasks from both the live and archive tables.
+    
+    Returns (task dicts, total); each dict carries an ``archived`` flag.
+    Only ``fields`` (default: every column) are selected and returned.
+    Values are left as Python dates for the serializer to encode.
+    """
+    fields = list(fields or [column.name for column in Task.__table__.columns])
+    # The union is sorted and paged on id and the sort column, so both are selected
+    task_columns = fields + [name for name in dict.fromkeys(['id', sort_by]) if name not in fields]
+    live = Task.apply_filters(
+        db.select(*[getattr(Task, name) for name in task_columns], literal(False).label('archived')),
+        filters
+    )
+    archived = TaskArchive.apply_filters(
+        db.select(*[getattr(TaskArchive, name) for name in task_columns], literal(True).label('archived')),
+        filters
+    )
+    combined = union_all(live, archived).subquery()
+    
+    total = db.session.execute(db.select(db.func.count()).select_from(combined)).scalar()
+    
+    sort_column = combined.c[sort_by]
+    if sort_order.lower() == 'desc':
+        order = (sort_column.desc(), combined.c.id.desc())
+    else:
+        order = (sort_column.asc(), combined.c.id.asc())
+    rows = db.session.execute(
+        db.select(combined).order_by(*order).limit(per_page).offset((page - 1) * per_page)
+    ).mappings().all()
+    
+    tasks = []
+    for row in rows:
+        task = {name: row[name] for name in fields}
+        task['archived'] = bool(row['archived'])
+        tasks.append(task)
+    return tasks, total
@@ -0,0 +1,124 @@
+from models import db
+from models.task import Task
+from datetime import datetime, timedelta
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+import json
+
+# Operations recorded in the change log
+CHANGE_OPS = ('insert', 'update', 'delete')
+
+# Task columns carried by insert events
+TASK_FIELDS = [column.name for column in Task.__table__.columns]
+
+# Session.info flag set when a transaction wrote change log rows
+CHANGES_PENDING = 'task_changes_pending'
+
+class TaskChange(db.Model):
+    """Append-only log of task writes, read by the change feed.
+
+    The autoincrement id orders the log and doubles as the client resume
+    token. ``data`` holds the full task for inserts, only the changed
+    fields for updates and nothing for deletes (JSON text).
+    """
+    __tablename__ = 'task_changes'
+
+    id = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True)
+    task_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.Enum(*CHANGE_OPS, name='task_change_ops'), nullable=False)
+    data = db.Column(db.Text, nullable=True)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f'<TaskChange {self.id}: {self.op} task {self.task_id}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'task_id': self.task_id,
+            'op': self.op,
+            'data': json.loads(self.data) if self.data else None,
+            'changed_at': self.changed_at.isoformat()
+        }
+
+def _encode_value(value):
+    """JSON fallback for the date/datetime columns of a task"""
+    return value.isoformat()
+
+def change_row(op, task_id, data=None, changed_at=None):
+    """task_changes row for one write"""
+    return {
+        'task_id': task_id,
+        'op': op,
+        'data': json.dumps(data, default=_encode_value) if data is not None else None,
+        'changed_at': changed_at or datetime.utcnow()
+    }
+
+def log_task_changes(connection, rows, session=None):
+    """Append change rows on an existing connection.
+
+    Like ``record_task_change``, callers writing through Core statements
+    must call this in the same transaction as their write, so the log
+    commits (or rolls back) with it.
+    """
+    if not rows:
+        return
+    connection.execute(TaskChange.__table__.insert(), rows)
+    (session or db.session).info[CHANGES_PENDING] = True
+
+@event.listens_for(Session, 'after_flush')
+def log_flushed_task_changes(session, flush_context):
+    # after_flush: new rows have their ids and attribute history is still intact
+    now = datetime.utcnow()
+    rows = []
+
+    for task in session.new:
+        if isinstance(task, Task):
+            rows.append(change_row('insert', task.id, {name: getattr(task, name) for name in TASK_FIELDS}, now))
+
+    for task in session.dirty:
+        if not isinstance(task, Task):
+            continue
+        state = inspect(task)
+        changed = {name: getattr(task, name) for name in TASK_FIELDS
+                   if state.attrs[name].history.has_changes()}
+        if changed:
+            rows.append(change_row('update', task.id, changed, now))
+
+    for task in session.deleted:
+        if isinstance(task, Task):
+            rows.append(change_row('delete', task.id, changed_at=now))
+
+    log_task_changes(session.connection(), rows, session)
+
+def get_changes_after(after_id, limit, until=None):
+    """Up to limit change log rows with an id above after_id (and at most until), oldest first"""
+    query = db.select(TaskChange).where(TaskChange.id > after_id)
+    if until is not None:
+        query = query.where(TaskChange.id <= until)
+    return db.session.execute(query.order_by(TaskChange.id).limit(limit)).scalars().all()
+
+def latest_change_id():
+    return db.session.execute(db.select(db.func.max(TaskChange.id))).scalar() or 0
+
+def oldest_change_id():
+    return db.session.execute(db.select(db.func.min(TaskChange.id))).scalar()
+
+def prune_task_changes(older_than_days, chunk_size=1000):
+    """Delete change log rows older than ``older_than_days`` in bounded chunks.
+
+    Clients resuming from a pruned token are told to refetch.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    table = TaskChange.__table__
+    removed = 0
+    while True:
+        ids = db.session.execute(
+            db.select(TaskChange.id).where(TaskChange.changed_at < cutoff).order_by(TaskChange.id).limit(chunk_size)
+        ).scalars().all()
+        if not ids:
+            break
+        db.session.execute(table.delete().where(table.c.id.in_(ids)))
+        db.session.commit()
+        removed += len(ids)
+    return removed
\ No newline at end of file
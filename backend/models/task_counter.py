@@ -0,0 +1,212 @@
+from models import db
+from models.task import Task
+from datetime import datetime, timezone
+from sqlalchemy import event, inspect
+import time
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+
+# Statuses whose past-due tasks count as overdue
+OPEN_STATUSES = ('Open', 'In Progress')
+
+# Per-day counts of open tasks by due date, used to compute overdue totals
+DUE_DIMENSION = 'due_open'
+
+# Table change version (bumped on every write) and last write time in epoch seconds
+META_DIMENSION = 'meta'
+VERSION_KEY = (META_DIMENSION, 'version')
+MODIFIED_KEY = (META_DIMENSION, 'modified')
+
+class TaskCounter(db.Model):
+    """Running task counts per category, maintained on every flush.
+
+    Rows are keyed on (dimension, value): ``status``, ``task_type`` and
+    ``priority`` hold one row per enum value, ``due_open`` holds one row per
+    due date (ISO format) counting tasks that are still open, and ``meta``
+    holds the change version and last-modified time of the tasks table.
+    ``count`` is a BIGINT because the last-modified time is stored in it as
+    epoch seconds, which passes the INT range in 2038.
+    """
+    __tablename__ = 'task_counters'
+
+    dimension = db.Column(db.String(20), primary_key=True)
+    value = db.Column(db.String(20), primary_key=True)
+    count = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<TaskCounter {self.dimension}={self.value}: {self.count}>'
+
+def counter_keys(status, task_type, priority, due_date):
+    """Counter rows a task with these values contributes to"""
+    keys = [('status', status), ('task_type', task_type), ('priority', priority)]
+    if due_date is not None and status in OPEN_STATUSES:
+        keys.append((DUE_DIMENSION, due_date.isoformat()))
+    return keys
+
+def add_counter_delta(deltas, keys, amount):
+    """Accumulate +/- amount for each counter key"""
+    for key in keys:
+        deltas[key] = deltas.get(key, 0) + amount
+
+def apply_counter_deltas(connection, deltas):
+    """Apply accumulated deltas to task_counters on an existing connection.
+
+    Callers that write through Core statements (and so bypass the flush
+    listener) must call this in the same transaction as their write.
+    """
+    rows = [{'dimension': dimension, 'value': value, 'count': amount}
+            for (dimension, value), amount in deltas.items() if amount]
+    if rows:
+        _upsert_counters(connection, rows, increment=True)
+
+def record_task_change(connection, deltas):
+    """Apply counter deltas and bump the tasks change version.
+
+    Every write to ``tasks`` goes through here (the flush listener and the
+    Core bulk paths), so the version identifies the table state for HTTP
+    validators.
+    """
+    add_counter_delta(deltas, [VERSION_KEY], 1)
+    apply_counter_deltas(connection, deltas)
+    dimension, value = MODIFIED_KEY
+    _upsert_counters(connection, [{'dimension': dimension, 'value': value, 'count': int(time.time())}],
+                     increment=False)
+
+def _upsert_counters(connection, rows, increment):
+    table = TaskCounter.__table__
+    dialect = connection.dialect.name
+    if dialect == 'mysql':
+        stmt = mysql.insert(table)
+        new_count = stmt.inserted['count']
+        stmt = stmt.on_duplicate_key_update(count=table.c.count + new_count if increment else new_count)
+        connection.execute(stmt, rows)
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(table)
+        new_count = stmt.excluded['count']
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['dimension', 'value'],
+            set_={'count': table.c.count + new_count if increment else new_count}
+        )
+        connection.execute(stmt, rows)
+    else:
+        for row in rows:
+            updated = connection.execute(
+                table.update()
+                .where(table.c.dimension == row['dimension'], table.c.value == row['value'])
+                .values(count=table.c.count + row['count'] if increment else row['count'])
+            )
+            if updated.rowcount == 0:
+                connection.execute(table.insert(), row)
+
+def _previous_value(state, field):
+    """Value of a field as of the last flush"""
+    history = state.attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(state.obj(), field)
+
+@event.listens_for(Session, 'before_flush')
+def track_task_counters(session, flush_context, instances):
+    deltas = {}
+    changed = False
+
+    for task in session.new:
+        if isinstance(task, Task):
+            changed = True
+            add_counter_delta(deltas, counter_keys(task.status or 'Open', task.task_type,
+                                                   task.priority or 'Medium', task.due_date), 1)
+
+    for task in session.dirty:
+        if not isinstance(task, Task) or not session.is_modified(task):
+            continue
+        changed = True
+        state = inspect(task)
+        previous = [_previous_value(state, field) for field in ('status', 'task_type', 'priority', 'due_date')]
+        add_counter_delta(deltas, counter_keys(*previous), -1)
+        add_counter_delta(deltas, counter_keys(task.status, task.task_type, task.priority, task.due_date), 1)
+
+    for task in session.deleted:
+        if isinstance(task, Task):
+            changed = True
+            state = inspect(task)
+            previous = [_previous_value(state, field) for field in ('status', 'task_type', 'priority', 'due_date')]
+            add_counter_delta(deltas, counter_keys(*previous), -1)
+
+    if changed:
+        record_task_change(session.connection(), deltas)
+
+def rebuild_task_counters():
+    """Recompute task_counters from the tasks table in one grouped pass"""
+    connection = db.session.connection()
+    rows = connection.execute(
+        db.select(Task.status, Task.task_type, Task.priority, Task.due_date, db.func.count(Task.id))
+        .group_by(Task.status, Task.task_type, Task.priority, Task.due_date)
+    ).all()
+
+    deltas = {}
+    for status, task_type, priority, due_date, count in rows:
+        add_counter_delta(deltas, counter_keys(status, task_type, priority, due_date), count)
+
+    table = TaskCounter.__table__
+    connection.execute(table.delete().where(table.c.dimension != META_DIMENSION))
+    total = sum(count for (dimension, _), count in deltas.items() if dimension == 'status')
+    record_task_change(connection, deltas)
+    db.session.commit()
+    return total
+
+# Every counter row except the table change version
+COUNTER_STATS_QUERY = db.select(TaskCounter.dimension, TaskCounter.value, TaskCounter.count).where(
+    TaskCounter.dimension != META_DIMENSION)
+
+def get_counter_stats(today):
+    """Build the /tasks/stats payload from task_counters"""
+    counters = db.session.execute(COUNTER_STATS_QUERY).all()
+    if not counters and db.session.query(Task.id).first() is not None:
+        # Counters were never built for existing data; reconcile once
+        from utils.replicas import use_primary
+        with use_primary():
+            rebuild_task_counters()
+            counters = db.session.execute(COUNTER_STATS_QUERY).all()
+    return counter_stats_payload(counters, today)
+
+def counter_stats_payload(counters, today):
+    """Stats payload from (dimension, value, count) counter rows"""
+    statuses = dict.fromkeys(Task.status.type.enums, 0)
+    task_types = dict.fromkeys(Task.task_type.type.enums, 0)
+    priorities = dict.fromkeys(Task.priority.type.enums, 0)
+    distributions = {'status': statuses, 'task_type': task_types, 'priority': priorities}
+
+    today_key = today.isoformat()
+    overdue_tasks = 0
+    for dimension, value, count in counters:
+        if dimension == DUE_DIMENSION:
+            if value < today_key:
+                overdue_tasks += count
+        elif value in distributions[dimension]:
+            distributions[dimension][value] += count
+
+    return {
+        'total_tasks': sum(statuses.values()),
+        'open_tasks': statuses['Open'],
+        'closed_tasks': statuses['Closed'],
+        'in_progress_tasks': statuses['In Progress'],
+        'overdue_tasks': overdue_tasks,
+        'task_types': [{'type': t, 'count': c} for t, c in task_types.items() if c],
+        'priorities': [{'priority': p, 'count': c} for p, c in priorities.items() if c],
+        'statuses': [{'status': s, 'count': c} for s, c in statuses.items() if c]
+    }
+
+# (value, count) rows holding the change version and last-modified time
+VERSION_QUERY = db.select(TaskCounter.value, TaskCounter.count).where(TaskCounter.dimension == META_DIMENSION)
+
+def get_task_version():
+    """Return (change version, last modified UTC datetime) of the tasks table"""
+    return task_version(db.session.execute(VERSION_QUERY).all())
+
+def task_version(meta_rows):
+    """(change version, last modified UTC datetime) from the meta counter rows"""
+    meta = dict(meta_rows)
+    modified = meta.get(MODIFIED_KEY[1])
+    return meta.get(VERSION_KEY[1], 0), datetime.fromtimestamp(modified, timezone.utc) if modified else None
@@ -1,86 +1,255 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from models import db
-from models.task import Task
+from models.task import COUNT_STRATEGIES, Task
+from models.bulk import bulk_insert_tasks, bulk_update_tasks, bulk_delete_tasks, fetch_task_dicts
+from models.task_archive import get_tasks_including_archived
+from models.task_change import get_changes_after, oldest_change_id
+from models.sync import SyncCursor, get_sync_batch, start_sync_cursor
 from utils.validators import validate_task_data, validate_task_update
-from datetime import datetime
+from utils.cache import stats_cache, get_task_list_cache, invalidate_task_caches
+from utils.change_feed import get_change_broadcaster, stream_changes
+from utils.conditional import check_task_conditions
+from utils.exporters import EXPORT_FORMATS, pyarrow_available
+from utils.index_advisor import advise, shape_recorder
+from utils.metrics import record_rows
+from utils.replicas import read_only
+from utils.pagination import decode_sync_token, encode_sync_token, offset_pagination
+from utils.serializers import encode_json, json_body_response, json_response, rows_to_dicts
+from datetime import date, datetime, timedelta
+from functools import partial
 import logging
 
 task_bp = Blueprint('tasks', __name__)
 logger = logging.getLogger(__name__)
 
+VALID_SORT_FIELDS = ['id', 'date', 'entity_name', 'task_type', 'time', 
+                     'contact_person', 'status', 'priority', 'created_at', 
+                     'updated_at', 'due_date']
+VALID_SORT_ORDERS = ['asc', 'desc']
+
+# Listing reads Core rows of every column; keys follow the to_dict layout
+TASK_COLUMNS = [getattr(Task, column.key) for column in Task.__table__.columns]
+TASK_FIELDS = tuple(column.key for column in Task.__table__.columns)
+
+# Largest limit a /tasks/sync client may ask for
+MAX_SYNC_BATCH_SIZE = 5000
+
+# Fields PATCH /tasks/bulk may set (the same ones PUT /tasks/<id> accepts)
+BULK_UPDATE_FIELDS = ['entity_name', 'task_type', 'time', 'contact_person', 'note',
+                      'status', 'priority', 'date', 'due_date']
+
+def parse_task_filters(args):
+    """Build the filter dict from query parameters, returning (filters, error)"""
+    filters = {}
+    if args.get('q', '').strip():
+        filters['q'] = args.get('q').strip()
+    if args.get('entity_name'):
+        filters['entity_name'] = args.get('entity_name')
+    if args.get('task_type'):
+        filters['task_type'] = args.get('task_type')
+    if args.get('status'):
+        filters['status'] = args.get('status')
+    if args.get('contact_person'):
+        filters['contact_person'] = args.get('contact_person')
+    if args.get('priority'):
+        filters['priority'] = args.get('priority')
+    if args.get('date'):
+        try:
+            filters['date'] = datetime.strptime(args.get('date'), '%Y-%m-%d').date()
+        except ValueError:
+            return None, 'Invalid date format. Use YYYY-MM-DD'
+    if args.get('due_date'):
+        try:
+            filters['due_date'] = datetime.strptime(args.get('due_date'), '%Y-%m-%d').date()
+        except ValueError:
+            return None, 'Invalid due_date format. Use YYYY-MM-DD'
+    return filters, None
+
+def parse_task_fields(args, sort_by=None):
+    """Resolve ?fields= into (columns, keys, error) for projection pushdown.
+    
+    ``keys`` are the fields to return (``id`` is always included). ``columns``
+    selects those fields plus, at the end, the sort column when cursor paging
+    needs it; zipping rows with ``keys`` drops such trailing extras.
+    """
+    if not args.get('fields'):
+        return TASK_COLUMNS, TASK_FIELDS, None
+    
+    requested = [field.strip() for field in args.get('fields').split(',') if field.strip()]
+    unknown = [field for field in requested if field not in TASK_FIELDS]
+    if unknown:
+        return None, None, f'Invalid fields: {unknown}. Valid fields: {list(TASK_FIELDS)}'
+    
+    keys = tuple(['id'] + [field for field in TASK_FIELDS if field in requested and field != 'id'])
+    columns = [getattr(Task, key) for key in keys]
+    if sort_by in TASK_FIELDS and sort_by not in keys:
+        columns.append(getattr(Task, sort_by))
+    return columns, keys, None
+
+def build_task_values(data):
+    """Column values for a new task from validated request data"""
+    return {
+        'date': datetime.strptime(data.get('date', datetime.now().strftime('%Y-%m-%d')), '%Y-%m-%d').date(),
+        'entity_name': data['entity_name'],
+        'task_type': data['task_type'],
+        'time': data['time'],
+        'contact_person': data['contact_person'],
+        'note': data.get('note', ''),
+        'status': data.get('status', 'Open'),
+        'priority': data.get('priority', 'Medium'),
+        'due_date': datetime.strptime(data['due_date'], '%Y-%m-%d').date() if data.get('due_date') else None
+    }
+
 @task_bp.route('/tasks', methods=['GET'])
+@read_only
 def get_tasks():
     """Get all tasks with optional filtering, sorting, and pagination"""
     try:
         # Get query parameters
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 20, type=int), 100)  # Max 100 per page
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = max(min(request.args.get('per_page', 20, type=int), 100), 1)  # Max 100 per page
         
         # Filtering parameters
-        filters = {}
-        if request.args.get('entity_name'):
-            filters['entity_name'] = request.args.get('entity_name')
-        if request.args.get('task_type'):
-            filters['task_type'] = request.args.get('task_type')
-        if request.args.get('status'):
-            filters['status'] = request.args.get('status')
-        if request.args.get('contact_person'):
-            filters['contact_person'] = request.args.get('contact_person')
-        if request.args.get('priority'):
-            filters['priority'] = request.args.get('priority')
-        if request.args.get('date'):
-            try:
-                filters['date'] = datetime.strptime(request.args.get('date'), '%Y-%m-%d').date()
-            except ValueError:
-                return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
-        if request.args.get('due_date'):
-            try:
-                filters['due_date'] = datetime.strptime(request.args.get('due_date'), '%Y-%m-%d').date()
-            except ValueError:
-                return jsonify({'error': 'Invalid due_date format. Use YYYY-MM-DD'}), 400
+        filters, filter_error = parse_task_filters(request.args)
+        if filter_error:
+            return jsonify({'error': filter_error}), 400
         
-        # Sorting parameters
-        sort_by = request.args.get('sort_by', 'date')
-        sort_order = request.args.get('sort_order', 'desc')
+        # Sorting parameters - searches are ranked by relevance unless a sort is given
+        sort_by = request.args.get('sort_by', 'relevance' if filters.get('q') else 'date')
+        sort_order = request.args.get('sort_order', 'desc').lower()
         
         # Validate sort_by field
-        valid_sort_fields = ['id', 'date', 'entity_name', 'task_type', 'time', 
-                           'contact_person', 'status', 'priority', 'created_at', 
-                           'updated_at', 'due_date']
-        if sort_by not in valid_sort_fields:
-            return jsonify({'error': f'Invalid sort field. Valid fields: {valid_sort_fields}'}), 400
-        
-        # Get filtered and paginated tasks
-        pagination = Task.get_filtered_tasks(
-            filters=filters,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            page=page,
-            per_page=per_page
+        if sort_by == 'relevance' and not filters.get('q'):
+            return jsonify({'error': 'Sorting by relevance requires a search query (q)'}), 400
+        if sort_by not in VALID_SORT_FIELDS and sort_by != 'relevance':
+            return jsonify({'error': f'Invalid sort field. Valid fields: {VALID_SORT_FIELDS}'}), 400
+        if sort_order not in VALID_SORT_ORDERS:
+            return jsonify({'error': f'Invalid sort order. Valid orders: {VALID_SORT_ORDERS}'}), 400
+        
+        # Sparse fieldsets: only the requested columns are selected and encoded
+        columns, fields, fields_error = parse_task_fields(request.args, sort_by)
+        if fields_error:
+            return jsonify({'error': fields_error}), 400
+        
+        # Cursor mode is opt-in: ?pagination=cursor for the first page, then ?cursor=<next_cursor>
+        cursor = request.args.get('cursor') or None
+        cursor_mode = cursor is not None or request.args.get('pagination') == 'cursor'
+        include_total = request.args.get('include_total', 'false').lower() == 'true'
+        include_archived = request.args.get('include_archived', 'false').lower() == 'true'
+        
+        # Offset listings: how the total is computed (count=none skips it entirely)
+        count = request.args.get('count', current_app.config['TASK_COUNT_STRATEGY'])
+        if count not in COUNT_STRATEGIES:
+            return jsonify({'error': f'count must be one of: {", ".join(COUNT_STRATEGIES)}'}), 400
+        
+        # Unchanged listings are answered with 304 before any query runs. The
+        # ETag (tasks change version + normalized query) also keys the result cache.
+        not_modified, validators = check_task_conditions(
+            'tasks', sorted(filters.items()), sort_by, sort_order, page, per_page, fields,
+            cursor, cursor_mode, include_total, include_archived, count
         )
+        if not_modified is not None:
+            return not_modified
+        list_cache = get_task_list_cache()
+        cache_key = validators['ETag']
+        body = list_cache.get(cache_key)
+        if body is not None:
+            return json_body_response(body, headers=validators)
+        
+        # Tally the filter/sort shape that reaches the database for the index advisor
+        if not include_archived and current_app.config['INDEX_ADVISOR_RECORD_SHAPES']:
+            shape_recorder.record(filters, sort_by, sort_order)
+        
+        # Archived tasks live in a separate table and are only read on request
+        if include_archived:
+            if sort_by == 'relevance' or cursor_mode:
+                return jsonify({'error': 'include_archived supports offset pagination with a sort_by field only'}), 400
+            tasks_data, total = get_tasks_including_archived(
+                filters=filters,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                page=page,
+                per_page=per_page,
+                fields=fields
+            )
+            response_data = {
+                'tasks': tasks_data,
+                'pagination': offset_pagination(page, per_page, total),
+                'filters_applied': filters,
+                'sort': {
+                    'sort_by': sort_by,
+                    'sort_order': sort_order
+                },
+                'include_archived': True
+            }
         
-        tasks_data = [task.to_dict() for task in pagination.items]
-        
-        response_data = {
-            'tasks': tasks_data,
-            'pagination': {
-                'page': pagination.page,
-                'pages': pagination.pages,
-                'per_page': pagination.per_page,
-                'total': pagination.total,
-                'has_next': pagination.has_next,
-                'has_prev': pagination.has_prev,
-                'next_num': pagination.next_num,
-                'prev_num': pagination.prev_num
-            },
-            'filters_applied': filters,
-            'sort': {
-                'sort_by': sort_by,
-                'sort_order': sort_order
+        elif cursor_mode:
+            if sort_by == 'relevance':
+                return jsonify({'error': 'Cursor pagination requires a sort_by field other than relevance'}), 400
+            try:
+                cursor_page = Task.get_tasks_after_cursor(
+                    filters=filters,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    cursor=cursor,
+                    per_page=per_page,
+                    include_total=include_total,
+                    columns=columns
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            pagination_data = {
+                'mode': 'cursor',
+                'per_page': cursor_page.per_page,
+                'has_next': cursor_page.has_next,
+                'next_cursor': cursor_page.next_cursor
+            }
+            if include_total:
+                pagination_data['total'] = cursor_page.total
+            
+            response_data = {
+                'tasks': rows_to_dicts(cursor_page.items, fields),
+                'pagination': pagination_data,
+                'filters_applied': filters,
+                'sort': {
+                    'sort_by': sort_by,
+                    'sort_order': sort_order
+                }
             }
-        }
         
-        return jsonify(response_data)
+        else:
+            # Get filtered and paginated tasks
+            pagination = Task.get_filtered_tasks(
+                filters=filters,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                page=page,
+                per_page=per_page,
+                columns=columns,
+                count=count
+            )
+            
+            tasks_data = rows_to_dicts(pagination.items, fields)
+            pagination_data = offset_pagination(page, per_page, pagination.total, pagination.has_next)
+            pagination_data['count'] = count
+            
+            response_data = {
+                'tasks': tasks_data,
+                'pagination': pagination_data,
+                'filters_applied': filters,
+                'sort': {
+                    'sort_by': sort_by,
+                    'sort_order': sort_order
+                }
+            }
+        
+        record_rows(len(response_data['tasks']))
+        
+        # Cache the encoded body so hits skip both the queries and serialization
+        body = encode_json(response_data)
+        list_cache.set(cache_key, body, current_app.config['TASK_LIST_CACHE_TTL'])
+        return json_body_response(body, headers=validators)
     
     except Exception as e:
         logger.error(f"Error fetching tasks: {str(e)}")
@@ -98,20 +267,11 @@ def create_task():
             return jsonify({'error': validation_error}), 400
         
         # Create new task
-        task = Task(
-            date=datetime.strptime(data.get('date', datetime.now().strftime('%Y-%m-%d')), '%Y-%m-%d').date(),
-            entity_name=data['entity_name'],
-            task_type=data['task_type'],
-            time=data['time'],
-            contact_person=data['contact_person'],
-            note=data.get('note', ''),
-            status=data.get('status', 'Open'),
-            priority=data.get('priority', 'Medium'),
-            due_date=datetime.strptime(data['due_date'], '%Y-%m-%d').date() if data.get('due_date') else None
-        )
+        task = Task(**build_task_values(data))
         
         db.session.add(task)
         db.session.commit()
+        invalidate_task_caches()
         
         logger.info(f"Task created successfully: {task.id}")
         return jsonify(task.to_dict()), 201
@@ -122,11 +282,23 @@ def create_task():
         return jsonify({'error': 'Failed to create task'}), 500
 
 @task_bp.route('/tasks/<int:task_id>', methods=['GET'])
+@read_only
 def get_task(task_id):
     """Get a specific task by ID"""
     try:
-        task = Task.query.get_or_404(task_id)
-        return jsonify(task.to_dict())
+        columns, fields, fields_error = parse_task_fields(request.args)
+        if fields_error:
+            return jsonify({'error': fields_error}), 400
+        
+        not_modified, validators = check_task_conditions('task', task_id, fields)
+        if not_modified is not None:
+            return not_modified
+        
+        row = db.session.execute(db.select(*columns).where(Task.id == task_id)).first()
+        if row is None:
+            return jsonify({'error': 'Task not found'}), 404
+        record_rows(1)
+        return json_response(dict(zip(fields, row)), headers=validators)
     
     except Exception as e:
         logger.error(f"Error fetching task {task_id}: {str(e)}")
@@ -166,6 +338,7 @@ def update_task(task_id):
         
         task.updated_at = datetime.utcnow()
         db.session.commit()
+        invalidate_task_caches()
         
         logger.info(f"Task updated successfully: {task_id}")
         return jsonify(task.to_dict())
@@ -182,6 +355,7 @@ def delete_task(task_id):
         task = Task.query.get_or_404(task_id)
         db.session.delete(task)
         db.session.commit()
+        invalidate_task_caches()
         
         logger.info(f"Task deleted successfully: {task_id}")
         return jsonify({'message': 'Task deleted successfully'}), 200
@@ -207,6 +381,7 @@ def update_task_status(task_id):
         
         task.update_status(data['status'])
         db.session.commit()
+        invalidate_task_caches()
         
         logger.info(f"Task status updated successfully: {task_id} -> {data['status']}")
         return jsonify(task.to_dict())
@@ -217,48 +392,124 @@ def update_task_status(task_id):
         return jsonify({'error': 'Failed to update task status'}), 500
 
 @task_bp.route('/tasks/stats', methods=['GET'])
+@read_only
 def get_task_stats():
     """Get task statistics"""
     try:
-        total_tasks = Task.query.count()
-        open_tasks = Task.query.filter(Task.status == 'Open').count()
-        closed_tasks = Task.query.filter(Task.status == 'Closed').count()
-        in_progress_tasks = Task.query.filter(Task.status == 'In Progress').count()
-        
-        # Task type distribution
-        task_types = db.session.query(Task.task_type, db.func.count(Task.id)).group_by(Task.task_type).all()
-        
-        # Priority distribution
-        priorities = db.session.query(Task.priority, db.func.count(Task.id)).group_by(Task.priority).all()
-        
-        # Tasks by status
-        statuses = db.session.query(Task.status, db.func.count(Task.id)).group_by(Task.status).all()
-        
-        # Overdue tasks
-        from datetime import date
-        overdue_tasks = Task.query.filter(
-            Task.due_date < date.today(),
-            Task.status.in_(['Open', 'In Progress'])
-        ).count()
-        
-        return jsonify({
-            'total_tasks': total_tasks,
-            'open_tasks': open_tasks,
-            'closed_tasks': closed_tasks,
-            'in_progress_tasks': in_progress_tasks,
-            'overdue_tasks': overdue_tasks,
-            'task_types': [{'type': t[0], 'count': t[1]} for t in task_types],
-            'priorities': [{'priority': p[0], 'count': p[1]} for p in priorities],
-            'statuses': [{'status': s[0], 'count': s[1]} for s in statuses]
-        })
+        # Overdue counts depend on the current date, so it is part of the key
+        today = date.today()
+        not_modified, validators = check_task_conditions('stats', today)
+        if not_modified is not None:
+            return not_modified
+        
+        stats = stats_cache.get(validators['ETag'])
+        if stats is None:
+            stats = Task.get_stats(today)
+            stats_cache.set(validators['ETag'], stats, current_app.config['STATS_CACHE_TTL'])
+        
+        return json_response(stats, headers=validators)
     
     except Exception as e:
         logger.error(f"Error fetching task stats: {str(e)}")
         return jsonify({'error': 'Failed to fetch statistics'}), 500
 
+@task_bp.route('/tasks/index-advice', methods=['GET'])
+def get_task_index_advice():
+    """EXPLAIN the listing shapes recorded by this process and suggest covering indexes"""
+    try:
+        report = advise(shape_recorder.shapes())
+        report['dropped_shapes'] = shape_recorder.dropped
+        return json_response(report)
+    
+    except Exception as e:
+        logger.error(f"Error building index advice: {str(e)}")
+        return jsonify({'error': 'Failed to build index advice'}), 500
+
+@task_bp.route('/tasks/cache-stats', methods=['GET'])
+def get_task_cache_stats():
+    """Hit/miss/eviction counters of the task list cache in this process"""
+    return jsonify(get_task_list_cache().stats())
+
+@task_bp.route('/tasks/sync', methods=['GET'])
+@read_only
+def sync_tasks():
+    """Tasks written and deleted since a sync token, in bounded batches"""
+    try:
+        limit = request.args.get('limit', current_app.config['TASK_SYNC_BATCH_SIZE'], type=int)
+        limit = max(min(limit, MAX_SYNC_BATCH_SIZE), 1)
+        
+        token = request.args.get('since')
+        if token:
+            try:
+                cursor = SyncCursor(*decode_sync_token(token))
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            retention = timedelta(days=current_app.config['CHANGE_LOG_RETENTION_DAYS'])
+            if cursor.change_time < datetime.utcnow() - retention:
+                return jsonify({'error': 'Sync token expired; restart with a full sync (omit since)'}), 410
+        else:
+            cursor = start_sync_cursor()
+        
+        batch = get_sync_batch(cursor, limit, current_app.config['CHANGE_FEED_GAP_SECONDS'])
+        record_rows(len(batch.tasks))
+        return json_response({
+            'tasks': batch.tasks,
+            'deleted': batch.deleted,
+            'next': encode_sync_token(batch.cursor),
+            'has_more': batch.has_more
+        })
+    
+    except Exception as e:
+        logger.error(f"Error syncing tasks: {str(e)}")
+        return jsonify({'error': 'Failed to sync tasks'}), 500
+
+@task_bp.route('/tasks/changes', methods=['GET'])
+def stream_task_changes():
+    """Stream task writes as server-sent events, resumable with since= or Last-Event-ID"""
+    subscriber = None
+    try:
+        since = request.args.get('since', request.headers.get('Last-Event-ID'))
+        if since is not None:
+            if not since.isdigit():
+                return jsonify({'error': 'since must be a change id'}), 400
+            since = int(since)
+        
+        broadcaster = get_change_broadcaster()
+        subscriber = broadcaster.subscribe()
+        if subscriber is None:
+            return jsonify({'error': 'Too many change feed clients, try again later'}), 503
+        
+        # Replay what the client missed up to where the live broadcast starts
+        replay, reset = [], False
+        if since is not None and since < subscriber.position:
+            limit = current_app.config['CHANGE_FEED_REPLAY_LIMIT']
+            rows = get_changes_after(since, limit + 1, until=subscriber.position)
+            oldest = oldest_change_id()
+            reset = len(rows) > limit or oldest is None or oldest > since + 1
+            if not reset:
+                replay = [row.to_dict() for row in rows]
+        # The stream itself never touches the database; give the connection back
+        db.session.close()
+        
+        response = Response(
+            stream_changes(subscriber, since, replay, reset, current_app.config['CHANGE_FEED_HEARTBEAT_SECONDS']),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        # Runs when the server closes the stream, including before the first event was sent
+        response.call_on_close(partial(broadcaster.unsubscribe, subscriber))
+        subscriber = None
+        return response
+    
+    except Exception as e:
+        if subscriber is not None:
+            get_change_broadcaster().unsubscribe(subscriber)
+        logger.error(f"Error opening task change feed: {str(e)}")
+        return jsonify({'error': 'Failed to open change feed'}), 500
+
 @task_bp.route('/tasks/bulk', methods=['POST'])
 def bulk_create_tasks():
-    """Create multiple tasks at once"""
+    """Create multiple tasks at once with set-based inserts"""
     try:
         data = request.get_json()
         
@@ -269,97 +520,245 @@ def bulk_create_tasks():
         if not isinstance(tasks_data, list):
             return jsonify({'error': 'Tasks must be an array'}), 400
         
-        created_tasks = []
-        errors = []
+        # What to send back for created tasks: full rows, ids only, or counts only
+        return_mode = request.args.get('return', 'full')
+        if return_mode not in ('full', 'ids', 'none'):
+            return jsonify({'error': 'return must be one of: full, ids, none'}), 400
         
+        # Validate the whole batch up front so the insert is purely set-based
+        rows = []
+        errors = []
+        now = datetime.utcnow()
         for i, task_data in enumerate(tasks_data):
             try:
                 validation_error = validate_task_data(task_data)
                 if validation_error:
                     errors.append(f"Task {i+1}: {validation_error}")
                     continue
-                
-                task = Task(
-                    date=datetime.strptime(task_data.get('date', datetime.now().strftime('%Y-%m-%d')), '%Y-%m-%d').date(),
-                    entity_name=task_data['entity_name'],
-                    task_type=task_data['task_type'],
-                    time=task_data['time'],
-                    contact_person=task_data['contact_person'],
-                    note=task_data.get('note', ''),
-                    status=task_data.get('status', 'Open'),
-                    priority=task_data.get('priority', 'Medium'),
-                    due_date=datetime.strptime(task_data['due_date'], '%Y-%m-%d').date() if task_data.get('due_date') else None
-                )
-                
-                db.session.add(task)
-                created_tasks.append(task)
-                
+                row = build_task_values(task_data)
             except Exception as e:
+                # Wrongly typed values (e.g. a number for entity_name) fail validation itself
                 errors.append(f"Task {i+1}: {str(e)}")
-        
-        if created_tasks:
+                continue
+            row['created_at'] = row['updated_at'] = now
+            row['completed_at'] = None
+            rows.append(row)
+        
+        created_ids = []
+        if rows:
+            created_ids = bulk_insert_tasks(rows, chunk_size=current_app.config['BULK_INSERT_CHUNK_SIZE'])
             db.session.commit()
-            logger.info(f"Bulk created {len(created_tasks)} tasks")
+            invalidate_task_caches()
+            logger.info(f"Bulk created {len(created_ids)} tasks")
         
         response = {
-            'created_count': len(created_tasks),
-            'error_count': len(errors),
-            'created_tasks': [task.to_dict() for task in created_tasks]
+            'created_count': len(created_ids),
+            'error_count': len(errors)
         }
+        if return_mode == 'full':
+            response['created_tasks'] = fetch_task_dicts(created_ids)
+        elif return_mode == 'ids':
+            response['created_ids'] = created_ids
         
         if errors:
             response['errors'] = errors
         
-        return jsonify(response), 201 if created_tasks else 400
+        return json_response(response, 201 if created_ids else 400)
     
     except Exception as e:
         db.session.rollback()
         logger.error(f"Error in bulk task creation: {str(e)}")
         return jsonify({'error': 'Failed to create tasks'}), 500
 
+def parse_bulk_selection(data):
+    """Read the tasks a bulk operation targets, returning (ids, filters, error).
+    
+    Either a non-empty "ids" array or a non-empty "filters" object using the
+    same parameters (as strings) as GET /tasks must be given.
+    """
+    if 'ids' in data:
+        ids = data['ids']
+        if not isinstance(ids, list) or not ids or \
+                not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            return None, None, 'ids must be a non-empty array of task ids'
+        return ids, None, None
+    
+    filter_args = data.get('filters')
+    if not isinstance(filter_args, dict) or not filter_args:
+        return None, None, 'Provide a non-empty "ids" array or "filters" object'
+    if not all(isinstance(value, str) for value in filter_args.values()):
+        return None, None, 'filter values must be strings'
+    filters, filter_error = parse_task_filters(filter_args)
+    if filter_error:
+        return None, None, filter_error
+    if not filters:
+        return None, None, 'filters did not match any supported filter field'
+    return None, filters, None
+
+@task_bp.route('/tasks/bulk', methods=['PATCH'])
+def bulk_update_tasks_route():
+    """Update fields on many tasks with one set-based UPDATE"""
+    try:
+        data = request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid data format'}), 400
+        
+        ids, filters, selection_error = parse_bulk_selection(data)
+        if selection_error:
+            return jsonify({'error': selection_error}), 400
+        
+        updates = data.get('updates')
+        if not isinstance(updates, dict) or not updates:
+            return jsonify({'error': 'Request must contain a non-empty "updates" object'}), 400
+        unknown_fields = set(updates) - set(BULK_UPDATE_FIELDS)
+        if unknown_fields:
+            return jsonify({'error': f'Fields cannot be bulk updated: {sorted(unknown_fields)}'}), 400
+        validation_error = validate_task_update(updates)
+        if validation_error:
+            return jsonify({'error': validation_error}), 400
+        
+        if 'date' in updates and not updates['date']:
+            return jsonify({'error': 'Date cannot be empty'}), 400
+        
+        values = dict(updates)
+        if 'date' in values:
+            values['date'] = datetime.strptime(values['date'], '%Y-%m-%d').date()
+        if 'due_date' in values:
+            values['due_date'] = datetime.strptime(values['due_date'], '%Y-%m-%d').date() if values['due_date'] else None
+        
+        updated_count = bulk_update_tasks(values, ids=ids, filters=filters,
+                                          chunk_size=current_app.config['BULK_UPDATE_CHUNK_SIZE'])
+        db.session.commit()
+        invalidate_task_caches()
+        
+        logger.info(f"Bulk updated {updated_count} tasks: {sorted(updates)}")
+        return jsonify({'updated_count': updated_count})
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error in bulk task update: {str(e)}")
+        return jsonify({'error': 'Failed to update tasks'}), 500
+
+@task_bp.route('/tasks/bulk/status', methods=['PATCH'])
+def bulk_update_task_status():
+    """Update the status of many tasks with one set-based UPDATE"""
+    try:
+        data = request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid data format'}), 400
+        
+        ids, filters, selection_error = parse_bulk_selection(data)
+        if selection_error:
+            return jsonify({'error': selection_error}), 400
+        
+        if 'status' not in data:
+            return jsonify({'error': 'Status field is required'}), 400
+        
+        valid_statuses = ['Open', 'Closed', 'In Progress', 'Cancelled']
+        if data['status'] not in valid_statuses:
+            return jsonify({'error': f'Status must be one of: {valid_statuses}'}), 400
+        
+        updated_count = bulk_update_tasks({'status': data['status']}, ids=ids, filters=filters,
+                                          chunk_size=current_app.config['BULK_UPDATE_CHUNK_SIZE'])
+        db.session.commit()
+        invalidate_task_caches()
+        
+        logger.info(f"Bulk status update: {updated_count} tasks -> {data['status']}")
+        return jsonify({'updated_count': updated_count, 'status': data['status']})
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error in bulk task status update: {str(e)}")
+        return jsonify({'error': 'Failed to update task status'}), 500
+
+@task_bp.route('/tasks/bulk', methods=['DELETE'])
+def bulk_delete_tasks_route():
+    """Delete (or archive) many tasks in bounded chunks"""
+    try:
+        data = request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid data format'}), 400
+        
+        ids, filters, selection_error = parse_bulk_selection(data)
+        if selection_error:
+            return jsonify({'error': selection_error}), 400
+        
+        archive = data.get('archive', False)
+        if not isinstance(archive, bool):
+            return jsonify({'error': 'archive must be true or false'}), 400
+        
+        removed_count = bulk_delete_tasks(ids=ids, filters=filters, archive=archive,
+                                          chunk_size=current_app.config['BULK_DELETE_CHUNK_SIZE'])
+        invalidate_task_caches()
+        
+        logger.info(f"Bulk {'archived' if archive else 'deleted'} {removed_count} tasks")
+        response = {'deleted_count': removed_count}
+        if archive:
+            response['archived_count'] = removed_count
+        return jsonify(response)
+    
+    except Exception as e:
+        db.session.rollback()
+        # Earlier chunks are already committed, so caches may be stale
+        invalidate_task_caches()
+        logger.error(f"Error in bulk task deletion: {str(e)}")
+        return jsonify({'error': 'Failed to delete tasks'}), 500
+
+EXPORT_COLUMNS = [
+    ('ID', Task.id), ('Date', Task.date), ('Entity Name', Task.entity_name),
+    ('Task Type', Task.task_type), ('Time', Task.time), ('Contact Person', Task.contact_person),
+    ('Note', Task.note), ('Status', Task.status), ('Priority', Task.priority),
+    ('Due Date', Task.due_date), ('Created At', Task.created_at), ('Updated At', Task.updated_at)
+]
+
 @task_bp.route('/tasks/export', methods=['GET'])
+@read_only
 def export_tasks():
-    """Export tasks to CSV format"""
+    """Export tasks as CSV, NDJSON, Arrow IPC or Parquet, streamed in batches"""
     try:
-        import csv
-        import io
-        
-        # Get all tasks (you might want to add filtering here)
-        tasks = Task.query.all()
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Date', 'Entity Name', 'Task Type', 'Time', 'Contact Person',
-            'Note', 'Status', 'Priority', 'Due Date', 'Created At', 'Updated At'
-        ])
-        
-        # Write data
-        for task in tasks:
-            writer.writerow([
-                task.id,
-                task.date.isoformat() if task.date else '',
-                task.entity_name,
-                task.task_type,
-                task.time,
-                task.contact_person,
-                task.note or '',
-                task.status,
-                task.priority,
-                task.due_date.isoformat() if task.due_date else '',
-                task.created_at.isoformat() if task.created_at else '',
-                task.updated_at.isoformat() if task.updated_at else ''
-            ])
-        
-        output.seek(0)
-        
-        from flask import Response
+        export_format = request.args.get('format', 'csv').lower()
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': f'Invalid format. Valid formats: {list(EXPORT_FORMATS)}'}), 400
+        encoder, mimetype, extension, needs_pyarrow = EXPORT_FORMATS[export_format]
+        if needs_pyarrow and not pyarrow_available():
+            return jsonify({'error': f'{export_format} export requires pyarrow to be installed'}), 501
+        
+        filters, filter_error = parse_task_filters(request.args)
+        if filter_error:
+            return jsonify({'error': filter_error}), 400
+        
+        sort_by = request.args.get('sort_by', 'id')
+        sort_order = request.args.get('sort_order', 'asc').lower()
+        if sort_by == 'relevance' and not filters.get('q'):
+            return jsonify({'error': 'Sorting by relevance requires a search query (q)'}), 400
+        if sort_by not in VALID_SORT_FIELDS and sort_by != 'relevance':
+            return jsonify({'error': f'Invalid sort field. Valid fields: {VALID_SORT_FIELDS}'}), 400
+        if sort_order not in VALID_SORT_ORDERS:
+            return jsonify({'error': f'Invalid sort order. Valid orders: {VALID_SORT_ORDERS}'}), 400
+        
+        columns = [column for _, column in EXPORT_COLUMNS]
+        batch_size = current_app.config['EXPORT_BATCH_SIZE']
+        
+        def generate():
+            exported = 0
+            def batches():
+                nonlocal exported
+                for rows in Task.iter_rows(columns, filters=filters, sort_by=sort_by,
+                                           sort_order=sort_order, batch_size=batch_size):
+                    exported += len(rows)
+                    record_rows(len(rows))
+                    yield rows
+            
+            if export_format == 'csv':
+                yield from encoder(batches(), [header for header, _ in EXPORT_COLUMNS])
+            else:
+                yield from encoder(batches(), columns)
+            logger.info(f"Exported {exported} tasks as {export_format}")
+        
         return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=tasks_export.csv'}
+            stream_with_context(generate()),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename=tasks_export.{extension}'}
         )
     
     except Exception as e:
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from config.config import Config
+
+def make_config(database_uri, **overrides):
+    """Test config bound to ``database_uri``; keyword arguments override settings"""
+    return type('TestConfig', (Config,), {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': database_uri,
+        'SQLALCHEMY_ENGINE_OPTIONS': {},
+        'REPLICA_DATABASE_URIS': '',
+        'DB_CREATE_ON_STARTUP': True,
+        'TASK_LIST_CACHE_BACKEND': 'none',
+        'STATS_CACHE_TTL': 0,
+        **overrides,
+    })
+
+@pytest.fixture
+def app(tmp_path):
+    from app import create_app
+    return create_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db')))
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
\ No newline at end of file
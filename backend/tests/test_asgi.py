@@ -0,0 +1,125 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip('starlette')
+pytest.importorskip('aiosqlite')
+
+from starlette.testclient import TestClient
+
+from conftest import make_config
+
+ORIGIN = 'http://localhost:3000'
+
+@pytest.fixture
+def asgi_app(tmp_path):
+    from asgi import create_asgi_app
+
+    app = create_asgi_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db')))
+    # Created through Flask so the task counters and change version are maintained
+    created = app.app.flask_app.test_client().post('/api/tasks', json={
+        'entity_name': 'Acme Corporation', 'task_type': 'Call', 'time': '10:30', 'contact_person': 'Jon Snow',
+        'date': date.today().isoformat(), 'status': 'Open', 'priority': 'Medium'
+    })
+    assert created.status_code == 201
+    return app
+
+@pytest.fixture
+def flask_requests(asgi_app, monkeypatch):
+    """Paths of the requests passed on to the Flask app"""
+    reads = asgi_app.app
+    seen = []
+    wsgi = reads.wsgi
+
+    async def record(scope, receive, send):
+        seen.append(scope['path'])
+        await wsgi(scope, receive, send)
+
+    monkeypatch.setattr(reads, 'wsgi', record)
+    return seen
+
+@pytest.fixture
+def client(asgi_app):
+    with TestClient(asgi_app) as client:
+        yield client
+
+def test_async_reads_keep_cors_server_timing_and_metrics(client, flask_requests):
+    listing = client.get('/api/tasks', headers={'Origin': ORIGIN})
+    task = client.get('/api/tasks/1', headers={'Origin': ORIGIN})
+    missing = client.get('/api/tasks/999')
+
+    assert flask_requests == []
+    assert listing.status_code == 200
+    assert [item['entity_name'] for item in listing.json()['tasks']] == ['Acme Corporation']
+    assert listing.headers['access-control-allow-origin'] == ORIGIN
+    assert 'desc="2 queries"' in listing.headers['server-timing']
+    assert task.json()['contact_person'] == 'Jon Snow'
+    assert task.headers['access-control-allow-origin'] == ORIGIN
+    assert missing.status_code == 404
+    assert missing.json() == {'error': 'Task not found'}
+
+    scrape = client.get('/metrics').text
+    assert 'http_requests_total{route="/api/tasks",method="GET",status="200"} 1' in scrape
+    assert 'http_requests_total{route="/api/tasks/<int:task_id>",method="GET",status="404"} 1' in scrape
+
+def test_other_requests_reach_flask_with_cors(client, flask_requests):
+    preflight = client.options('/api/tasks', headers={
+        'Origin': ORIGIN, 'Access-Control-Request-Method': 'POST', 'Access-Control-Request-Headers': 'content-type'
+    })
+    created = client.post('/api/tasks', headers={'Origin': ORIGIN}, json={
+        'entity_name': 'Globex', 'task_type': 'Meeting', 'time': '09:00', 'contact_person': 'Arya Stark'
+    })
+    cursor_page = client.get('/api/tasks?pagination=cursor')
+
+    assert preflight.status_code == 200
+    assert preflight.headers['access-control-allow-origin'] == ORIGIN
+    assert created.status_code == 201
+    assert created.headers['access-control-allow-origin'] == ORIGIN
+    assert cursor_page.status_code == 200
+    assert flask_requests == ['/api/tasks', '/api/tasks']
+
+def test_failed_async_read_is_served_by_flask(client, flask_requests, asgi_app, monkeypatch):
+    async def broken(request):
+        raise RuntimeError('async driver failure')
+
+    monkeypatch.setattr(asgi_app.app, 'task_stats', broken)
+    response = client.get('/api/tasks/stats')
+
+    assert response.status_code == 200
+    assert response.json()['total_tasks'] == 1
+    assert flask_requests == ['/api/tasks/stats']
+
+@pytest.mark.parametrize('path', ['/api/tasks', '/api/tasks?status=Open&sort_by=entity_name', '/api/tasks/1',
+                                  '/api/tasks/stats'])
+def test_async_reads_match_flask_validators(client, flask_requests, asgi_app, path):
+    flask_client = asgi_app.app.flask_app.test_client()
+    served = client.get(path)
+    expected = flask_client.get(path)
+
+    assert flask_requests == []
+    assert served.status_code == expected.status_code == 200
+    assert served.json() == expected.get_json()
+    for header in ('ETag', 'Last-Modified', 'Cache-Control'):
+        assert served.headers.get(header) == expected.headers.get(header)
+
+    # Validators from either entry point revalidate on the other
+    assert client.get(path, headers={'If-None-Match': expected.headers['ETag']}).status_code == 304
+    assert flask_client.get(path, headers={'If-None-Match': served.headers['ETag']}).status_code == 304
+    assert client.get(path, headers={'If-Modified-Since': expected.headers['Last-Modified']}).status_code == 304
+
+def test_async_stats_follow_writes(tmp_path):
+    from asgi import create_asgi_app
+
+    app = create_asgi_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db'), STATS_CACHE_TTL=300))
+    with TestClient(app) as client:
+        before = client.get('/api/tasks/stats')
+        created = client.post('/api/tasks', json={
+            'entity_name': 'Globex', 'task_type': 'Meeting', 'time': '09:00', 'contact_person': 'Arya Stark'
+        })
+        after = client.get('/api/tasks/stats', headers={'If-None-Match': before.headers['ETag']})
+
+    assert before.json()['total_tasks'] == 0
+    assert created.status_code == 201
+    assert after.status_code == 200
+    assert after.json()['total_tasks'] == 1
+    assert after.headers['ETag'] != before.headers['ETag']
\ No newline at end of file
@@ -0,0 +1,62 @@
+def task_payload(**overrides):
+    return {
+        'entity_name': 'Acme Corporation',
+        'task_type': 'Call',
+        'time': '10:30',
+        'contact_person': 'Jon Snow',
+        'date': '2024-01-15',
+        **overrides,
+    }
+
+def test_bulk_create_reports_wrongly_typed_items(client):
+    response = client.post('/api/tasks/bulk', json={'tasks': [
+        task_payload(),
+        task_payload(entity_name=5, time=1000),
+        task_payload(contact_person='Arya Stark'),
+    ]})
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body['created_count'] == 2
+    assert body['error_count'] == 1
+    assert body['errors'][0].startswith('Task 2: ')
+    assert [task['contact_person'] for task in body['created_tasks']] == ['Jon Snow', 'Arya Stark']
+
+def test_bulk_create_rejects_batch_without_valid_items(client):
+    response = client.post('/api/tasks/bulk', json={'tasks': [task_payload(time=1000)]})
+
+    assert response.status_code == 400
+    assert response.get_json()['errors'][0].startswith('Task 1: ')
+
+def test_bulk_selection_rejects_wrongly_typed_values(client):
+    for selection in ({'filters': {'q': 5}}, {'filters': {'date': 20240101}}, {'ids': [True]}):
+        response = client.patch('/api/tasks/bulk/status', json={**selection, 'status': 'Closed'})
+
+        assert response.status_code == 400
+
+def test_bulk_update_chunks_explicit_ids(tmp_path):
+    from sqlalchemy import event
+
+    from app import create_app
+    from conftest import make_config
+    from models import db
+
+    app = create_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db'), BULK_UPDATE_CHUNK_SIZE=2))
+    client = app.test_client()
+    ids = [task['id'] for task in client.post('/api/tasks/bulk', json={
+        'tasks': [task_payload(entity_name=f'Company {n}') for n in range(5)]
+    }).get_json()['created_tasks']]
+
+    updates = []
+    with app.app_context():
+        @event.listens_for(db.engine, 'before_cursor_execute')
+        def count_updates(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('UPDATE tasks '):
+                updates.append(statement)
+
+    response = client.patch('/api/tasks/bulk/status', json={'ids': ids, 'status': 'Closed'})
+
+    assert response.get_json()['updated_count'] == 5
+    assert len(updates) == 3
+    statuses = {task['status'] for task in client.get('/api/tasks').get_json()['tasks']}
+    assert statuses == {'Closed'}
\ No newline at end of file
@@ -0,0 +1,26 @@
+from conftest import make_config
+
+from utils.change_feed import max_stream_subscribers
+
+def test_streams_use_at_most_half_the_worker_threads():
+    assert max_stream_subscribers({'CHANGE_FEED_MAX_SUBSCRIBERS': 100, 'GUNICORN_THREADS': 4}) == 2
+    assert max_stream_subscribers({'CHANGE_FEED_MAX_SUBSCRIBERS': 1, 'GUNICORN_THREADS': 8}) == 1
+    assert max_stream_subscribers({'CHANGE_FEED_MAX_SUBSCRIBERS': 100, 'GUNICORN_THREADS': 1}) == 0
+    # The development server has no fixed thread pool
+    assert max_stream_subscribers({'CHANGE_FEED_MAX_SUBSCRIBERS': 100}) == 100
+
+def test_change_feed_refuses_streams_beyond_the_thread_share(tmp_path):
+    from app import create_app
+    app = create_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db'), GUNICORN_THREADS=4))
+    client = app.test_client()
+
+    streams = [client.get('/api/tasks/changes') for _ in range(2)]
+    assert [stream.status_code for stream in streams] == [200, 200]
+    assert client.get('/api/tasks/changes').status_code == 503
+
+    # Closing a stream frees its slot
+    streams[0].close()
+    streams[0] = client.get('/api/tasks/changes')
+    assert streams[0].status_code == 200
+    for stream in streams:
+        stream.close()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import pytest
+
+from routes.task_routes import VALID_SORT_FIELDS
+
+PER_PAGE = 3
+
+def task_payload(n):
+    return {
+        'entity_name': f'Company {n % 4}',
+        'task_type': ('Meeting', 'Call', 'Video Call')[n % 3],
+        'date': f'2024-01-{n % 5 + 10}',
+        'time': f'{9 + n % 2}:30',
+        'contact_person': ('Jon Snow', 'Arya Stark')[n % 2],
+        'status': ('Open', 'Closed')[n % 2],
+        'priority': ('Low', 'Medium', 'High')[n % 3],
+        # Every third task has no due date
+        'due_date': f'2024-02-{n % 4 + 10}' if n % 3 else None,
+    }
+
+@pytest.fixture
+def task_ids(client):
+    response = client.post('/api/tasks/bulk', json={'tasks': [task_payload(n) for n in range(14)]})
+    assert response.status_code == 201
+    return [task['id'] for task in response.get_json()['created_tasks']]
+
+def cursor_pages(client, sort_by, sort_order, per_page):
+    """Ids of every page, following next_cursor from the first page"""
+    params = {'pagination': 'cursor', 'sort_by': sort_by, 'sort_order': sort_order, 'per_page': per_page}
+    pages = []
+    while True:
+        response = client.get('/api/tasks', query_string=params)
+        assert response.status_code == 200
+        body = response.get_json()
+        pages.append([task['id'] for task in body['tasks']])
+        if not body['pagination']['has_next']:
+            return pages
+        params = {**params, 'cursor': body['pagination']['next_cursor']}
+        params.pop('pagination', None)
+
+@pytest.mark.parametrize('sort_order', ['asc', 'desc'])
+@pytest.mark.parametrize('sort_by', VALID_SORT_FIELDS)
+def test_cursor_pages_return_every_task_once(client, task_ids, sort_by, sort_order):
+    pages = cursor_pages(client, sort_by, sort_order, PER_PAGE)
+    paged = [task_id for page in pages for task_id in page]
+
+    assert sorted(paged) == sorted(task_ids)
+    assert all(len(page) == PER_PAGE for page in pages[:-1])
+    # Pages continue the order of a single page holding every task
+    assert paged == cursor_pages(client, sort_by, sort_order, 100)[0]
\ No newline at end of file
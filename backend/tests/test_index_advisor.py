@@ -0,0 +1,38 @@
+from utils.index_advisor import ShapeRecorder, drop_index_sql, shape_recorder, suggest_indexes
+
+def test_listing_rejects_unknown_sort_order_before_recording(client):
+    shape_recorder.clear()
+
+    assert client.get('/api/tasks?sort_order=sideways').status_code == 400
+    assert client.get('/api/tasks/export?sort_order=sideways').status_code == 400
+    assert client.get('/api/tasks?sort_order=DESC').status_code == 200
+
+    assert [(shape['sort_order'], shape['count']) for shape in shape_recorder.shapes()] == [('desc', 1)]
+    shape_recorder.clear()
+
+def test_recorder_keeps_at_most_max_shapes():
+    recorder = ShapeRecorder(max_shapes=2)
+    for sort_by in ('date', 'status', 'priority', 'date'):
+        recorder.record({}, sort_by, 'asc')
+
+    assert [(shape['sort_by'], shape['count']) for shape in recorder.shapes()] == [('date', 2), ('status', 1)]
+    assert recorder.dropped == 1
+
+def test_drop_index_matches_the_dialect():
+    assert drop_index_sql('idx_priority', 'mysql') == 'DROP INDEX idx_priority ON tasks;'
+    assert drop_index_sql('idx_priority', 'sqlite') == 'DROP INDEX idx_priority;'
+
+def test_indexes_serving_other_queries_are_not_unused():
+    shapes = [{'filters': ['task_type'], 'sort_by': 'due_date', 'sort_order': 'asc', 'count': 5}]
+    existing = {
+        'idx_task_type': ['task_type'],
+        'idx_priority': ['priority'],
+        # flask archive-tasks and day exports
+        'idx_status': ['status'],
+        'idx_task_date_status': ['date', 'status'],
+    }
+
+    suggested, unused = suggest_indexes(shapes, existing)
+
+    assert [index['columns'] for index in suggested] == [['task_type', 'due_date']]
+    assert unused == ['idx_priority']
\ No newline at end of file
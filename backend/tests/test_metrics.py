@@ -0,0 +1,18 @@
+import threading
+
+from utils.metrics import MetricsRegistry
+
+def test_finished_threads_do_not_keep_their_shards():
+    registry = MetricsRegistry()
+
+    for _ in range(50):
+        threads = [threading.Thread(target=registry.inc, args=('requests_total',)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    counters, _ = registry.collect()
+
+    assert counters[('requests_total', ())] == 200
+    assert registry._shards == []
\ No newline at end of file
@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+def test_failed_statements_do_not_leak_start_times(app):
+    from models import db
+
+    with app.app_context():
+        with db.engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.exec_driver_sql('SELECT * FROM missing_table')
+            connection.exec_driver_sql('SELECT 1')
+
+            assert connection.info['query_start'] == []
+
+def test_slow_query_log_truncates_statements(tmp_path, monkeypatch, caplog):
+    from app import create_app
+    from conftest import make_config
+    from utils import profiling
+
+    monkeypatch.setattr(profiling, 'MAX_LOGGED_STATEMENT', 20)
+    app = create_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db'), SLOW_QUERY_MS=0))
+
+    with caplog.at_level('WARNING', logger='slow_queries'):
+        assert app.test_client().get('/api/tasks').status_code == 200
+
+    statements = [record.getMessage().split(' statement=')[1].split(' params=')[0] for record in caplog.records]
+    assert statements
+    assert all(len(statement) <= 23 for statement in statements)
+    assert any(statement.endswith('...') for statement in statements)
\ No newline at end of file
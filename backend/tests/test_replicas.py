@@ -0,0 +1,69 @@
+import time
+from datetime import date
+
+import pytest
+
+from conftest import make_config
+
+from utils.replicas import STICKY_HEADER
+
+def task_payload(entity_name):
+    return {'entity_name': entity_name, 'task_type': 'Call', 'time': '10:30', 'contact_person': 'Jon Snow',
+            'status': 'Open', 'priority': 'Medium'}
+
+def task_row(entity_name):
+    return {**task_payload(entity_name), 'date': date.today()}
+
+def make_app(tmp_path, replica_uri):
+    from app import create_app
+    return create_app(make_config('sqlite:///' + str(tmp_path / 'primary.db'), REPLICA_DATABASE_URIS=replica_uri))
+
+@pytest.fixture
+def app(tmp_path):
+    """A primary and a replica that has not caught up: each holds a different task"""
+    from models import db
+    from models.task import Task
+
+    app = make_app(tmp_path, 'sqlite:///' + str(tmp_path / 'replica.db'))
+    with app.app_context():
+        replica = db.engines['replica_0']
+        db.metadata.create_all(replica)
+        with replica.begin() as connection:
+            connection.execute(Task.__table__.insert(), [task_row('Replica Co')])
+        db.session.execute(Task.__table__.insert(), [task_row('Primary Co')])
+        db.session.commit()
+    return app
+
+def listed_entities(response):
+    assert response.status_code == 200
+    return [task['entity_name'] for task in response.get_json()['tasks']]
+
+def test_reads_go_to_the_replica(client):
+    assert listed_entities(client.get('/api/tasks')) == ['Replica Co']
+
+def test_writes_go_to_the_primary_and_open_a_sticky_window(client):
+    response = client.post('/api/tasks', json=task_payload('New Co'), headers={'Origin': 'http://localhost:3000'})
+
+    assert response.status_code == 201
+    until = int(response.headers[STICKY_HEADER])
+    assert time.time() < until <= time.time() + 5
+    # The cross-origin frontend can only read the header when CORS exposes it
+    assert STICKY_HEADER in response.headers['Access-Control-Expose-Headers']
+
+    sticky = client.get('/api/tasks', headers={STICKY_HEADER: str(until)})
+    assert sorted(listed_entities(sticky)) == ['New Co', 'Primary Co']
+    # Clients that did not write keep reading the replica
+    assert listed_entities(client.get('/api/tasks')) == ['Replica Co']
+
+def test_expired_or_forged_windows_read_the_replica(client):
+    for value in (str(int(time.time()) - 1), str(int(time.time()) + 3600), 'soon'):
+        assert listed_entities(client.get('/api/tasks', headers={STICKY_HEADER: value})) == ['Replica Co']
+
+def test_unreachable_replica_falls_back_to_the_primary(tmp_path):
+    app = make_app(tmp_path, 'sqlite:///' + str(tmp_path / 'missing' / 'replica.db'))
+    client = app.test_client()
+
+    # The failing request takes the replica out of rotation and is answered by the primary
+    assert client.get('/api/tasks').status_code == 200
+    assert app.extensions['replica_router'].status() == {'replica_0': 'down'}
+    assert client.get('/api/tasks').status_code == 200
\ No newline at end of file
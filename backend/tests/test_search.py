@@ -0,0 +1,45 @@
+def task_payload(entity_name, contact_person, note=None):
+    return {'entity_name': entity_name, 'task_type': 'Call', 'time': '10:30', 'contact_person': contact_person,
+            'note': note}
+
+def searched(client, query):
+    response = client.get('/api/tasks', query_string={'q': query})
+    assert response.status_code == 200
+    return sorted(task['entity_name'] for task in response.get_json()['tasks'])
+
+def test_search_only_returns_tasks_containing_every_word(client):
+    client.post('/api/tasks', json=task_payload('Acme Corporation', 'Jon Snow'))
+    # "sno" and "now" of "snow", but in different fields
+    client.post('/api/tasks', json=task_payload('Snoopy Holdings', 'Arya Stark', 'Let me know'))
+    # "sta", "tar" and "ark" of "stark", spread over other words
+    client.post('/api/tasks', json=task_payload('Startup Partners', 'Mark Tarly'))
+
+    assert searched(client, 'snow') == ['Acme Corporation']
+    assert searched(client, 'stark') == ['Snoopy Holdings']
+    assert searched(client, 'jon snow') == ['Acme Corporation']
+    assert searched(client, 'snow stark') == []
+def test_unranked_search_orders_by_id_without_a_bound_score(app, client):
+    from models import db
+    from models.task import Task
+
+    for entity_name in ('Jo Holdings', 'Acme Corporation', 'Jo Partners'):
+        client.post('/api/tasks', json=task_payload(entity_name, 'Arya Stark'))
+
+    response = client.get('/api/tasks', query_string={'q': 'jo'})
+    assert response.status_code == 200
+    assert [task['entity_name'] for task in response.get_json()['tasks']] == ['Jo Partners', 'Jo Holdings']
+
+    with app.app_context():
+        stmt = Task.apply_sort(db.select(Task.id), 'relevance', 'desc', {'q': 'jo'})
+        # MySQL rejects a bound value here (ORDER BY 0 DESC)
+        assert str(stmt).endswith('ORDER BY tasks.id DESC')
+
+def test_archived_tasks_match_words_like_live_ones(client):
+    live_id = client.post('/api/tasks', json=task_payload('Acme Corporation', 'Jon Snow')).get_json()['id']
+    archived_id = client.post('/api/tasks', json=task_payload('Globex', 'Jon Snow')).get_json()['id']
+    client.delete('/api/tasks/bulk', json={'ids': [archived_id], 'archive': True})
+
+    response = client.get('/api/tasks', query_string={'q': 'snow jon', 'include_archived': 'true', 'sort_by': 'id'})
+    assert response.status_code == 200
+    assert sorted((task['id'], task['archived']) for task in response.get_json()['tasks']) == \
+        [(live_id, False), (archived_id, True)]
\ No newline at end of file
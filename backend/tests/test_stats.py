@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from conftest import make_config
+
+@pytest.fixture
+def app(tmp_path):
+    from app import create_app
+    from utils.cache import stats_cache
+
+    stats_cache.clear()
+    yield create_app(make_config('sqlite:///' + str(tmp_path / 'tasks.db'), STATS_CACHE_TTL=300))
+    stats_cache.clear()
+
+def add_task_elsewhere(app, entity_name):
+    """Write as another worker would: its own session, and no cache invalidation in this process"""
+    from models import db
+    from models.task import Task
+
+    with app.app_context(), Session(db.engine) as session:
+        session.add(Task(entity_name=entity_name, task_type='Call', time='10:30', contact_person='Jon Snow',
+                         date=date.today()))
+        session.commit()
+
+def test_stats_follow_writes_from_other_workers(app, client):
+    add_task_elsewhere(app, 'Acme Corporation')
+    first = client.get('/api/tasks/stats')
+    assert first.get_json()['total_tasks'] == 1
+
+    add_task_elsewhere(app, 'Globex')
+    revalidated = client.get('/api/tasks/stats', headers={'If-None-Match': first.headers['ETag']})
+
+    assert revalidated.status_code == 200
+    assert revalidated.headers['ETag'] != first.headers['ETag']
+    assert revalidated.get_json()['total_tasks'] == 2
+    again = client.get('/api/tasks/stats', headers={'If-None-Match': revalidated.headers['ETag']})
+    assert again.status_code == 304
\ No newline at end of file
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+def task_payload(entity_name):
+    return {'entity_name': entity_name, 'task_type': 'Call', 'time': '10:30', 'contact_person': 'Jon Snow'}
+
+def sync(client, token=None, limit=100):
+    response = client.get('/api/tasks/sync', query_string={'limit': limit, **({'since': token} if token else {})})
+    assert response.status_code == 200
+    return response.get_json()
+
+def sync_all(client, mirror, token=None, limit=100):
+    """Apply batches to mirror until has_more is false; the token to resume from"""
+    while True:
+        batch = sync(client, token, limit)
+        mirror.update((task['id'], task) for task in batch['tasks'])
+        for deleted in batch['deleted']:
+            mirror.pop(deleted['id'], None)
+        token = batch['next']
+        if not batch['has_more']:
+            return token
+
+def test_full_sync_then_deltas_mirror_the_tasks(client):
+    ids = [client.post('/api/tasks', json=task_payload(f'Entity {i}')).get_json()['id'] for i in range(5)]
+    mirror = {}
+    token = sync_all(client, mirror, limit=2)
+    assert sorted(mirror) == ids
+
+    created = client.post('/api/tasks', json=task_payload('Globex')).get_json()['id']
+    client.put(f'/api/tasks/{ids[0]}', json={'note': 'Renewal'})
+    client.delete(f'/api/tasks/{ids[1]}')
+    client.delete('/api/tasks/bulk', json={'ids': [ids[2]], 'archive': True})
+    token = sync_all(client, mirror, token)
+
+    assert sorted(mirror) == [ids[0], ids[3], ids[4], created]
+    assert mirror[ids[0]]['note'] == 'Renewal'
+    caught_up = sync(client, token)
+    assert (caught_up['tasks'], caught_up['deleted'], caught_up['has_more']) == ([], [], False)
+
+def test_cursor_does_not_depend_on_updated_at(app, client):
+    from models import db
+
+    task_id = client.post('/api/tasks', json=task_payload('Acme')).get_json()['id']
+    token = sync_all(client, {})
+    client.put(f'/api/tasks/{task_id}', json={'note': 'Stamped before commit'})
+    with app.app_context():
+        # A transaction that stamped updated_at long before it committed
+        db.session.execute(db.text('UPDATE tasks SET updated_at = :stamp'), {'stamp': datetime(2000, 1, 1)})
+        db.session.commit()
+
+    batch = sync(client, token)
+    assert [task['note'] for task in batch['tasks']] == ['Stamped before commit']
+
+def test_id_gap_holds_back_later_changes(app, client):
+    from models import db
+    from models.task_change import TaskChange, change_row, latest_change_id
+
+    task_id = client.post('/api/tasks', json=task_payload('Acme')).get_json()['id']
+    token = sync_all(client, {})
+    with app.app_context():
+        # The next id is taken by a transaction that has not committed yet
+        gap_id = latest_change_id() + 1
+        db.session.execute(TaskChange.__table__.insert(), [dict(change_row('update', task_id), id=gap_id + 1)])
+        db.session.commit()
+
+    assert sync(client, token)['tasks'] == []
+
+    with app.app_context():
+        db.session.execute(TaskChange.__table__.update().values(changed_at=datetime.utcnow() - timedelta(minutes=1)))
+        db.session.commit()
+    # Past CHANGE_FEED_GAP_SECONDS the gap is taken to be a rollback
+    assert [task['id'] for task in sync(client, token)['tasks']] == [task_id]
\ No newline at end of file
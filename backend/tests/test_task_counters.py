@@ -0,0 +1,47 @@
+from models import db
+from models.task_counter import COUNTER_STATS_QUERY, rebuild_task_counters
+
+def task_payload(n, **overrides):
+    return {
+        'entity_name': f'Company {n}',
+        'task_type': ('Meeting', 'Call', 'Video Call')[n % 3],
+        'date': '2024-01-15',
+        'time': '10:30',
+        'contact_person': 'Jon Snow',
+        'status': ('Open', 'In Progress', 'Closed')[n % 3],
+        'priority': ('Low', 'Medium', 'High')[n % 3],
+        'due_date': f'2024-02-{n % 5 + 10}' if n % 2 else None,
+        **overrides,
+    }
+
+def counter_rows():
+    return {(dimension, value): count for dimension, value, count in db.session.execute(COUNTER_STATS_QUERY)
+            if count}
+
+def test_counters_match_a_rebuild_after_mixed_writes(app, client):
+    single_ids = [client.post('/api/tasks', json=task_payload(n)).get_json()['id'] for n in range(4)]
+    bulk_ids = [task['id'] for task in client.post('/api/tasks/bulk', json={
+        'tasks': [task_payload(n) for n in range(4, 16)]
+    }).get_json()['created_tasks']]
+
+    writes = [
+        client.put(f'/api/tasks/{single_ids[0]}', json={'status': 'Closed', 'priority': 'High'}),
+        client.put(f'/api/tasks/{single_ids[1]}', json={'date': '2024-03-01', 'due_date': '2024-02-01'}),
+        client.put(f'/api/tasks/{single_ids[2]}', json={'due_date': None, 'task_type': 'Call'}),
+        client.patch(f'/api/tasks/{single_ids[3]}/status', json={'status': 'Open'}),
+        client.patch('/api/tasks/bulk', json={'ids': bulk_ids[:5],
+                                              'updates': {'priority': 'Low', 'due_date': '2024-02-20'}}),
+        client.patch('/api/tasks/bulk', json={'filters': {'task_type': 'Meeting'}, 'updates': {'status': 'Open'}}),
+        client.patch('/api/tasks/bulk/status', json={'ids': bulk_ids[3:8], 'status': 'Closed'}),
+        client.delete(f'/api/tasks/{single_ids[1]}'),
+        client.delete('/api/tasks/bulk', json={'ids': bulk_ids[8:10]}),
+        client.delete('/api/tasks/bulk', json={'filters': {'status': 'Closed'}, 'archive': True}),
+    ]
+    assert [response.status_code for response in writes] == [200] * len(writes)
+
+    with app.app_context():
+        maintained = counter_rows()
+        rebuild_task_counters()
+        assert maintained == counter_rows()
+        assert sum(count for (dimension, _), count in maintained.items() if dimension == 'status') == \
+            client.get('/api/tasks').get_json()['pagination']['total']
\ No newline at end of file
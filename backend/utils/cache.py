@@ -0,0 +1,161 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """Small thread-safe in-process cache whose entries expire after a TTL"""
+    
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+    
+    def set(self, key, value, ttl):
+        """Cache a value for ttl seconds; a non-positive ttl disables caching"""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class LRUCache:
+    """Thread-safe in-process cache bounded to max_entries, evicting the least recently used"""
+    
+    local = True
+    
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def set(self, key, value, ttl):
+        """Cache a value for ttl seconds; a non-positive ttl disables caching"""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        with self._lock:
+            return {'backend': 'memory', 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'entries': len(self._entries),
+                    'max_entries': self.max_entries}
+
+class RedisCache:
+    """Cache backed by a Redis-compatible client shared by every worker.
+    
+    Only ``get``, ``set(name, value, ex=...)`` and ``scan_iter``/``delete``
+    are used, so any stand-in client with that interface works. Redis evicts
+    on its own (maxmemory policy), so evictions are not counted here.
+    """
+    
+    local = False
+    
+    def __init__(self, client, prefix='tasks:list:'):
+        self.client = client
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+    
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+    
+    def set(self, key, value, ttl):
+        if ttl > 0:
+            self.client.set(self.prefix + key, value, ex=ttl)
+    
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+    
+    def stats(self):
+        with self._lock:
+            return {'backend': 'redis', 'hits': self.hits, 'misses': self.misses}
+
+def create_list_cache(config):
+    """Build the task list cache backend selected by TASK_LIST_CACHE_BACKEND"""
+    backend = config.get('TASK_LIST_CACHE_BACKEND', 'memory')
+    if backend == 'redis':
+        try:
+            import redis
+            return RedisCache(redis.Redis.from_url(config['REDIS_URL']))
+        except ImportError:
+            logger.warning("redis is not installed; using the in-process task list cache")
+    elif backend == 'none':
+        return LRUCache(max_entries=0)
+    return LRUCache(max_entries=config.get('TASK_LIST_CACHE_MAX_ENTRIES', 1024))
+
+def init_task_list_cache(app):
+    app.extensions['task_list_cache'] = create_list_cache(app.config)
+
+def get_task_list_cache():
+    return current_app.extensions['task_list_cache']
+
+# Dashboard statistics, keyed on the stats ETag: the tasks change version and the date
+# used for the overdue calculation. Writes by other workers bump the version, so an
+# entry computed before them is never served under the new ETag.
+stats_cache = LRUCache(max_entries=16)
+
+# Listing totals for the 'cached' count strategy, keyed on the normalized filters.
+# Deliberately not cleared on writes: totals may lag by up to TASK_COUNT_CACHE_TTL.
+count_cache = TTLCache()
+
+def invalidate_task_caches():
+    """Drop cached task data after a write; call once the write is committed
+    
+    List cache keys embed the tasks change version, which every write bumps,
+    so stale entries can no longer be hit; the in-process cache is also
+    emptied to give the memory back. Shared (Redis) entries age out by TTL.
+    """
+    stats_cache.clear()
+    list_cache = current_app.extensions.get('task_list_cache')
+    if list_cache is not None and list_cache.local:
+        list_cache.clear()
@@ -0,0 +1,212 @@
+import json
+import logging
+import queue
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds browsers wait before reconnecting a dropped stream
+RETRY_MS = 3000
+
+class Subscriber:
+    """One change feed client: a bounded queue of change batches from the broadcaster"""
+
+    def __init__(self, position, max_pending):
+        # Last change id published before this client subscribed
+        self.position = position
+        self.queue = queue.Queue(max_pending)
+        self.overflowed = False
+
+    def publish(self, changes):
+        try:
+            self.queue.put_nowait(changes)
+        except queue.Full:
+            # The stream ends and the client resumes from the log instead of holding memory here
+            self.overflowed = True
+
+class ChangeBroadcaster:
+    """Fans task_changes rows out to every change feed client of this process.
+
+    A single background thread reads the log for all subscribers, so the
+    database sees one query per poll regardless of how many clients are
+    connected (and none while nobody listens). Writes committed by this
+    process wake the poller immediately; writes from other workers arrive
+    within ``poll_interval``. Ids are published in order: an id gap (a
+    transaction that took a lower id but has not committed yet) holds back
+    the rows after it for up to ``gap_timeout`` seconds, after which the
+    gap is treated as a rollback.
+    """
+
+    def __init__(self, app, poll_interval=1.0, gap_timeout=2.0, batch_size=500, max_pending=100,
+                 max_subscribers=100):
+        self.app = app
+        self.poll_interval = poll_interval
+        self.gap_timeout = gap_timeout
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_subscribers = max_subscribers
+        self.position = 0
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._gap_since = None
+
+    def subscribe(self):
+        """Register a client, or return None when the process is at max_subscribers"""
+        from models.task_change import latest_change_id
+
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            if self._thread is None:
+                self.position = latest_change_id()
+                self._gap_since = None
+                self._thread = threading.Thread(target=self._run, name='task-change-feed', daemon=True)
+                self._thread.start()
+            subscriber = Subscriber(self.position, self.max_pending)
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def notify(self):
+        """Poll now: a write was committed by this process"""
+        self._wake.set()
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            with self._lock:
+                if not self._subscribers:
+                    # Stop polling; the next subscriber restarts the thread
+                    self._thread = None
+                    return
+            try:
+                while self._poll():
+                    pass
+            except Exception as e:
+                logger.error(f"Error polling task changes: {str(e)}")
+
+    def _poll(self):
+        """Publish new changes; True when a full batch was read and more may be waiting"""
+        from models.task_change import get_changes_after
+
+        with self.app.app_context():
+            rows = get_changes_after(self.position, self.batch_size)
+            changes = self._ready(rows)
+            if not changes:
+                return False
+            with self._lock:
+                self.position = changes[-1]['id']
+                subscribers = list(self._subscribers)
+            for subscriber in subscribers:
+                subscriber.publish(changes)
+            return len(rows) == self.batch_size and len(changes) == len(rows)
+
+    def _ready(self, rows):
+        """Leading rows that can be published without skipping an uncommitted id"""
+        ready = []
+        expected = self.position + 1
+        for row in rows:
+            if row.id != expected:
+                now = time.monotonic()
+                if self._gap_since is None:
+                    self._gap_since = now
+                if now - self._gap_since < self.gap_timeout:
+                    break
+            self._gap_since = None
+            ready.append(row.to_dict())
+            expected = row.id + 1
+        return ready
+
+def format_event(event_name, data, event_id=None):
+    """One server-sent event"""
+    lines = [] if event_id is None else [f'id: {event_id}']
+    lines.append(f'event: {event_name}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+def stream_changes(subscriber, since, replay, reset, heartbeat):
+    """Server-sent events for one client: replayed changes, then live ones.
+
+    A ``reset`` event tells the client its token is too old (pruned or too
+    far behind) and it must refetch; the stream then continues live. When
+    the client falls behind the broadcaster the stream ends, and the
+    browser's reconnect resumes from Last-Event-ID via the log.
+    """
+    yield f'retry: {RETRY_MS}\n\n'
+    if reset:
+        yield format_event('reset', {'position': subscriber.position}, subscriber.position)
+    elif since is None:
+        yield format_event('ready', {'position': subscriber.position}, subscriber.position)
+    for change in replay:
+        yield format_event('change', change, change['id'])
+
+    last_id = max(since or 0, subscriber.position)
+    while not subscriber.overflowed:
+        try:
+            changes = subscriber.queue.get(timeout=heartbeat)
+        except queue.Empty:
+            # Comment line: keeps proxies from timing out and finds clients that went away
+            yield ': keepalive\n\n'
+            continue
+        for change in changes:
+            if change['id'] > last_id:
+                last_id = change['id']
+                yield format_event('change', change, change['id'])
+
+def max_stream_subscribers(config):
+    """Streams one worker may hold open.
+
+    Every stream pins a request thread for as long as the client stays
+    connected, so at most half of a gunicorn worker's threads serve streams
+    and the rest stay free for API requests. Without GUNICORN_THREADS (the
+    development server starts a thread per request) the configured cap applies.
+    """
+    limit = config['CHANGE_FEED_MAX_SUBSCRIBERS']
+    threads = config.get('GUNICORN_THREADS')
+    if threads:
+        limit = min(limit, threads // 2)
+    return limit
+
+def init_change_feed(app):
+    max_subscribers = max_stream_subscribers(app.config)
+    if max_subscribers < 1:
+        logger.warning("Change feed disabled: a worker needs at least 2 threads to serve streams")
+    app.extensions['change_broadcaster'] = ChangeBroadcaster(
+        app,
+        poll_interval=app.config['CHANGE_FEED_POLL_SECONDS'],
+        gap_timeout=app.config['CHANGE_FEED_GAP_SECONDS'],
+        max_pending=app.config['CHANGE_FEED_MAX_PENDING'],
+        max_subscribers=max_subscribers
+    )
+
+def get_change_broadcaster():
+    return current_app.extensions['change_broadcaster']
+
+@event.listens_for(Session, 'after_commit')
+def _wake_change_feed(session):
+    from models.task_change import CHANGES_PENDING
+
+    if session.info.pop(CHANGES_PENDING, False) and has_app_context():
+        broadcaster = current_app.extensions.get('change_broadcaster')
+        if broadcaster is not None:
+            broadcaster.notify()
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending_changes(session):
+    from models.task_change import CHANGES_PENDING
+
+    session.info.pop(CHANGES_PENDING, None)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import click
+import logging
+
+logger = logging.getLogger(__name__)
+
+def register_commands(app):
+    """Register maintenance CLI commands for the Flask app"""
+    
+    @app.cli.command('init-db')
+    @click.option('--seed', is_flag=True, help='Insert the sample tasks if the tasks table is empty')
+    def init_db_command(seed):
+        """Create missing tables (run once per deploy, not per worker)"""
+        from utils.database import init_database
+        seeded = init_database(seed=seed)
+        click.echo("Database initialized" + (" with sample data" if seeded else ""))
+    
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index_command():
+        """Add the MySQL FULLTEXT search index to a tasks table created without it"""
+        from models.search import rebuild_search_index
+        if rebuild_search_index():
+            logger.info("Search index ft_task_search added")
+            click.echo("Search index added")
+        else:
+            click.echo("Nothing to do: the index exists, or the database has no FULLTEXT search")
+    
+    @app.cli.command('rebuild-task-counters')
+    def rebuild_task_counters_command():
+        """Rebuild the task_counters summary table from the tasks table"""
+        from models.task_counter import rebuild_task_counters
+        total = rebuild_task_counters()
+        logger.info(f"Task counters rebuilt for {total} tasks")
+        click.echo(f"Task counters rebuilt ({total} tasks counted)")
+    
+    @app.cli.command('archive-tasks')
+    @click.option('--older-than-days', type=int, default=None,
+                  help='Archive tasks finished more than this many days ago (default: ARCHIVE_AFTER_DAYS)')
+    def archive_tasks_command(older_than_days):
+        """Move old closed and cancelled tasks into tasks_archive (run from cron)"""
+        from models.bulk import archive_closed_tasks
+        from utils.cache import invalidate_task_caches
+        if older_than_days is None:
+            older_than_days = app.config['ARCHIVE_AFTER_DAYS']
+        archived = archive_closed_tasks(older_than_days, chunk_size=app.config['BULK_DELETE_CHUNK_SIZE'])
+        invalidate_task_caches()
+        logger.info(f"Archived {archived} tasks older than {older_than_days} days")
+        click.echo(f"Archived {archived} tasks finished more than {older_than_days} days ago")
+    
+    @app.cli.command('prune-task-changes')
+    @click.option('--older-than-days', type=int, default=None,
+                  help='Delete change log rows older than this (default: CHANGE_LOG_RETENTION_DAYS)')
+    def prune_task_changes_command(older_than_days):
+        """Trim the task change log behind /api/tasks/changes (run from cron)"""
+        from models.task_change import prune_task_changes
+        if older_than_days is None:
+            older_than_days = app.config['CHANGE_LOG_RETENTION_DAYS']
+        removed = prune_task_changes(older_than_days, chunk_size=app.config['BULK_DELETE_CHUNK_SIZE'])
+        logger.info(f"Pruned {removed} task changes older than {older_than_days} days")
+        click.echo(f"Pruned {removed} task changes older than {older_than_days} days")
+    
+    @app.cli.command('advise-indexes')
+    @click.option('--shapes', 'shapes_file', type=click.File('r'), required=True,
+                  help='JSON saved from GET /api/tasks/index-advice (or a list of its shapes)')
+    @click.option('--output', type=click.File('w'), default='-', help='Where to write the migration SQL')
+    @click.option('--drop-unused', is_flag=True, help='Emit DROP INDEX for indexes no shape uses')
+    def advise_indexes_command(shapes_file, output, drop_unused):
+        """EXPLAIN recorded listing shapes and write a migration for covering indexes"""
+        import json
+        from utils.index_advisor import advise
+        shapes = json.load(shapes_file)
+        if isinstance(shapes, dict):
+            shapes = shapes['shapes']
+        report = advise(shapes, include_drops=drop_unused)
+        for shape in report['shapes']:
+            plan = shape['plan']
+            flags = [label for label, flag in (('full scan', plan['full_scan']), ('filesort', plan['filesort'])) if flag]
+            click.echo(f"{shape['count']:>8}  filters={','.join(shape['filters']) or '-'} "
+                       f"sort={shape['sort_by']} {shape['sort_order']}  {', '.join(flags) or 'ok'}", err=True)
+        output.write(report['migration'])
+        logger.info(f"Index advice: {len(report['suggested_indexes'])} indexes suggested for {len(shapes)} shapes")
\ No newline at end of file
@@ -0,0 +1,37 @@
+import hashlib
+from flask import Response, request
+from werkzeug.http import http_date
+
+def validator_headers(etag, last_modified):
+    headers = {'ETag': f'W/"{etag}"', 'Cache-Control': 'no-cache'}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified)
+    return headers
+
+def task_etag(version, parts):
+    """ETag for a representation (``parts``) of the tasks table at ``version``"""
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:16]
+    return f'{version}-{digest}'
+
+def conditions_match(if_none_match, if_modified_since, etag, last_modified):
+    """Whether the client's cached copy is current (If-None-Match takes precedence)"""
+    if if_none_match:
+        return if_none_match.contains_weak(etag)
+    return if_modified_since is not None and last_modified is not None and last_modified <= if_modified_since
+
+def check_task_conditions(*parts):
+    """Evaluate conditional request headers for a response built from the tasks table.
+
+    The ETag is the tasks change version plus a digest of ``parts`` (query
+    arguments, ids, dates) identifying the representation. Returns a 304
+    response when the client's copy is still current, otherwise None,
+    together with the validator headers for the full response.
+    """
+    from models.task_counter import get_task_version
+    version, last_modified = get_task_version()
+    etag = task_etag(version, parts)
+    headers = validator_headers(etag, last_modified)
+
+    if conditions_match(request.if_none_match, request.if_modified_since, etag, last_modified):
+        return Response(status=304, headers=headers), headers
+    return None, headers
\ No newline at end of file
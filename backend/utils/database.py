@@ -0,0 +1,22 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+def init_database(seed=False):
+    """Create missing tables and optionally seed the sample tasks.
+    
+    Only the primary is touched; replicas receive the schema through
+    replication. Seeding only happens when the tasks table is empty.
+    Returns True when sample data was inserted.
+    """
+    from models import db
+    from models.task import Task
+    
+    db.create_all(bind_key=None)
+    logger.info("Database schema is up to date")
+    
+    if not seed or db.session.query(Task.id).first() is not None:
+        return False
+    from utils.sample_data import create_sample_data
+    create_sample_data()
+    return True
\ No newline at end of file
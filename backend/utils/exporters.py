@@ -0,0 +1,155 @@
+import csv
+import io
+from datetime import date, datetime
+
+# Columns that are enums in the database and dictionary-encoded in columnar exports
+DICTIONARY_COLUMNS = ('task_type', 'status', 'priority')
+
+def _plain(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def csv_chunks(batches, headers):
+    """Encode row batches as CSV, one chunk per batch"""
+    # One small buffer is reused for every batch so memory stays flat
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    yield buffer.getvalue()
+
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerows(
+            ['' if value is None else _plain(value) for value in row]
+            for row in rows
+        )
+        yield buffer.getvalue()
+
+def ndjson_chunks(batches, columns):
+    """Encode row batches as newline-delimited JSON objects"""
+    from utils.serializers import get_dumps
+    dumps = get_dumps()
+    keys = tuple(column.key for column in columns)
+    for rows in batches:
+        yield b''.join(dumps(dict(zip(keys, row))) + b'\n' for row in rows)
+
+class _ChunkSink:
+    """Write-only file object that hands back what was written since the last drain.
+
+    ``tell`` keeps counting across drains so formats that record offsets
+    (Parquet footers) stay valid while the output is streamed.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readable(self):
+        return False
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def arrow_schema(columns):
+    """Arrow schema for the exported columns, typed from the SQLAlchemy columns"""
+    import pyarrow as pa
+
+    fields = []
+    for column in columns:
+        python_type = column.type.python_type
+        if column.key in DICTIONARY_COLUMNS:
+            arrow_type = pa.dictionary(pa.int8(), pa.string())
+        elif python_type is int:
+            arrow_type = pa.int64()
+        elif python_type is datetime:
+            arrow_type = pa.timestamp('us')
+        elif python_type is date:
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.key, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+def record_batch(rows, columns, schema):
+    """Build an Arrow record batch from a batch of Core rows"""
+    import pyarrow as pa
+
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays = []
+    for column, field, column_values in zip(columns, schema, values):
+        if column.key in DICTIONARY_COLUMNS:
+            # A fixed dictionary of all enum values keeps every batch compatible
+            enums = list(column.type.enums)
+            lookup = {value: index for index, value in enumerate(enums)}
+            indices = pa.array([lookup.get(value) for value in column_values], type=pa.int8())
+            arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(enums, type=pa.string())))
+        else:
+            arrays.append(pa.array(column_values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def arrow_chunks(batches, columns):
+    """Encode row batches as an Arrow IPC stream, one record batch per DB batch"""
+    import pyarrow as pa
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield sink.drain()
+        for rows in batches:
+            writer.write_batch(record_batch(rows, columns, schema))
+            yield sink.drain()
+    yield sink.drain()
+
+def parquet_chunks(batches, columns):
+    """Encode row batches as Parquet, one row group per DB batch"""
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression='snappy') as writer:
+        for rows in batches:
+            writer.write_batch(record_batch(rows, columns, schema))
+            yield sink.drain()
+    yield sink.drain()
+
+# format -> (encoder, mimetype, file extension, requires pyarrow)
+EXPORT_FORMATS = {
+    'csv': (csv_chunks, 'text/csv', 'csv', False),
+    'ndjson': (ndjson_chunks, 'application/x-ndjson', 'ndjson', False),
+    'arrow': (arrow_chunks, 'application/vnd.apache.arrow.stream', 'arrow', True),
+    'parquet': (parquet_chunks, 'application/vnd.apache.parquet', 'parquet', True),
+}
+
+def pyarrow_available():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+        return True
+    except ImportError:
+        return False
@@ -0,0 +1,197 @@
+import re
+import threading
+from collections import Counter
+from datetime import date
+
+# Filters compared with = in apply_filters, so a B-tree index prefix can serve them.
+# entity_name/contact_person use substring ILIKE and q uses the search index.
+EQUALITY_FILTERS = ('task_type', 'status', 'priority', 'date', 'due_date')
+
+# Leading columns of indexes that serve queries the shape recorder never sees;
+# such indexes are not reported as unused
+OTHER_QUERY_COLUMNS = {
+    'status': 'flask archive-tasks (status with completed_at/updated_at)',
+    'date': 'GET /tasks/export?date= (one day per export)',
+}
+
+# Distinct shapes kept per process; later new shapes are counted as dropped
+MAX_SHAPES = 1000
+
+class ShapeRecorder:
+    """Thread-safe tally of the (filters, sort) shapes the task listing actually runs"""
+
+    def __init__(self, max_shapes=MAX_SHAPES):
+        self.max_shapes = max_shapes
+        self.dropped = 0
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, filters, sort_by, sort_order):
+        key = (tuple(sorted(filters or {})), sort_by, sort_order)
+        with self._lock:
+            if key in self._counts or len(self._counts) < self.max_shapes:
+                self._counts[key] += 1
+            else:
+                self.dropped += 1
+
+    def shapes(self):
+        with self._lock:
+            counts = self._counts.most_common()
+        return [{'filters': list(filters), 'sort_by': sort_by, 'sort_order': sort_order, 'count': count}
+                for (filters, sort_by, sort_order), count in counts]
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+            self.dropped = 0
+
+shape_recorder = ShapeRecorder()
+
+def sample_filters(names):
+    """Representative filter values for explaining a shape"""
+    from models.task import Task
+    filters = {}
+    for name in names:
+        column = getattr(Task, name, None)
+        enums = getattr(getattr(column, 'type', None), 'enums', None)
+        if enums:
+            filters[name] = enums[0]
+        elif name in ('date', 'due_date'):
+            filters[name] = date.today()
+        else:
+            filters[name] = 'sample'
+    return filters
+
+def explain_shape(shape):
+    """Run EXPLAIN for a listing shape and summarize full scans, filesorts and indexes used"""
+    from models import db
+    from models.task import Task
+
+    stmt = Task.apply_filters(db.select(Task.id), sample_filters(shape['filters']))
+    stmt = Task.apply_sort(stmt, shape['sort_by'], shape['sort_order']).limit(20)
+    connection = db.session.connection()
+    # Sample values are inlined so EXPLAIN sees the statement as it will run
+    compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True})
+
+    summary = {'full_scan': False, 'filesort': False, 'indexes': [], 'plan': []}
+    if connection.dialect.name == 'mysql':
+        for row in connection.exec_driver_sql(f'EXPLAIN {compiled}').mappings():
+            extra = row.get('Extra') or ''
+            summary['plan'].append({'table': row['table'], 'type': row['type'], 'key': row['key'],
+                                    'rows': row['rows'], 'extra': extra})
+            if row['table'] == Task.__tablename__:
+                summary['full_scan'] |= row['type'] == 'ALL'
+                summary['filesort'] |= 'Using filesort' in extra
+                if row['key']:
+                    summary['indexes'].append(row['key'])
+    else:
+        for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}'):
+            detail = row[-1]
+            summary['plan'].append(detail)
+            if re.match(rf'(SCAN|SEARCH) {Task.__tablename__}\b', detail):
+                summary['full_scan'] |= detail.startswith('SCAN') and 'INDEX' not in detail
+                used = re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)
+                if used:
+                    summary['indexes'].append(used.group(1))
+            summary['filesort'] |= 'TEMP B-TREE FOR ORDER BY' in detail
+    return summary
+
+def index_columns(shape, column_rank):
+    """Composite index serving a shape: equality filters, then the sort column"""
+    equality = sorted((name for name in shape['filters'] if name in EQUALITY_FILTERS), key=column_rank)
+    sort = [shape['sort_by']] if shape['sort_by'] not in ('id', 'relevance') else []
+    return equality + [column for column in sort if column not in equality]
+
+def covers(columns, wanted, equality_count):
+    """Whether an index on ``columns`` serves ``wanted`` (equalities in any order, then sort)"""
+    if len(columns) < len(wanted):
+        return False
+    if set(columns[:equality_count]) != set(wanted[:equality_count]):
+        return False
+    return list(columns[equality_count:len(wanted)]) == list(wanted[equality_count:])
+
+def suggest_indexes(shapes, existing):
+    """Pick a small set of composite indexes covering the observed shapes.
+
+    Equality columns are ordered by how often they appear so shapes can
+    share index prefixes; longer shapes are placed first so shorter ones
+    are covered by their prefixes. ``existing`` maps index name to columns.
+    Returns (suggested, unused existing index names).
+    """
+    frequency = Counter()
+    for shape in shapes:
+        frequency.update({name: shape['count'] for name in shape['filters'] if name in EQUALITY_FILTERS})
+    column_rank = lambda name: (-frequency[name], name)
+
+    wanted = []
+    for shape in shapes:
+        columns = index_columns(shape, column_rank)
+        equality_count = len([name for name in shape['filters'] if name in EQUALITY_FILTERS])
+        if columns:
+            wanted.append((columns, equality_count, shape['count']))
+    wanted.sort(key=lambda item: (-len(item[0]), -item[2]))
+
+    suggested = []
+    used = set()
+    for columns, equality_count, count in wanted:
+        serving = [name for name, index in existing.items() if covers(index, columns, equality_count)]
+        if serving:
+            used.update(serving)
+            continue
+        for index in suggested:
+            if covers(index['columns'], columns, equality_count):
+                index['shapes'] += count
+                break
+        else:
+            name = ('idx_task_' + '_'.join(columns))[:64]
+            suggested.append({'name': name, 'columns': columns, 'shapes': count})
+
+    # An index is still potentially useful if any shape (or other query) starts with its first column
+    leading = {columns[0] for columns, _, _ in wanted} | set(OTHER_QUERY_COLUMNS)
+    unused = sorted(name for name, columns in existing.items()
+                    if name not in used and columns and columns[0] not in leading)
+    return suggested, unused
+
+def existing_indexes():
+    """Secondary B-tree indexes on the tasks table in the connected database"""
+    from sqlalchemy import inspect
+    from models import db
+    from models.task import Task
+    indexes = {}
+    for index in inspect(db.engine).get_indexes(Task.__tablename__):
+        if index.get('dialect_options', {}).get('mysql_prefix') == 'FULLTEXT':
+            continue
+        indexes[index['name']] = list(index['column_names'])
+    return indexes
+
+def drop_index_sql(name, dialect_name):
+    """DROP INDEX statement for a tasks index; SQLite index names are schema-wide"""
+    if dialect_name == 'mysql':
+        return f'DROP INDEX {name} ON tasks;'
+    return f'DROP INDEX {name};'
+
+def migration_sql(suggested, unused=(), include_drops=False, dialect_name='mysql'):
+    """SQL creating the suggested indexes (and optionally dropping unused ones)"""
+    lines = [f'-- Generated by flask advise-indexes on {date.today().isoformat()}']
+    for index in suggested:
+        lines.append(f"CREATE INDEX {index['name']} ON tasks ({', '.join(index['columns'])});")
+    for name in unused:
+        statement = drop_index_sql(name, dialect_name)
+        lines.append(statement if include_drops else f'-- {statement}  (no observed listing shape uses it)')
+    return '\n'.join(lines) + '\n'
+
+def advise(shapes, include_drops=False):
+    """Explain every shape and build the index report"""
+    from models import db
+    existing = existing_indexes()
+    report = []
+    for shape in shapes:
+        report.append(dict(shape, plan=explain_shape(shape)))
+    suggested, unused = suggest_indexes(shapes, existing)
+    return {
+        'shapes': report,
+        'existing_indexes': existing,
+        'suggested_indexes': suggested,
+        'unused_indexes': unused,
+        'migration': migration_sql(suggested, unused, include_drops, db.engine.dialect.name)
+    }
\ No newline at end of file
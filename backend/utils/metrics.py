@@ -0,0 +1,290 @@
+import logging
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from flask import Response, g, request
+from sqlalchemy import event, exc
+from sqlalchemy.pool import Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+CONNECTION_HOLD_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+
+class _Shard:
+    """Counters and histograms written by a single thread"""
+
+    def __init__(self, thread=None):
+        self.counters = {}
+        self.histograms = {}
+        self.thread = weakref.ref(thread) if thread is not None else None
+
+    def finished(self):
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+    def merge(self, other):
+        """Add another shard's values to this one"""
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, (counts, total) in list(other.histograms.items()):
+            merged = self.histograms.setdefault(key, [[0] * len(counts), 0.0])
+            merged[0] = [a + b for a, b in zip(merged[0], counts)]
+            merged[1] += total
+
+class MetricsRegistry:
+    """Counters and histograms sharded per thread, so recording never takes a lock.
+
+    Each thread only writes its own shard; a scrape sums every shard. The
+    lock is only taken once per thread, to register its shard, and by
+    scrapes. Shards of finished threads are folded into a retired total
+    then, so short-lived threads (one per request on the dev server) do not
+    accumulate. Metrics are per process: under gunicorn each worker reports
+    its own series.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+        self._register_lock = threading.Lock()
+        self._buckets = {}
+        self._help = {}
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._register_lock:
+                self._retire_finished()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_finished(self):
+        """Fold the shards of finished threads into the retired total; call with the lock held"""
+        live = []
+        for shard in self._shards:
+            if shard.finished():
+                # A finished thread can no longer write to its shard
+                self._retired.merge(shard)
+            else:
+                live.append(shard)
+        self._shards = live
+
+    def describe(self, name, kind, help_text, buckets=None):
+        self._help[name] = (kind, help_text)
+        if buckets is not None:
+            self._buckets[name] = buckets
+
+    def inc(self, name, labels=(), amount=1):
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        buckets = self._buckets[name]
+        histograms = self._shard().histograms
+        key = (name, labels)
+        entry = histograms.get(key)
+        if entry is None:
+            entry = histograms[key] = [[0] * (len(buckets) + 1), 0.0]
+        entry[0][bisect_left(buckets, value)] += 1
+        entry[1] += value
+
+    def collect(self):
+        """Sum all shards into ({(name, labels): value}, {(name, labels): (counts, sum)})"""
+        total = _Shard()
+        with self._register_lock:
+            self._retire_finished()
+            total.merge(self._retired)
+            shards = list(self._shards)
+        for shard in shards:
+            total.merge(shard)
+        return total.counters, total.histograms
+
+    def render(self, gauges=()):
+        """Prometheus text exposition of all metrics plus ``gauges`` [(name, labels, value)]"""
+        counters, histograms = self.collect()
+        lines = []
+        described = set()
+
+        def header(name, default_kind):
+            if name not in described:
+                described.add(name)
+                kind, help_text = self._help.get(name, (default_kind, name))
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+
+        for (name, labels), value in sorted(counters.items()):
+            header(name, 'counter')
+            lines.append(f'{name}{format_labels(labels)} {value}')
+        for (name, labels), (counts, total) in sorted(histograms.items()):
+            header(name, 'histogram')
+            cumulative = 0
+            for bound, count in zip(self._buckets[name] + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{format_labels(labels + (("le", le),))} {cumulative}')
+            lines.append(f'{name}_sum{format_labels(labels)} {total}')
+            lines.append(f'{name}_count{format_labels(labels)} {cumulative}')
+        for name, labels, value in gauges:
+            header(name, 'gauge')
+            lines.append(f'{name}{format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
+
+metrics = MetricsRegistry()
+metrics.describe('http_requests_total', 'counter', 'Requests handled, by route, method and status')
+metrics.describe('http_requests_started_total', 'counter', 'Requests started')
+metrics.describe('http_request_duration_seconds', 'histogram', 'Request latency by route and method',
+                 REQUEST_BUCKETS)
+metrics.describe('http_requests_in_flight', 'gauge', 'Requests currently being handled')
+metrics.describe('db_pool_wait_seconds', 'histogram', 'Time spent waiting to check out a pooled connection',
+                 POOL_WAIT_BUCKETS)
+metrics.describe('http_requests_finished_total', 'counter', 'Requests finished')
+metrics.describe('cache_hits_total', 'counter', 'Cache lookups that found an entry')
+metrics.describe('cache_misses_total', 'counter', 'Cache lookups that found nothing')
+metrics.describe('cache_evictions_total', 'counter', 'Entries evicted to respect the size bound')
+metrics.describe('cache_hit_ratio', 'gauge', 'Hits / lookups since process start')
+metrics.describe('db_pool_size', 'gauge', 'Configured pool size')
+metrics.describe('db_pool_checked_out', 'gauge', 'Connections currently checked out')
+metrics.describe('db_pool_checked_in', 'gauge', 'Idle connections in the pool')
+metrics.describe('db_pool_overflow', 'gauge', 'Overflow connections beyond pool_size (negative while the pool fills)')
+metrics.describe('db_pool_timeouts_total', 'counter', 'Checkouts that gave up after pool_timeout')
+metrics.describe('db_connection_hold_seconds', 'histogram', 'Time a connection stayed checked out',
+                 CONNECTION_HOLD_BUCKETS)
+metrics.describe('db_connections_opened_total', 'counter', 'New DBAPI connections opened')
+metrics.describe('db_connections_invalidated_total', 'counter', 'Pooled connections invalidated')
+metrics.describe('task_rows_returned_total', 'counter', 'Task rows read from the database into responses')
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection.
+
+    Pool events only fire once a connection has been handed out, so the
+    wait itself is timed around the queue get.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.inc('db_pool_timeouts_total')
+            raise
+        finally:
+            metrics.observe('db_pool_wait_seconds', time.perf_counter() - started)
+
+@event.listens_for(Pool, 'connect')
+def _count_connect(dbapi_connection, connection_record):
+    metrics.inc('db_connections_opened_total')
+
+@event.listens_for(Pool, 'checkout')
+def _start_hold(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info['checked_out_at'] = time.perf_counter()
+
+@event.listens_for(Pool, 'checkin')
+def _finish_hold(dbapi_connection, connection_record):
+    started = connection_record.info.pop('checked_out_at', None)
+    if started is not None:
+        metrics.observe('db_connection_hold_seconds', time.perf_counter() - started)
+
+@event.listens_for(Pool, 'invalidate')
+def _count_invalidate(dbapi_connection, connection_record, exception):
+    metrics.inc('db_connections_invalidated_total')
+
+def current_route():
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+def record_rows(count, route=None):
+    """Count task rows returned by the current route"""
+    metrics.inc('task_rows_returned_total', (('route', route or current_route()),), count)
+
+def request_started():
+    """Count a request as in flight; returns its start time for request_finished"""
+    metrics.inc('http_requests_started_total')
+    return time.perf_counter()
+
+def request_finished(started, route, method, status=None):
+    """Record a request's duration (and its status once a response exists)"""
+    if status is not None:
+        metrics.inc('http_requests_total', (('route', route), ('method', method), ('status', str(status))))
+    metrics.observe('http_request_duration_seconds', time.perf_counter() - started,
+                    (('route', route), ('method', method)))
+    metrics.inc('http_requests_finished_total')
+
+def request_handed_off():
+    """Undo request_started for a request passed on to a handler that counts it itself"""
+    metrics.inc('http_requests_started_total', amount=-1)
+
+def pool_gauges(engine):
+    pool = engine.pool
+    gauges = []
+    for name, attribute in (('db_pool_size', 'size'), ('db_pool_checked_out', 'checkedout'),
+                            ('db_pool_checked_in', 'checkedin'), ('db_pool_overflow', 'overflow')):
+        if hasattr(pool, attribute):
+            gauges.append((name, (), getattr(pool, attribute)()))
+    return gauges
+
+def cache_gauges(cache_stats):
+    labels = (('cache', 'task_list'), ('backend', cache_stats['backend']))
+    gauges = [(f'cache_{key}_total', labels, cache_stats[key])
+              for key in ('hits', 'misses', 'evictions') if key in cache_stats]
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    gauges.append(('cache_hit_ratio', labels, round(cache_stats['hits'] / lookups, 4) if lookups else 0))
+    return gauges
+
+def configure_pool(app):
+    """Use the instrumented pool unless the configuration picks a pool class itself"""
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    if app.config['METRICS_ENABLED'] and 'poolclass' not in options and 'pool_size' in options:
+        options['poolclass'] = InstrumentedQueuePool
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+    if 'pool_size' in options:
+        capacity = options['pool_size'] + options.get('max_overflow', 0)
+        logger.info(f"DB pool: pool_size={options['pool_size']} max_overflow={options.get('max_overflow', 0)} "
+                    f"pool_timeout={options.get('pool_timeout', 30)}")
+        threads = app.config.get('GUNICORN_THREADS')
+        if threads and threads > capacity:
+            logger.warning(f"{threads} threads share {capacity} connections per worker; "
+                           f"raise DB_MAX_CONNECTIONS or lower WEB_CONCURRENCY")
+
+def init_metrics(app):
+    """Record per-route request metrics and serve them at /metrics"""
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = request_started()
+
+    @app.after_request
+    def count_request(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def finish_request_metrics(exc):
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            request_finished(started, current_route(), request.method, g.pop('metrics_status', None))
+
+    def metrics_view():
+        from models import db
+        from utils.cache import get_task_list_cache
+        counters, _ = metrics.collect()
+        in_flight = counters.get(('http_requests_started_total', ()), 0) - \
+            counters.get(('http_requests_finished_total', ()), 0)
+        gauges = [('http_requests_in_flight', (), in_flight)]
+        gauges += pool_gauges(db.engine)
+        gauges += cache_gauges(get_task_list_cache().stats())
+        return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
\ No newline at end of file
@@ -0,0 +1,96 @@
+import base64
+import json
+from collections import namedtuple
+from datetime import date, datetime
+
+CursorPage = namedtuple('CursorPage', ['items', 'per_page', 'has_next', 'next_cursor', 'total'])
+OffsetPage = namedtuple('OffsetPage', ['items', 'page', 'per_page', 'has_next', 'total'])
+
+def offset_pagination(page, per_page, total, has_next=None):
+    """Pagination metadata matching what Flask-SQLAlchemy's paginate() reports.
+    
+    ``total`` may be None when it was not counted; ``pages`` is then None
+    too and ``has_next`` must be given.
+    """
+    if total is None:
+        pages = None
+    else:
+        pages = (total + per_page - 1) // per_page if per_page else 0
+    if has_next is None:
+        has_next = page < pages
+    has_prev = page > 1
+    return {
+        'page': page,
+        'pages': pages,
+        'per_page': per_page,
+        'total': total,
+        'has_next': has_next,
+        'has_prev': has_prev,
+        'next_num': page + 1 if has_next else None,
+        'prev_num': page - 1 if has_prev else None
+    }
+
+def encode_cursor(sort_by, sort_order, value, task_id):
+    """Encode the sort key of the last row on a page into an opaque token"""
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    payload = json.dumps({'s': sort_by, 'o': sort_order.lower(), 'v': value, 'id': task_id},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token, sort_by, sort_order, column):
+    """Decode a cursor token into (sort value, id), raising ValueError if invalid"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        value, task_id = payload['v'], int(payload['id'])
+        cursor_sort, cursor_order = payload['s'], payload['o']
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError('Invalid cursor')
+
+    # A cursor is only meaningful for the ordering it was issued for
+    if cursor_sort != sort_by or cursor_order != sort_order.lower():
+        raise ValueError('Cursor does not match the requested sort')
+
+    if value is not None:
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif python_type is int:
+                value = int(value)
+            else:
+                value = str(value)
+        except (ValueError, TypeError):
+            raise ValueError('Invalid cursor')
+
+        enums = getattr(column.type, 'enums', None)
+        if enums and value not in enums:
+            raise ValueError('Invalid cursor')
+
+    return value, task_id
+
+def encode_sync_token(cursor):
+    """Encode a SyncCursor into an opaque token"""
+    scan_id, change_id, change_time = cursor
+    payload = json.dumps({'s': scan_id, 'c': change_id, 't': change_time.isoformat()}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_sync_token(token):
+    """Decode a sync token into (scan id, change id, change time), raising ValueError if invalid"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        scan_id = int(payload['s']) if payload['s'] is not None else None
+        return scan_id, int(payload['c']), datetime.fromisoformat(payload['t'])
+    except (ValueError, TypeError, KeyError, UnicodeError):
+        raise ValueError('Invalid sync token')
+
+def enum_sort_order(enum_type, dialect_name):
+    """Return enum values in the order the database sorts them"""
+    if dialect_name == 'mysql':
+        # MySQL sorts ENUM columns by declaration index
+        return list(enum_type.enums)
+    return sorted(enum_type.enums)
@@ -0,0 +1,126 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger('slow_queries')
+
+# Bound parameters and statements are truncated in the slow-query log (bulk executemany
+# parameters and multi-row INSERT statements can be huge)
+MAX_LOGGED_PARAMS = 2000
+MAX_LOGGED_STATEMENT = 2000
+
+# Profile of the request being served by the ASGI read routes (asgi.py)
+_async_profile = ContextVar('request_profile', default=None)
+
+def current_profile():
+    """Counters for the current request, or None outside a profiled request"""
+    if has_request_context():
+        return g.get('request_profile')
+    return _async_profile.get()
+
+def new_profile(endpoint, method, path, slow_query_ms):
+    return {
+        'endpoint': endpoint,
+        'method': method,
+        'path': path,
+        'queries': 0,
+        'db_time': 0.0,
+        'serialize_time': 0.0,
+        'started': time.perf_counter(),
+        'slow_query_ms': slow_query_ms,
+    }
+
+@contextmanager
+def async_request_profile(profile):
+    """Attribute the statements run in this block to ``profile`` (ASGI requests)"""
+    token = _async_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _async_profile.reset(token)
+
+def finish_profile(profile, status):
+    """Log the request's timings and return its Server-Timing header values"""
+    total_ms = (time.perf_counter() - profile['started']) * 1000
+    db_ms = profile['db_time'] * 1000
+    serialize_ms = profile['serialize_time'] * 1000
+    logger.info(
+        f"request method={profile['method']} path={profile['path']} route={profile['endpoint']} "
+        f"status={status} queries={profile['queries']} db_ms={db_ms:.1f} "
+        f"serialize_ms={serialize_ms:.1f} total_ms={total_ms:.1f}"
+    )
+    return [
+        f'db;dur={db_ms:.1f};desc="{profile["queries"]} queries"',
+        f'serialize;dur={serialize_ms:.1f}',
+        f'total;dur={total_ms:.1f}',
+    ]
+
+def record_serialization(seconds):
+    profile = current_profile()
+    if profile is not None:
+        profile['serialize_time'] += seconds
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    profile = current_profile()
+    if profile is None:
+        return
+    profile['queries'] += 1
+    profile['db_time'] += elapsed
+
+    if elapsed * 1000 >= profile['slow_query_ms']:
+        slow_query_logger.warning(
+            f"slow query duration_ms={elapsed * 1000:.1f} route={profile['endpoint']} "
+            f"method={profile['method']} path={profile['path']} "
+            f"statement={truncate(' '.join(statement.split()), MAX_LOGGED_STATEMENT)} "
+            f"params={truncate(repr(parameters), MAX_LOGGED_PARAMS)}"
+        )
+
+def truncate(text, limit):
+    return text[:limit] + '...' if len(text) > limit else text
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time so the
+    # pooled connection's stack does not grow with every error
+    connection = exception_context.connection
+    if connection is not None and exception_context.statement is not None and connection.info.get('query_start'):
+        connection.info['query_start'].pop()
+
+def init_profiling(app):
+    """Time SQL and serialization per request; report via Server-Timing and logs"""
+    if not app.config['PROFILING_ENABLED']:
+        return
+
+    if not app.debug and not app.testing and not slow_query_logger.handlers:
+        if not os.path.exists('logs'):
+            os.mkdir('logs')
+        handler = RotatingFileHandler(app.config['SLOW_QUERY_LOG'], maxBytes=1024 * 1024, backupCount=5)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s'))
+        slow_query_logger.addHandler(handler)
+        slow_query_logger.setLevel(logging.WARNING)
+
+    @app.before_request
+    def start_request_profile():
+        g.request_profile = new_profile(request.endpoint, request.method, request.path, app.config['SLOW_QUERY_MS'])
+
+    @app.after_request
+    def report_request_profile(response):
+        profile = g.pop('request_profile', None)
+        if profile is None:
+            return response
+        for value in finish_profile(profile, response.status_code):
+            response.headers.add('Server-Timing', value)
+        return response
\ No newline at end of file
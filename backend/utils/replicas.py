@@ -0,0 +1,140 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Response header (epoch seconds) until which the client that wrote must read from the
+# primary. Clients echo it back on their reads; a header rather than a cookie works for
+# the cross-origin frontend without credentialed CORS.
+STICKY_HEADER = 'X-DB-Primary-Until'
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+class ReplicaRouter:
+    """Round-robin over replica bind keys, skipping replicas that recently failed.
+    
+    A replica whose connection fails is taken out of rotation for
+    ``retry_after`` seconds and then tried again by the next request; the
+    read-only request that hit the failure is run again on the primary.
+    """
+    
+    def __init__(self, keys, retry_after=10):
+        self.keys = list(keys)
+        self.retry_after = retry_after
+        self._cycle = itertools.cycle(self.keys)
+        self._down = {}
+        self._lock = threading.Lock()
+    
+    def choose(self):
+        """Next healthy replica key, or None when every replica is down"""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.keys)):
+                key = next(self._cycle)
+                retry_at = self._down.get(key)
+                if retry_at is None:
+                    return key
+                if retry_at <= now:
+                    del self._down[key]
+                    return key
+        return None
+    
+    def mark_down(self, key):
+        with self._lock:
+            self._down[key] = time.monotonic() + self.retry_after
+        logger.warning(f"Replica {key} failed; using other replicas or the primary for {self.retry_after}s")
+    
+    def status(self):
+        now = time.monotonic()
+        with self._lock:
+            return {key: 'down' if self._down.get(key, 0) > now else 'up' for key in self.keys}
+
+def configure_replica_binds(app):
+    """Register REPLICA_DATABASE_URIS as SQLAlchemy binds; call before db.init_app"""
+    uris = [uri.strip() for uri in app.config.get('REPLICA_DATABASE_URIS', '').split(',') if uri.strip()]
+    binds = {f'replica_{index}': uri for index, uri in enumerate(uris)}
+    if binds:
+        app.config['SQLALCHEMY_BINDS'] = {**app.config.get('SQLALCHEMY_BINDS', {}), **binds}
+    return list(binds)
+
+def init_read_replicas(app, keys):
+    """Route read-only requests across the replica engines; call after db.init_app"""
+    if not keys:
+        return
+    from models import db
+    
+    router = app.extensions['replica_router'] = ReplicaRouter(keys, app.config['REPLICA_RETRY_SECONDS'])
+    with app.app_context():
+        for key in keys:
+            watch_replica(db.engines[key], router, key)
+    logger.info(f"Read replicas enabled: {', '.join(keys)}")
+    
+    @app.after_request
+    def stick_to_primary_after_write(response):
+        # Read-your-own-writes: this client reads from the primary until replicas catch up
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            response.headers[STICKY_HEADER] = str(int(time.time()) + app.config['REPLICA_STICKY_SECONDS'])
+        return response
+
+def watch_replica(engine, router, key):
+    """Take replica ``key`` out of rotation when ``engine`` fails to connect or disconnects"""
+    def handle_error(context):
+        if context.is_disconnect or context.connection is None:
+            router.mark_down(key)
+            if has_request_context():
+                g.db_replica_failed = True
+    event.listen(engine, 'handle_error', handle_error)
+
+def reads_from_primary(headers, window):
+    """Whether request headers carry an unexpired sticky window.
+
+    Values further ahead than ``window`` were not issued by this server and
+    are ignored, so a client cannot pin itself to the primary.
+    """
+    value = headers.get(STICKY_HEADER, '')
+    if not value.isdigit():
+        return False
+    now = time.time()
+    return now < int(value) <= now + window
+
+def read_only(f):
+    """Let a route read from a replica unless the client wrote within the sticky window.
+
+    When the replica fails during the request the route is run once more on
+    the primary; it only reads, so running it twice is safe. Streamed
+    responses that fail after they started are not retried.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'replica_router' not in current_app.extensions:
+            return f(*args, **kwargs)
+        g.db_read_only = not reads_from_primary(request.headers, current_app.config['REPLICA_STICKY_SECONDS'])
+        try:
+            response = f(*args, **kwargs)
+        except Exception:
+            if not g.get('db_replica_failed'):
+                raise
+        if g.pop('db_replica_failed', False):
+            from models import db
+            logger.info(f"Retrying {request.path} on the primary after replica {g.get('db_replica')} failed")
+            db.session.rollback()
+            g.db_replica = False
+            response = f(*args, **kwargs)
+        return response
+    
+    return decorated_function
+
+@contextmanager
+def use_primary():
+    """Send statements in this block to the primary, e.g. a write inside a read-only route"""
+    previous = g.get('db_read_only')
+    g.db_read_only = False
+    try:
+        yield
+    finally:
+        g.db_read_only = previous
\ No newline at end of file
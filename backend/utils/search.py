@@ -0,0 +1,21 @@
+import re
+
+# Fields covered by the search index
+SEARCH_FIELDS = ('entity_name', 'contact_person', 'note')
+
+# InnoDB's default innodb_ft_min_token_size; shorter queries use a substring scan
+MIN_FULLTEXT_QUERY_LENGTH = 3
+
+_WHITESPACE = re.compile(r'\s+')
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]+')
+
+def normalize_search_text(text):
+    """Lowercase and collapse whitespace so every word is matched the same way"""
+    if not text:
+        return ''
+    return _WHITESPACE.sub(' ', text.lower()).strip()
+
+def boolean_mode_query(query):
+    """Build a MySQL BOOLEAN MODE expression requiring every word as a prefix"""
+    words = _BOOLEAN_OPERATORS.sub(' ', query).split()
+    return ' '.join(f'+{word}*' for word in words)
@@ -0,0 +1,57 @@
+import json
+import time
+from datetime import date, datetime
+from flask import Response, current_app
+from utils.profiling import record_serialization
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def stdlib_dumps(payload):
+    return json.dumps(payload, default=_default, separators=(',', ':')).encode('utf-8')
+
+def orjson_dumps(payload):
+    # orjson writes date/datetime natively in ISO 8601, matching isoformat()
+    return orjson.dumps(payload, default=_default)
+
+SERIALIZERS = {
+    'stdlib': stdlib_dumps,
+}
+if orjson is not None:
+    SERIALIZERS['orjson'] = orjson_dumps
+
+def get_dumps(name=None):
+    """Return the configured bytes encoder ('auto' prefers orjson when installed)"""
+    name = name or current_app.config.get('JSON_SERIALIZER', 'auto')
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'stdlib'
+    return SERIALIZERS.get(name, stdlib_dumps)
+
+def rows_to_dicts(rows, keys=None):
+    """Turn Core rows into dicts using one precomputed key layout for the batch"""
+    if not rows:
+        return []
+    keys = keys or tuple(rows[0]._fields)
+    return [dict(zip(keys, row)) for row in rows]
+
+def encode_json(payload):
+    """Encode a payload with the configured serializer, timing it for Server-Timing"""
+    started = time.perf_counter()
+    body = get_dumps()(payload)
+    record_serialization(time.perf_counter() - started)
+    return body
+
+def json_response(payload, status=200, headers=None):
+    """Encode a payload straight to bytes with the configured serializer"""
+    return json_body_response(encode_json(payload), status, headers)
+
+def json_body_response(body, status=200, headers=None):
+    """Respond with an already encoded JSON body"""
+    return Response(body, status=status, headers=headers, mimetype='application/json')
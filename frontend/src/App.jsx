@@ -1,6 +1,6 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
 import TaskList from "./components/TaskList"
 import NewTaskModal from "./components/NewTaskModal"
 import Navbar from "./components/Navbar"
@@ -9,6 +9,29 @@ import { Plus, Search } from "lucide-react"
 // const API_BASE_URL = "http://localhost:5000/api"
 const API_BASE_URL = "https://finstack-assignment-waws.onrender.com/api"
 
+// Sent by the API after a write: until this time (epoch seconds) our reads must go to the
+// primary database, so echo it back instead of reading a replica that may lag behind
+const PRIMARY_UNTIL_HEADER = "X-DB-Primary-Until"
+
+// How long the first fetch waits for the change feed to report its position
+const FEED_READY_TIMEOUT_MS = 2000
+
+// Apply change feed events (see GET /api/tasks/changes) to a task list. Inserts carry
+// the full task; the list is filtered and sorted client-side, so it can go anywhere.
+const applyChanges = (tasks, changes) =>
+  changes.reduce((list, change) => {
+    if (change.op === "delete") {
+      return list.filter((task) => task.id !== change.task_id)
+    }
+    if (change.op === "update") {
+      return list.map((task) => (task.id === change.task_id ? { ...task, ...change.data } : task))
+    }
+    if (change.op === "insert") {
+      return [change.data, ...list.filter((task) => task.id !== change.task_id)]
+    }
+    return list
+  }, tasks)
+
 function App() {
   const [tasks, setTasks] = useState([])
   const [isModalOpen, setIsModalOpen] = useState(false)
@@ -24,18 +47,88 @@ function App() {
     direction: "desc",
   })
 
+  // Changes received while a full fetch is in flight, applied on top of its result
+  const pendingChanges = useRef(null)
+  // Set when another fetch is requested while one is in flight
+  const refetchQueued = useRef(false)
+  const changeFeed = useRef(null)
+  const primaryUntil = useRef(null)
+
   useEffect(() => {
-    fetchTasks()
+    // Writes from this and every other tab arrive as incremental changes; the browser
+    // reconnects on its own and resumes from the last event id
+    const changes = new EventSource(`${API_BASE_URL}/tasks/changes`)
+    changeFeed.current = changes
+
+    // The first fetch starts once the feed is live, so every write after its snapshot
+    // arrives as an event. The list still loads if the feed is unavailable (server at
+    // its stream limit, a buffering proxy, CORS).
+    let loaded = false
+    const load = () => {
+      if (!loaded) {
+        loaded = true
+        clearTimeout(readyTimeout)
+        fetchTasks()
+      }
+    }
+    const readyTimeout = setTimeout(load, FEED_READY_TIMEOUT_MS)
+    changes.addEventListener("ready", load)
+    changes.addEventListener("reset", () => fetchTasks())
+    changes.addEventListener("change", (event) => {
+      const change = JSON.parse(event.data)
+      if (pendingChanges.current) {
+        pendingChanges.current.push(change)
+      } else {
+        setTasks((current) => applyChanges(current, [change]))
+      }
+    })
+    changes.onerror = () => {
+      if (loaded) {
+        // Changes may have been missed while the stream was down
+        fetchTasks()
+      } else {
+        load()
+      }
+    }
+    return () => {
+      clearTimeout(readyTimeout)
+      changes.close()
+    }
   }, [])
 
   const fetchTasks = async () => {
+    if (pendingChanges.current) {
+      refetchQueued.current = true
+      return
+    }
+    pendingChanges.current = []
     try {
-      const response = await fetch(`${API_BASE_URL}/tasks`)
+      const headers = primaryUntil.current && Date.now() / 1000 < primaryUntil.current
+        ? { [PRIMARY_UNTIL_HEADER]: String(primaryUntil.current) }
+        : {}
+      const response = await fetch(`${API_BASE_URL}/tasks`, { headers })
       const data = await response.json()
       // Handle both direct array and paginated response
-      setTasks(data.tasks || data)
+      setTasks(applyChanges(data.tasks || data, pendingChanges.current))
     } catch (error) {
       console.error("Error fetching tasks:", error)
+    } finally {
+      pendingChanges.current = null
+      if (refetchQueued.current) {
+        refetchQueued.current = false
+        fetchTasks()
+      }
+    }
+  }
+
+  // Our own writes normally come back through the change feed; without it, refetch
+  const refreshAfterWrite = (response) => {
+    const until = Number(response.headers.get(PRIMARY_UNTIL_HEADER))
+    if (until) {
+      primaryUntil.current = until
+    }
+    if (changeFeed.current?.readyState !== EventSource.OPEN) {
+      fetchTasks()
     }
   }
 
@@ -50,8 +143,8 @@ function App() {
       })
 
       if (response.ok) {
-        fetchTasks()
         setIsModalOpen(false)
+        refreshAfterWrite(response)
       }
     } catch (error) {
       console.error("Error creating task:", error)
@@ -68,8 +161,11 @@ function App() {
         body: JSON.stringify(updates),
       })
 
-      if (response.ok) {
-        fetchTasks()
+      // The change feed delivers the update to every open tab, this one included
+      if (!response.ok) {
+        console.error("Failed to update task")
+      } else {
+        refreshAfterWrite(response)
       }
     } catch (error) {
       console.error("Error updating task:", error)
@@ -82,8 +178,10 @@ function App() {
         method: "DELETE",
       })
 
-      if (response.ok) {
-        fetchTasks()
+      if (!response.ok) {
+        console.error("Failed to delete task")
+      } else {
+        refreshAfterWrite(response)
       }
     } catch (error) {
       console.error("Error deleting task:", error)
@@ -112,10 +210,10 @@ function App() {
         body: JSON.stringify(duplicatedTask),
       })
 
-      if (response.ok) {
-        fetchTasks()
-      } else {
+      if (!response.ok) {
         console.error("Failed to duplicate task")
+      } else {
+        refreshAfterWrite(response)
       }
     } catch (error) {
       console.error("Error duplicating task:", error)